@@ -0,0 +1,14 @@
+"""
+generic utilities to manipulate data through any DCC
+"""
+
+# imports local
+import cgp_generic_utils.python
+
+
+# register subpackages - imported on first access
+cgp_generic_utils.python.lazyModule(__name__, {'constants': ['constants'],
+                                               'decorators': ['decorators'],
+                                               'files': ['files'],
+                                               'maths': ['maths'],
+                                               'qt': ['qt']})
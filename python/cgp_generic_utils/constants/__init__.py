@@ -3,15 +3,21 @@ constants used to manipulate generic data through any DCC
 """
 
 # imports local
-from ._axe import Axis, AxisTable
-from ._files import FileExtension, FileFilter, PathType
-from ._mirror import MirrorPlane, MirrorMode
-from ._misc import LogType, Orientation, TransformMode, Environment
-from ._naming import Side, TypoStyle
+import cgp_generic_utils.python
 
 
 __all__ = ['Axis', 'AxisTable',
-           'FileExtension', 'FileFilter', 'PathType',
+           'ArchiveCompression', 'ArchiveFormat', 'FileExtension', 'FileFilter', 'PathType',
            'MirrorPlane', 'MirrorMode',
-           'LogType', 'Orientation', 'TransformMode', 'Environment',
+           'LogType', 'Orientation', 'TransformMode', 'Environment', 'ImportBudget',
            'Side', 'TypoStyle']
+
+
+# register submodules - imported on first access
+cgp_generic_utils.python.lazyModule(__name__, {'_axe': ['Axis', 'AxisTable'],
+                                               '_files': ['ArchiveCompression', 'ArchiveFormat', 'FileExtension',
+                                                          'FileFilter', 'PathType'],
+                                               '_mirror': ['MirrorPlane', 'MirrorMode'],
+                                               '_misc': ['LogType', 'Orientation', 'TransformMode', 'Environment',
+                                                         'ImportBudget'],
+                                               '_naming': ['Side', 'TypoStyle']})
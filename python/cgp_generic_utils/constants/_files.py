@@ -3,6 +3,23 @@ Constants used to manipulate file data
 """
 
 
+class ArchiveCompression(object):
+
+    BZ2 = 'bz2'
+    DEFLATE = 'deflate'
+    GZ = 'gz'
+    ALL = [BZ2, DEFLATE, GZ]
+
+
+class ArchiveFormat(object):
+
+    TAR = 'tar'
+    ZIP = 'zip'
+    ALL = [TAR, ZIP]
+    COMPRESSIONS = {TAR: [None, ArchiveCompression.GZ, ArchiveCompression.BZ2],
+                    ZIP: [None, ArchiveCompression.DEFLATE]}
+
+
 class FileExtension(object):
 
     JSON = 'json'
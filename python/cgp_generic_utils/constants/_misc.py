@@ -34,3 +34,20 @@ class TransformMode(object):
     RELATIVE = 'relative'
     ABSOLUTE = 'absolute'
     ALL = [RELATIVE, ABSOLUTE]
+
+
+class ImportBudget(object):
+
+    CONSTANTS = 0.01
+    DECORATORS = 0.01
+    FILES = 0.01
+    MATHS = 0.01
+    PYTHON = 0.01
+    QT = 0.01
+    ATTRIBUTE = 0.1
+    ALL = {'cgp_generic_utils.constants': CONSTANTS,
+           'cgp_generic_utils.decorators': DECORATORS,
+           'cgp_generic_utils.files': FILES,
+           'cgp_generic_utils.maths': MATHS,
+           'cgp_generic_utils.python': PYTHON,
+           'cgp_generic_utils.qt': QT}
@@ -3,11 +3,15 @@ generic python decorators - also usable as contexts
 """
 
 # imports local
-from ._abstract import Decorator
-from ._performance import Timer, Profiler
-from ._qt import StatusDialog
+import cgp_generic_utils.python
 
 
 __all__ = ['Decorator',
            'Timer', 'Profiler',
            'StatusDialog']
+
+
+# register submodules - imported on first access, so the qt decorators only import qt when used
+cgp_generic_utils.python.lazyModule(__name__, {'_abstract': ['Decorator'],
+                                               '_performance': ['Timer', 'Profiler'],
+                                               '_qt': ['StatusDialog']})
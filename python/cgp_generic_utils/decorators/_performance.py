@@ -5,11 +5,10 @@ performance decorator library
 # imports python
 import cProfile
 import pstats
-import StringIO
 import sys
-import time
 
 # imports local
+import cgp_generic_utils.python._compat
 from . import _abstract
 
 
@@ -18,6 +17,8 @@ from . import _abstract
 
 class Timer(_abstract.Decorator):
     """decorator returning the execution time of the encapsulated script block / function
+
+    the time is measured with ``time.perf_counter`` when available, whose resolution is finer than ``time.time``
     """
 
     def __init__(self, label=None):
@@ -36,17 +37,17 @@ class Timer(_abstract.Decorator):
         """
 
         # execute
-        self._initialTime = time.time()
+        self._initialTime = cgp_generic_utils.python._compat.perfCounter()
 
     def __exit__(self, *args, **kwargs):
         """exit Timer decorator
         """
 
         # execute
-        finalTime = time.time() - self._initialTime
+        finalTime = cgp_generic_utils.python._compat.perfCounter() - self._initialTime
 
         # return
-        print '{0} : {1} seconds'.format(self._label or 'Timer', finalTime)
+        sys.stdout.write('{0} : {1} seconds\n'.format(self._label or 'Timer', finalTime))
 
 
 class Profiler(_abstract.Decorator):
@@ -77,7 +78,7 @@ class Profiler(_abstract.Decorator):
         """
 
         # init
-        stream = StringIO.StringIO()
+        stream = cgp_generic_utils.python._compat.StringIO()
 
         # execute
         self.profiler.disable()
@@ -3,26 +3,55 @@ file objects and management functions
 """
 
 # imports local
-from ._generic import File, Path, Directory
-from ._misc import TxtFile, UiFile
-from ._python import JsonFile, PklFile, PyFile
-from ._api import createFile, createDirectory, entity, registerFileTypes
-
-
-# register files
-fileTypes = {'txt': TxtFile,
-             'ui': UiFile,
-             'path': Path,
-             'file': File,
-             'directory': Directory,
-             'pkl': PklFile,
-             'py': PyFile,
-             'json': JsonFile}
-
-registerFileTypes(fileTypes)
+import cgp_generic_utils.python
 
 
 __all__ = ['File', 'Path', 'Directory',
-           'TxtFile', 'UiFile',
+           'TxtFile', 'UiFile', 'compileUiFiles',
            'JsonFile', 'PklFile', 'PyFile',
-           'createFile', 'createDirectory', 'entity', 'registerFileTypes']
+           'ObjFile', 'ObjMesh',
+           'MaFile', 'MbChunk', 'MbFile', 'scanMaFiles',
+           'PathTemplate', 'FileSequence', 'collapseSequences',
+           'FileTypeCache', 'detectFileType', 'detectFileTypes', 'invalidateFileTypeCache',
+           'VersionIndexCache', 'invalidateVersionIndexCache',
+           'SceneDependencyCache', 'invalidateSceneDependencyCache', 'sceneDependencies',
+           'createFile', 'createDirectory', 'entity', 'registerFileTypes',
+           'LocalBackend', 'MemoryBackend', 'StorageBackend',
+           'mountStorageBackend', 'setStorageBackend', 'storageBackend',
+           'CodeCache', 'invalidateCodeCache', 'setCodeCacheDirectory',
+           'SymbolIndex', 'PathTrie', 'PathArray',
+           'DiskUsageCache', 'diskUsage', 'invalidateDiskUsageCache',
+           'search', 'moveEntities', 'extractArchive', 'FileLock',
+           'ZipBackend', 'ZipDirectory',
+           'UiFormCache', 'invalidateUiFormCache', 'setUiFormCacheDirectory']
+
+
+# register submodules - imported on first access, the file types are registered by _api when first needed
+cgp_generic_utils.python.lazyModule(__name__, {'_generic': ['File', 'Path', 'Directory'],
+                                               '_misc': ['TxtFile', 'UiFile', 'compileUiFiles'],
+                                               '_python': ['JsonFile', 'PklFile', 'PyFile'],
+                                               '_geometry': ['ObjFile', 'ObjMesh'],
+                                               '_maya': ['MaFile', 'MbChunk', 'MbFile', 'scanMaFiles'],
+                                               '_template': ['PathTemplate'],
+                                               '_sniff': ['FileTypeCache', 'detectFileType', 'detectFileTypes',
+                                                          'invalidateFileTypeCache'],
+                                               '_sequence': ['FileSequence', 'collapseSequences'],
+                                               '_version': ['VersionIndexCache', 'invalidateVersionIndexCache'],
+                                               '_dependency': ['SceneDependencyCache', 'invalidateSceneDependencyCache',
+                                                               'sceneDependencies'],
+                                               '_api': ['createFile', 'createDirectory', 'entity', 'registerFileTypes'],
+                                               '_backend': ['LocalBackend', 'MemoryBackend', 'StorageBackend',
+                                                            'mountStorageBackend', 'setStorageBackend',
+                                                            'storageBackend'],
+                                               '_cache': ['CodeCache', 'invalidateCodeCache', 'setCodeCacheDirectory'],
+                                               '_index': ['SymbolIndex'],
+                                               '_trie': ['PathTrie'],
+                                               '_array': ['PathArray'],
+                                               '_usage': ['DiskUsageCache', 'diskUsage', 'invalidateDiskUsageCache'],
+                                               '_search': ['search'],
+                                               '_transfer': ['moveEntities'],
+                                               '_archive': ['extractArchive'],
+                                               '_lock': ['FileLock'],
+                                               '_zip': ['ZipBackend', 'ZipDirectory'],
+                                               '_uiLoader': ['UiFormCache', 'invalidateUiFormCache',
+                                                             'setUiFormCacheDirectory']})
@@ -3,10 +3,22 @@ file management functions
 """
 
 # imports local
-import cgp_generic_utils.constants
+import cgp_generic_utils.python
+import cgp_generic_utils.files._sniff
 
 
 FILE_TYPES = {}
+_DEFAULT_FILE_TYPES = {'txt': ('_misc', 'TxtFile'),
+                       'ui': ('_misc', 'UiFile'),
+                       'path': ('_generic', 'Path'),
+                       'file': ('_generic', 'File'),
+                       'directory': ('_generic', 'Directory'),
+                       'pkl': ('_python', 'PklFile'),
+                       'py': ('_python', 'PyFile'),
+                       'json': ('_python', 'JsonFile'),
+                       'obj': ('_geometry', 'ObjFile'),
+                       'ma': ('_maya', 'MaFile'),
+                       'mb': ('_maya', 'MbFile')}
 
 
 # COMMANDS #
@@ -22,7 +34,7 @@ def createDirectory(path):
     """
 
     # return
-    return FILE_TYPES['directory'].create(path)
+    return registeredFileTypes()['directory'].create(path)
 
 
 def createFile(path, content=None, **extraData):
@@ -41,19 +53,26 @@ def createFile(path, content=None, **extraData):
     :rtype: :class:`cgp_generic_utils.files.File`
     """
 
+    # init
+    fileTypes = registeredFileTypes()
+
     # get extension
-    extension = FILE_TYPES['path'](path).extension()
+    extension = fileTypes['path'](path).extension()
 
     # return
-    return FILE_TYPES.get(extension, FILE_TYPES['file']).create(path, content=content, **extraData)
+    return fileTypes.get(extension, fileTypes['file']).create(path, content=content, **extraData)
 
 
-def entity(path):
+def entity(path, sniff=False):
     """a file/directory object from a path
 
     :param path: path of the file/directory to get the entity from
     :type path: str
 
+    :param sniff: ``True`` : the type of the file is detected from its content, the extension is used if no
+                  signature matches - ``False`` : the type of the file is get from its extension
+    :type sniff: bool
+
     :return: the file/directory
     :rtype: :class:`cgp_generic_utils.files.Directory`,
             :class:`cgp_generic_utils.files.File`,
@@ -64,21 +83,46 @@ def entity(path):
     """
 
     # init
-    pathObject = FILE_TYPES['path'](path)
+    fileTypes = registeredFileTypes()
+    pathObject = fileTypes['path'](path)
 
     # return if path is directory
     if pathObject.isDirectory():
-        return FILE_TYPES['directory'](path)
+        return fileTypes['directory'](path)
 
     # errors
     if not pathObject.isFile():
         raise ValueError('{0} is not an existing File / directory path'.format(path))
 
-    # get the file extension
-    extension = FILE_TYPES['path'](path).extension()
+    # get the file type from the content
+    fileType = cgp_generic_utils.files._sniff.detectFileType(path) if sniff else None
+
+    # get the file type from the extension
+    if fileType is None:
+        fileType = pathObject.extension()
+
+    # return
+    return fileTypes.get(fileType, fileTypes['file'])(path)
+
+
+def registeredFileTypes():
+    """the registered file types - the default file types are registered on first call, so their modules are only
+    imported when a file management function needs them
+
+    :return: the registered file types - {extension1: FileObject1, extension2: FileObject2 ...}
+    :rtype: dict
+    """
+
+    # register default file types - a type registered before is kept
+    if _DEFAULT_FILE_TYPES:
+        for fileType, (moduleName, objectName) in _DEFAULT_FILE_TYPES.items():
+            module = cgp_generic_utils.python.import_('cgp_generic_utils.files.{0}'.format(moduleName))
+            FILE_TYPES.setdefault(fileType, getattr(module, objectName))
+
+        _DEFAULT_FILE_TYPES.clear()
 
     # return
-    return FILE_TYPES.get(extension, FILE_TYPES['file'])(path)
+    return FILE_TYPES
 
 
 def registerFileTypes(fileTypes):
@@ -89,4 +133,4 @@ def registerFileTypes(fileTypes):
     """
 
     # execute
-    FILE_TYPES.update(fileTypes)
+    registeredFileTypes().update(fileTypes)
@@ -0,0 +1,346 @@
+"""
+archive library - streams directory trees to and from zip/tar archives
+"""
+
+# imports python
+import os
+import zlib
+import struct
+import zipfile
+import tarfile
+import collections
+import multiprocessing
+import multiprocessing.pool
+
+# imports local
+import cgp_generic_utils.constants
+import cgp_generic_utils.files._api
+
+
+# COMMANDS #
+
+
+def archiveDirectory(directory, archivePath=None, archiveFormat=None, compression=None, threads=None):
+    """archive the directory - files are streamed into the archive without staging it in memory
+
+    gz compressed tar archives are compressed on worker threads as a sequence of independent gzip members
+
+    :param directory: directory to archive
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :param archivePath: path of the archive - default is the directory path with the archive extension
+    :type archivePath: str
+
+    :param archiveFormat: format of the archive - ``cgp_generic_utils.constants.ArchiveFormat.ZIP`` is default
+    :type archiveFormat: str
+
+    :param compression: compression of the archive - ``cgp_generic_utils.constants.ArchiveFormat.COMPRESSIONS`` -
+                        default is no compression
+    :type compression: str
+
+    :param threads: count of threads compressing a gz archive - default is the count of cpus
+    :type threads: int
+
+    :return: the archive file
+    :rtype: :class:`cgp_generic_utils.files.File`
+    """
+
+    # init
+    directory = os.path.abspath(str(directory))
+    archiveFormat = archiveFormat or cgp_generic_utils.constants.ArchiveFormat.ZIP
+    compressions = cgp_generic_utils.constants.ArchiveFormat.COMPRESSIONS.get(archiveFormat, [])
+
+    # errors
+    if not os.path.isdir(directory):
+        raise ValueError('{0} is not an existing directory'.format(directory))
+
+    if archiveFormat not in cgp_generic_utils.constants.ArchiveFormat.ALL:
+        raise ValueError('{0} is not an archive format - Expected : {1}'
+                         .format(archiveFormat, cgp_generic_utils.constants.ArchiveFormat.ALL))
+
+    if compression not in compressions:
+        raise ValueError('{0} is not a {1} compression - Expected : {2}'
+                         .format(compression, archiveFormat, compressions))
+
+    # get archive path
+    if not archivePath:
+        extension = ('{0}.{1}'.format(archiveFormat, compression)
+                     if archiveFormat == cgp_generic_utils.constants.ArchiveFormat.TAR and compression
+                     else archiveFormat)
+        archivePath = '{0}.{1}'.format(directory, extension)
+
+    archivePath = os.path.abspath(str(archivePath))
+
+    if archivePath.startswith(os.path.join(directory, '')):
+        raise ValueError('can\'t archive the directory inside itself')
+
+    # execute - the partial archive is removed if the archiving fails
+    try:
+        if archiveFormat == cgp_generic_utils.constants.ArchiveFormat.ZIP:
+            _archiveZip(directory, archivePath, compression)
+        else:
+            _archiveTar(directory, archivePath, compression, threads or multiprocessing.cpu_count())
+
+    except BaseException:
+        if os.path.isfile(archivePath):
+            os.remove(archivePath)
+        raise
+
+    # return
+    return cgp_generic_utils.files._api.entity(archivePath)
+
+
+def extractArchive(archivePath, targetDirectory=None):
+    """extract the zip/tar archive - members are streamed one by one to the target directory
+
+    :param archivePath: path of the archive to extract
+    :type archivePath: str or :class:`cgp_generic_utils.files.File`
+
+    :param targetDirectory: directory the archive is extracted in - default is the directory of the archive
+    :type targetDirectory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :return: the extracted files/directories
+    :rtype: list[:class:`cgp_generic_utils.files.Directory`, :class:`cgp_generic_utils.files.File`]
+    """
+
+    # init
+    archivePath = os.path.abspath(str(archivePath))
+    targetDirectory = os.path.abspath(str(targetDirectory) if targetDirectory else os.path.dirname(archivePath))
+    extractedPaths = []
+
+    # errors
+    if not os.path.isfile(archivePath):
+        raise ValueError('{0} is not an existing archive'.format(archivePath))
+
+    if not os.path.isdir(targetDirectory):
+        raise ValueError('{0} is not a valid directory'.format(targetDirectory))
+
+    # zip
+    if zipfile.is_zipfile(archivePath):
+        with zipfile.ZipFile(archivePath, 'r', allowZip64=True) as archive:
+            for member in archive.infolist():
+                _checkMember(member.filename, targetDirectory)
+                extractedPaths.append(archive.extract(member, targetDirectory))
+
+    # tar - compressed tar archives are decompressed on the fly
+    elif tarfile.is_tarfile(archivePath):
+        archive = tarfile.open(archivePath, 'r:*')
+        # the data filter of tarfile also refuses unsafe members where the interpreter has it
+        extractKwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+        try:
+            for member in archive:
+                _checkMember(member.name, targetDirectory)
+                # the target of a symlink is relative to the link, the target of a hardlink to the archive root
+                if member.issym():
+                    _checkMember(os.path.join(os.path.dirname(member.name), member.linkname), targetDirectory)
+                elif member.islnk():
+                    _checkMember(member.linkname, targetDirectory)
+                archive.extract(member, targetDirectory, **extractKwargs)
+                extractedPaths.append(os.path.join(targetDirectory, member.name))
+        finally:
+            archive.close()
+
+    # errors
+    else:
+        raise ValueError('{0} is not a zip / tar archive'.format(archivePath))
+
+    # return
+    return [cgp_generic_utils.files._api.entity(os.path.normpath(path))
+            for path in extractedPaths if os.path.exists(path)]
+
+
+# PRIVATE OBJECTS #
+
+
+class _ParallelGzipWriter(object):
+    """file-like object compressing the written data on worker threads as independent gzip members
+
+    a sequence of gzip members is a valid gzip stream - zlib releases the GIL so the members compress in parallel,
+    and only a bounded count of blocks is kept in memory
+    """
+
+    # ATTRIBUTES #
+
+    _blockSize = 4 * 1024 * 1024
+
+    # INIT #
+
+    def __init__(self, fileObject, threads):
+        """_ParallelGzipWriter class initialization
+
+        :param fileObject: file object the gzip stream is written to
+        :type fileObject: file
+
+        :param threads: count of threads compressing the blocks
+        :type threads: int
+        """
+
+        # init
+        self._fileObject = fileObject
+        self._threads = threads
+        self._pool = multiprocessing.pool.ThreadPool(threads)
+        self._pending = collections.deque()
+        self._buffer = []
+        self._bufferSize = 0
+
+    # COMMANDS #
+
+    def close(self):
+        """compress the remaining data and wait for the pending blocks
+        """
+
+        # execute
+        try:
+            self._submit()
+
+            while self._pending:
+                self._fileObject.write(self._pending.popleft().get())
+
+        finally:
+            self._pool.close()
+            self._pool.join()
+
+    def write(self, data):
+        """write the data
+
+        :param data: data to write
+        :type data: bytes
+        """
+
+        # execute
+        self._buffer.append(data)
+        self._bufferSize += len(data)
+
+        if self._bufferSize >= self._blockSize:
+            self._submit()
+
+        # write the compressed blocks in order - bounding the count of blocks in memory
+        while self._pending and (self._pending[0].ready() or len(self._pending) > self._threads * 2):
+            self._fileObject.write(self._pending.popleft().get())
+
+    # PRIVATE COMMANDS #
+
+    def _submit(self):
+        """submit the buffered data to the compressing threads
+        """
+
+        # return if nothing buffered
+        if not self._bufferSize:
+            return
+
+        # execute
+        self._pending.append(self._pool.apply_async(_gzipMember, (b''.join(self._buffer),)))
+        self._buffer = []
+        self._bufferSize = 0
+
+
+# PRIVATE COMMANDS #
+
+
+def _archiveTar(directory, archivePath, compression, threads):
+    """archive the directory as a tar archive
+
+    :param directory: directory to archive
+    :type directory: str
+
+    :param archivePath: path of the archive
+    :type archivePath: str
+
+    :param compression: compression of the archive - None, gz or bz2
+    :type compression: str
+
+    :param threads: count of threads compressing a gz archive
+    :type threads: int
+    """
+
+    # init
+    arcName = os.path.basename(directory)
+
+    # gz compressed in parallel
+    if compression == cgp_generic_utils.constants.ArchiveCompression.GZ and threads > 1:
+        with open(archivePath, 'wb') as toWrite:
+            writer = _ParallelGzipWriter(toWrite, threads)
+            try:
+                archive = tarfile.open(fileobj=writer, mode='w|')
+                archive.add(directory, arcname=arcName)
+                archive.close()
+            finally:
+                writer.close()
+
+    # others
+    else:
+        archive = tarfile.open(archivePath, 'w:{0}'.format(compression or ''))
+        try:
+            archive.add(directory, arcname=arcName)
+        finally:
+            archive.close()
+
+
+def _archiveZip(directory, archivePath, compression):
+    """archive the directory as a zip archive
+
+    :param directory: directory to archive
+    :type directory: str
+
+    :param archivePath: path of the archive
+    :type archivePath: str
+
+    :param compression: compression of the archive - None or deflate
+    :type compression: str
+    """
+
+    # init
+    parent = os.path.dirname(directory)
+    compressType = zipfile.ZIP_DEFLATED if compression else zipfile.ZIP_STORED
+
+    # execute
+    with zipfile.ZipFile(archivePath, 'w', compressType, allowZip64=True) as archive:
+        for root, directories, fileNames in os.walk(directory):
+
+            directories.sort()
+            archive.write(root, os.path.relpath(root, parent))
+
+            for fileName in sorted(fileNames):
+                path = os.path.join(root, fileName)
+                archive.write(path, os.path.relpath(path, parent))
+
+
+def _checkMember(name, targetDirectory):
+    """check that the archive member is extracted inside the target directory - the path is resolved against what is
+    already extracted, so a member can't escape through the symlinks extracted before it
+
+    :param name: name of the archive member
+    :type name: str
+
+    :param targetDirectory: directory the archive is extracted in
+    :type targetDirectory: str
+    """
+
+    # init
+    root = os.path.realpath(targetDirectory)
+    path = os.path.realpath(os.path.join(root, name))
+
+    # errors
+    if os.path.isabs(name) or not (path + os.sep).startswith(os.path.join(root, '')):
+        raise ValueError('{0} is extracted outside of {1}'.format(name, targetDirectory))
+
+
+def _gzipMember(data):
+    """compress the data as a gzip member
+
+    :param data: data to compress
+    :type data: bytes
+
+    :return: the gzip member
+    :rtype: bytes
+    """
+
+    # init
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+    # return
+    return b''.join([b'\037\213\010\000\000\000\000\000\000\377',
+                    compressor.compress(data),
+                    compressor.flush(),
+                    struct.pack('<II', zlib.crc32(data) & 0xffffffff, len(data) & 0xffffffff)])
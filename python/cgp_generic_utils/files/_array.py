@@ -0,0 +1,347 @@
+"""
+columnar path container library
+"""
+
+# imports python
+import os
+import re
+import array
+import fnmatch
+
+# imports local
+import cgp_generic_utils.files._api
+
+
+# CONTAINER OBJECTS #
+
+
+class PathArray(object):
+    """container holding many paths in column form to manipulate them in bulk
+
+    paths are split into a table of unique directories, a column of stems and a table of unique extensions referenced
+    by index - bulk operations only process the unique tables and path objects are created on demand only
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('_directories', '_directoryIndices', '_stems', '_extensions', '_extensionIndices')
+
+    # INIT #
+
+    def __init__(self, paths=None):
+        """PathArray class initialization
+
+        :param paths: paths to hold
+        :type paths: list[str] or list[:class:`cgp_generic_utils.files.Path`]
+        """
+
+        # init
+        self._directories = []
+        self._directoryIndices = array.array('l')
+        self._stems = []
+        self._extensions = []
+        self._extensionIndices = array.array('l')
+
+        directoryTable = {}
+        extensionTable = {}
+
+        # execute
+        for path in paths or []:
+            directory, baseName = os.path.split(os.path.abspath(str(path)))
+            stem, extension = os.path.splitext(baseName)
+
+            if directory not in directoryTable:
+                directoryTable[directory] = len(self._directories)
+                self._directories.append(directory)
+
+            if extension not in extensionTable:
+                extensionTable[extension] = len(self._extensions)
+                self._extensions.append(extension[1:])
+
+            self._directoryIndices.append(directoryTable[directory])
+            self._extensionIndices.append(extensionTable[extension])
+            self._stems.append(stem)
+
+    def __getitem__(self, index):
+        """the path object at the index - or a new path array for a slice
+
+        :param index: index or slice of the paths to get
+        :type index: int or slice
+
+        :return: the path object or the sliced path array
+        :rtype: :class:`cgp_generic_utils.files.Path` or :class:`cgp_generic_utils.files.PathArray`
+        """
+
+        # return
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+
+        return cgp_generic_utils.files._api.registeredFileTypes()['path'](self._join(index))
+
+    def __iter__(self):
+        """iterate over the paths
+
+        :return: the paths
+        :rtype: generator[str]
+        """
+
+        # return
+        return iter(self.join())
+
+    def __len__(self):
+        """the count of paths
+
+        :return: the count of paths
+        :rtype: int
+        """
+
+        # return
+        return len(self._stems)
+
+    def __repr__(self):
+        """the representation of the path array
+
+        :return: the representation of the path array
+        :rtype: str
+        """
+
+        # return
+        return '{0}({1} paths)'.format(self.__class__.__name__, len(self))
+
+    # COMMANDS #
+
+    def changeExtension(self, extension, oldExtension=None):
+        """change the extension of the paths
+
+        :param extension: new extension of the paths - without the dot - empty to remove the extension
+        :type extension: str
+
+        :param oldExtension: only the paths with this extension are changed - default is all the paths
+        :type oldExtension: str
+
+        :return: the path array with the changed extensions
+        :rtype: :class:`cgp_generic_utils.files.PathArray`
+        """
+
+        # return
+        return self._copy(extensions=[extension if oldExtension is None or current == oldExtension else current
+                                      for current in self._extensions])
+
+    def changeRoot(self, root, newRoot):
+        """change the root of the paths under the root - the other paths are kept unchanged
+
+        :param root: root to replace
+        :type root: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param newRoot: root to replace with
+        :type newRoot: str or :class:`cgp_generic_utils.files.Directory`
+
+        :return: the path array with the changed roots
+        :rtype: :class:`cgp_generic_utils.files.PathArray`
+        """
+
+        # init
+        root = os.path.abspath(str(root))
+        newRoot = os.path.abspath(str(newRoot))
+        prefix = root if root.endswith(os.sep) else root + os.sep
+
+        # return
+        return self._copy(directories=[newRoot if directory == root
+                                       else os.path.join(newRoot, directory[len(prefix):])
+                                       if directory.startswith(prefix)
+                                       else directory
+                                       for directory in self._directories])
+
+    def directories(self):
+        """the directory of each path
+
+        :return: the directories of the paths
+        :rtype: list[str]
+        """
+
+        # return
+        return [self._directories[index] for index in self._directoryIndices]
+
+    def entities(self):
+        """the file/directory objects of the paths - created on demand
+
+        :return: the file/directory objects of the paths
+        :rtype: generator[:class:`cgp_generic_utils.files.Directory`, :class:`cgp_generic_utils.files.File`]
+        """
+
+        # return
+        return (cgp_generic_utils.files._api.entity(path) for path in self.join())
+
+    def extensions(self):
+        """the extension of each path - without the dot - empty if the path has no extension
+
+        :return: the extensions of the paths
+        :rtype: list[str]
+        """
+
+        # return
+        return [self._extensions[index] for index in self._extensionIndices]
+
+    def filter(self, pattern, baseNameOnly=False):
+        """filter the paths matching the pattern
+
+        :param pattern: fnmatch pattern the paths have to match - ``*.exr`` - ``*/render/*`` ...
+        :type pattern: str
+
+        :param baseNameOnly: ``True`` : the pattern is matched against the baseNames -
+                             ``False`` : the pattern is matched against the full paths
+        :type baseNameOnly: bool
+
+        :return: the path array holding the matching paths
+        :rtype: :class:`cgp_generic_utils.files.PathArray`
+        """
+
+        # init
+        match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+        normcase = os.path.normcase
+        values = self.join() if not baseNameOnly else self._baseNames()
+
+        # return
+        return self.take([index for index, value in enumerate(values) if match(normcase(value))])
+
+    def join(self):
+        """the full path strings
+
+        :return: the paths
+        :rtype: list[str]
+        """
+
+        # init
+        join = os.path.join
+        directories = self._directories
+        extensions = ['.{0}'.format(extension) if extension else '' for extension in self._extensions]
+
+        # return
+        return [join(directories[directoryIndex], stem + extensions[extensionIndex])
+                for directoryIndex, stem, extensionIndex
+                in zip(self._directoryIndices, self._stems, self._extensionIndices)]
+
+    def paths(self):
+        """the path objects of the paths - created on demand
+
+        :return: the path objects of the paths
+        :rtype: generator[:class:`cgp_generic_utils.files.Path`]
+        """
+
+        # init
+        pathObject = cgp_generic_utils.files._api.registeredFileTypes()['path']
+
+        # return
+        return (pathObject(path) for path in self.join())
+
+    def split(self):
+        """split the paths into directories, stems and extensions
+
+        :return: the directories, the stems and the extensions of the paths
+        :rtype: tuple[list[str], list[str], list[str]]
+        """
+
+        # return
+        return self.directories(), self.stems(), self.extensions()
+
+    def stems(self):
+        """the baseName of each path without its last extension
+
+        :return: the stems of the paths
+        :rtype: list[str]
+        """
+
+        # return
+        return list(self._stems)
+
+    def take(self, indices):
+        """the paths at the indices
+
+        :param indices: indices of the paths to take
+        :type indices: list[int]
+
+        :return: the path array holding the taken paths
+        :rtype: :class:`cgp_generic_utils.files.PathArray`
+        """
+
+        # init
+        pathArray = self._copy()
+
+        # execute
+        pathArray._directoryIndices = array.array('l', [self._directoryIndices[index] for index in indices])
+        pathArray._extensionIndices = array.array('l', [self._extensionIndices[index] for index in indices])
+        pathArray._stems = [self._stems[index] for index in indices]
+
+        # return
+        return pathArray
+
+    def toNumpy(self):
+        """the paths as a numpy string array - requires numpy
+
+        :return: the paths
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        # import numpy here as it is an optional dependency
+        import numpy
+
+        # return
+        return numpy.array(self.join())
+
+    # PRIVATE COMMANDS #
+
+    def _baseNames(self):
+        """the baseName of each path
+
+        :return: the baseNames of the paths
+        :rtype: list[str]
+        """
+
+        # init
+        extensions = ['.{0}'.format(extension) if extension else '' for extension in self._extensions]
+
+        # return
+        return [stem + extensions[index] for stem, index in zip(self._stems, self._extensionIndices)]
+
+    def _copy(self, directories=None, extensions=None):
+        """copy the path array - the columns are shared as they are never modified in place
+
+        :param directories: table of directories of the copy - default is the directories of the path array
+        :type directories: list[str]
+
+        :param extensions: table of extensions of the copy - default is the extensions of the path array
+        :type extensions: list[str]
+
+        :return: the copied path array
+        :rtype: :class:`cgp_generic_utils.files.PathArray`
+        """
+
+        # init
+        pathArray = self.__class__()
+
+        # execute
+        pathArray._directories = directories if directories is not None else self._directories
+        pathArray._directoryIndices = self._directoryIndices
+        pathArray._stems = self._stems
+        pathArray._extensions = extensions if extensions is not None else self._extensions
+        pathArray._extensionIndices = self._extensionIndices
+
+        # return
+        return pathArray
+
+    def _join(self, index):
+        """the full path string at the index
+
+        :param index: index of the path
+        :type index: int
+
+        :return: the path
+        :rtype: str
+        """
+
+        # init
+        extension = self._extensions[self._extensionIndices[index]]
+
+        # return
+        return os.path.join(self._directories[self._directoryIndices[index]],
+                            '{0}.{1}'.format(self._stems[index], extension) if extension else self._stems[index])
@@ -0,0 +1,1020 @@
+"""
+storage backend library - the file system operations used by the file and directory objects
+"""
+
+# imports python
+import io
+import os
+import time
+import errno
+import shutil
+import threading
+
+# imports local
+import cgp_generic_utils.python._compat
+import cgp_generic_utils.files._transfer
+
+
+# BACKEND OBJECTS #
+
+
+class StorageBackend(object):
+    """storage the file and directory objects operate on - subclass it to add a new backend
+
+    paths given to the backends are always absolute and normalized
+    """
+
+    # ATTRIBUTES #
+
+    _isLocal = False
+
+    # COMMANDS #
+
+    def copyFile(self, source, destination):
+        """copy the file - the destination file is overwritten
+
+        :param source: path of the file to copy
+        :type source: str
+
+        :param destination: path of the copied file
+        :type destination: str
+        """
+
+        # errors
+        raise NotImplementedError('copyFile is not implemented')
+
+    def exists(self, path):
+        """check if the file/directory exists
+
+        :param path: path of the file/directory
+        :type path: str
+
+        :return: ``True`` : the file/directory exists - ``False`` : the file/directory doesn't exist
+        :rtype: bool
+        """
+
+        # return
+        return self.isFile(path) or self.isDirectory(path)
+
+    def isDirectory(self, path):
+        """check if the path is an existing directory
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a directory - ``False`` : the path is not a directory
+        :rtype: bool
+        """
+
+        # errors
+        raise NotImplementedError('isDirectory is not implemented')
+
+    def isFile(self, path):
+        """check if the path is an existing file
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a file - ``False`` : the path is not a file
+        :rtype: bool
+        """
+
+        # errors
+        raise NotImplementedError('isFile is not implemented')
+
+    def isLocal(self):
+        """check if the backend operates on the local file system - local only features need it
+
+        :return: ``True`` : the backend is the local file system - ``False`` : the backend is not the local file system
+        :rtype: bool
+        """
+
+        # return
+        return self._isLocal
+
+    def isWritable(self, path):
+        """check if the file can be written
+
+        :param path: path of the file
+        :type path: str
+
+        :return: ``True`` : the file is writable - ``False`` : the file is read only
+        :rtype: bool
+        """
+
+        # errors
+        raise NotImplementedError('isWritable is not implemented')
+
+    def listChildren(self, path):
+        """the names of the files and directories of the directory - the children being neither files nor directories,
+        such as broken links, are skipped
+
+        :param path: path of the directory
+        :type path: str
+
+        :return: the name of each child and whether it is a directory - [(name, isDirectory)] - unsorted
+        :rtype: list[tuple[str, bool]]
+        """
+
+        # init
+        children = []
+
+        # execute
+        for name in self.listDirectory(path):
+            childPath = os.path.join(path, name)
+
+            if self.isDirectory(childPath):
+                children.append((name, True))
+            elif self.isFile(childPath):
+                children.append((name, False))
+
+        # return
+        return children
+
+    def listDirectory(self, path):
+        """the names of the children of the directory
+
+        :param path: path of the directory
+        :type path: str
+
+        :return: the names of the children of the directory - unsorted
+        :rtype: list[str]
+        """
+
+        # errors
+        raise NotImplementedError('listDirectory is not implemented')
+
+    def makeDirectories(self, path):
+        """create the directory and its missing parents
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # errors
+        raise NotImplementedError('makeDirectories is not implemented')
+
+    def move(self, source, destination):
+        """move the file/directory - the destination must not exist
+
+        :param source: path of the file/directory to move
+        :type source: str
+
+        :param destination: path the file/directory is moved to
+        :type destination: str
+        """
+
+        # errors
+        raise NotImplementedError('move is not implemented')
+
+    def open(self, path, mode='r'):
+        """open the file - same modes as the builtin open
+
+        :param path: path of the file
+        :type path: str
+
+        :param mode: mode used to open the file
+        :type mode: str
+
+        :return: the file object - usable as a context
+        :rtype: file
+        """
+
+        # errors
+        raise NotImplementedError('open is not implemented')
+
+    def remove(self, path):
+        """remove the file
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        # errors
+        raise NotImplementedError('remove is not implemented')
+
+    def removeDirectory(self, path):
+        """remove the directory and its content
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # errors
+        raise NotImplementedError('removeDirectory is not implemented')
+
+    def stat(self, path):
+        """the modification time and size of the file/directory
+
+        :param path: path of the file/directory
+        :type path: str
+
+        :return: the modification time and the size in bytes - (mtime, size)
+        :rtype: tuple[float, int]
+        """
+
+        # errors
+        raise NotImplementedError('stat is not implemented')
+
+
+class LocalBackend(StorageBackend):
+    """storage backend operating on the local file system - the default backend
+    """
+
+    # ATTRIBUTES #
+
+    _isLocal = True
+
+    # COMMANDS #
+
+    def copyFile(self, source, destination):
+        """copy the file - the destination file is overwritten
+
+        :param source: path of the file to copy
+        :type source: str
+
+        :param destination: path of the copied file
+        :type destination: str
+        """
+
+        # execute
+        shutil.copy(source, destination)
+
+    def exists(self, path):
+        """check if the file/directory exists
+
+        :param path: path of the file/directory
+        :type path: str
+
+        :return: ``True`` : the file/directory exists - ``False`` : the file/directory doesn't exist
+        :rtype: bool
+        """
+
+        # return
+        return os.path.exists(path)
+
+    def isDirectory(self, path):
+        """check if the path is an existing directory
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a directory - ``False`` : the path is not a directory
+        :rtype: bool
+        """
+
+        # return
+        return os.path.isdir(path)
+
+    def isFile(self, path):
+        """check if the path is an existing file
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a file - ``False`` : the path is not a file
+        :rtype: bool
+        """
+
+        # return
+        return os.path.isfile(path)
+
+    def isWritable(self, path):
+        """check if the file can be written
+
+        :param path: path of the file
+        :type path: str
+
+        :return: ``True`` : the file is writable - ``False`` : the file is read only
+        :rtype: bool
+        """
+
+        # return
+        return os.access(path, os.W_OK)
+
+    def listChildren(self, path):
+        """the names of the files and directories of the directory - the children being neither files nor directories,
+        such as broken links, are skipped
+
+        the types of the children are read from the directory entries with ``os.scandir`` when available, so the
+        children are not stat one by one on most file systems
+
+        :param path: path of the directory
+        :type path: str
+
+        :return: the name of each child and whether it is a directory - [(name, isDirectory)] - unsorted
+        :rtype: list[tuple[str, bool]]
+        """
+
+        # return if scandir is not available
+        if cgp_generic_utils.python._compat.scandir is None:
+            return super(LocalBackend, self).listChildren(path)
+
+        # init
+        children = []
+
+        # execute - links are followed like os.path.isdir and os.path.isfile
+        for entry in cgp_generic_utils.python._compat.scandir(path):
+            if entry.is_dir():
+                children.append((entry.name, True))
+            elif entry.is_file():
+                children.append((entry.name, False))
+
+        # return
+        return children
+
+    def listDirectory(self, path):
+        """the names of the children of the directory
+
+        :param path: path of the directory
+        :type path: str
+
+        :return: the names of the children of the directory - unsorted
+        :rtype: list[str]
+        """
+
+        # return
+        return os.listdir(path)
+
+    def makeDirectories(self, path):
+        """create the directory and its missing parents
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # execute
+        os.makedirs(path)
+
+    def move(self, source, destination):
+        """move the file/directory - renamed when possible, copied then deleted across devices
+
+        :param source: path of the file/directory to move
+        :type source: str
+
+        :param destination: path the file/directory is moved to
+        :type destination: str
+        """
+
+        # execute
+        cgp_generic_utils.files._transfer.movePath(source, destination)
+
+    def open(self, path, mode='r'):
+        """open the file - same modes as the builtin open
+
+        :param path: path of the file
+        :type path: str
+
+        :param mode: mode used to open the file
+        :type mode: str
+
+        :return: the file object - usable as a context
+        :rtype: file
+        """
+
+        # return - universal newlines are the default of the text modes on python 3, which rejects the U mode
+        return open(path, mode if cgp_generic_utils.python._compat.PY2 else mode.replace('U', ''))
+
+    def remove(self, path):
+        """remove the file
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        # execute
+        os.remove(path)
+
+    def removeDirectory(self, path):
+        """remove the directory and its content
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # execute
+        shutil.rmtree(path)
+
+    def stat(self, path):
+        """the modification time and size of the file/directory
+
+        :param path: path of the file/directory
+        :type path: str
+
+        :return: the modification time and the size in bytes - (mtime, size)
+        :rtype: tuple[float, int]
+        """
+
+        # init
+        pathStat = os.stat(path)
+
+        # return
+        return pathStat.st_mtime, pathStat.st_size
+
+
+class MemoryBackend(StorageBackend):
+    """storage backend holding the files and directories in memory - nothing touches the disk
+
+    errors are raised with the same types and errno as the local file system so both backends behave the same,
+    the file system roots always exist
+    """
+
+    # INIT #
+
+    def __init__(self):
+        """MemoryBackend class initialization
+        """
+
+        # init
+        self._files = {}
+        self._directories = {}
+        self._lock = threading.RLock()
+
+    # COMMANDS #
+
+    def copyFile(self, source, destination):
+        """copy the file - the destination file is overwritten
+
+        :param source: path of the file to copy
+        :type source: str
+
+        :param destination: path of the copied file
+        :type destination: str
+        """
+
+        # execute
+        with self._lock:
+            self._checkFile(source)
+            self._commit(destination, self._files[source][0])
+
+    def isDirectory(self, path):
+        """check if the path is an existing directory
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a directory - ``False`` : the path is not a directory
+        :rtype: bool
+        """
+
+        # return
+        return path in self._directories or os.path.dirname(path) == path
+
+    def isFile(self, path):
+        """check if the path is an existing file
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a file - ``False`` : the path is not a file
+        :rtype: bool
+        """
+
+        # return
+        return path in self._files
+
+    def isWritable(self, path):
+        """check if the file can be written
+
+        :param path: path of the file
+        :type path: str
+
+        :return: ``True`` : the file is writable - ``False`` : the file is read only
+        :rtype: bool
+        """
+
+        # return
+        return self.exists(path)
+
+    def listDirectory(self, path):
+        """the names of the children of the directory
+
+        :param path: path of the directory
+        :type path: str
+
+        :return: the names of the children of the directory - unsorted
+        :rtype: list[str]
+        """
+
+        # execute
+        with self._lock:
+            self._checkDirectory(path)
+            return list(self._directories[path][1]) if path in self._directories else self._rootChildren(path)
+
+    def makeDirectories(self, path):
+        """create the directory and its missing parents
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # init
+        missingPaths = []
+        parent = path
+
+        # execute
+        with self._lock:
+
+            # errors
+            if self.exists(path):
+                raise OSError(errno.EEXIST, os.strerror(errno.EEXIST), path)
+
+            while not self.isDirectory(parent):
+                if self.isFile(parent):
+                    raise OSError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), parent)
+                missingPaths.append(parent)
+                parent = os.path.dirname(parent)
+
+            for missingPath in reversed(missingPaths):
+                self._directories[missingPath] = [time.time(), set()]
+                self._link(missingPath)
+
+    def move(self, source, destination):
+        """move the file/directory - the destination must not exist
+
+        :param source: path of the file/directory to move
+        :type source: str
+
+        :param destination: path the file/directory is moved to
+        :type destination: str
+        """
+
+        # execute
+        with self._lock:
+
+            # errors
+            if not self.exists(source):
+                raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), source)
+
+            self._checkDirectory(os.path.dirname(destination))
+
+            if self.exists(destination):
+                raise OSError(errno.EEXIST, os.strerror(errno.EEXIST), destination)
+
+            # file
+            if self.isFile(source):
+                self._files[destination] = self._files.pop(source)
+
+            # directory and its content
+            else:
+                prefix = os.path.join(source, '')
+
+                for storage in [self._files, self._directories]:
+                    for path in [path for path in storage if path == source or path.startswith(prefix)]:
+                        storage[destination + path[len(source):]] = storage.pop(path)
+
+            self._unlink(source)
+            self._link(destination)
+
+    def open(self, path, mode='r'):
+        """open the file - same modes as the builtin open
+
+        :param path: path of the file
+        :type path: str
+
+        :param mode: mode used to open the file
+        :type mode: str
+
+        :return: the file object - usable as a context
+        :rtype: file
+        """
+
+        # init
+        isRead = mode[0] == 'r' and '+' not in mode
+
+        # errors
+        with self._lock:
+
+            if self.isDirectory(path):
+                raise IOError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+
+            if mode[0] == 'r' or not self.isDirectory(os.path.dirname(path)):
+                self._checkFile(path)
+
+            content = self._files[path][0] if self.isFile(path) and mode[0] in 'ra' else b''
+
+        # universal newlines
+        if 'U' in mode:
+            content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        # return - the content is stored as bytes and decoded in text modes on python 3
+        return cgp_generic_utils.python._compat.textFile(io.BytesIO(content) if isRead
+                                                         else _MemoryFile(self, path, mode, content),
+                                                         mode)
+
+    def remove(self, path):
+        """remove the file
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        # execute
+        with self._lock:
+
+            # errors
+            if self.isDirectory(path):
+                raise OSError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+
+            self._checkFile(path)
+
+            # execute
+            del self._files[path]
+            self._unlink(path)
+
+    def removeDirectory(self, path):
+        """remove the directory and its content
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # init
+        prefix = os.path.join(path, '')
+
+        # execute
+        with self._lock:
+
+            # errors
+            self._checkDirectory(path)
+
+            if path not in self._directories:
+                raise OSError(errno.EBUSY, os.strerror(errno.EBUSY), path)
+
+            # execute
+            for storage in [self._files, self._directories]:
+                for childPath in [childPath for childPath in storage if childPath.startswith(prefix)]:
+                    del storage[childPath]
+
+            del self._directories[path]
+            self._unlink(path)
+
+    def stat(self, path):
+        """the modification time and size of the file/directory
+
+        :param path: path of the file/directory
+        :type path: str
+
+        :return: the modification time and the size in bytes - (mtime, size)
+        :rtype: tuple[float, int]
+        """
+
+        # execute
+        with self._lock:
+
+            if self.isFile(path):
+                return self._files[path][1], len(self._files[path][0])
+
+            if path in self._directories:
+                return self._directories[path][0], 0
+
+            if self.isDirectory(path):
+                return 0.0, 0
+
+        # errors
+        raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    # PRIVATE COMMANDS #
+
+    def _checkDirectory(self, path):
+        """raise the local file system error if the path is not an existing directory
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # errors
+        if self.isFile(path):
+            raise OSError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), path)
+
+        if not self.isDirectory(path):
+            raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    def _checkFile(self, path):
+        """raise the local file system error if the path is not an existing file
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        # errors
+        if not self.isFile(path):
+            raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    def _commit(self, path, content):
+        """store the content of the file - called when a written file object is flushed or closed
+
+        :param path: path of the file
+        :type path: str
+
+        :param content: content of the file
+        :type content: str
+        """
+
+        # execute
+        with self._lock:
+
+            # errors
+            self._checkDirectory(os.path.dirname(path))
+
+            if self.isDirectory(path):
+                raise IOError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+
+            # execute
+            isNew = path not in self._files
+            self._files[path] = (content, time.time())
+
+            if isNew:
+                self._link(path)
+
+    def _link(self, path):
+        """add the file/directory to the children of its parent directory
+
+        :param path: path of the file/directory
+        :type path: str
+        """
+
+        # init
+        parent = os.path.dirname(path)
+
+        # execute
+        if parent in self._directories:
+            self._directories[parent][1].add(os.path.basename(path))
+            self._directories[parent][0] = time.time()
+
+    def _rootChildren(self, root):
+        """the names of the children of the file system root
+
+        :param root: path of the root
+        :type root: str
+
+        :return: the names of the children of the root
+        :rtype: list[str]
+        """
+
+        # return
+        return [os.path.basename(path)
+                for storage in [self._files, self._directories]
+                for path in storage if path != root and os.path.dirname(path) == root]
+
+    def _unlink(self, path):
+        """remove the file/directory from the children of its parent directory
+
+        :param path: path of the file/directory
+        :type path: str
+        """
+
+        # init
+        parent = os.path.dirname(path)
+
+        # execute
+        if parent in self._directories:
+            self._directories[parent][1].discard(os.path.basename(path))
+            self._directories[parent][0] = time.time()
+
+
+_STORAGE_BACKEND = LocalBackend()
+_MOUNTS = ()
+_MOUNT_LOCK = threading.Lock()
+
+
+# PRIVATE OBJECTS #
+
+
+class _MemoryFile(io.BytesIO):
+    """file object writing in a memory backend - the content is stored when flushed or closed
+    """
+
+    # INIT #
+
+    def __init__(self, backend, path, mode, content):
+        """_MemoryFile class initialization
+
+        :param backend: backend the file is stored in
+        :type backend: :class:`cgp_generic_utils.files.MemoryBackend`
+
+        :param path: path of the file
+        :type path: str
+
+        :param mode: mode used to open the file
+        :type mode: str
+
+        :param content: initial content of the file
+        :type content: str
+        """
+
+        # init
+        super(_MemoryFile, self).__init__(content)
+        self._backend = backend
+        self._path = path
+
+        # execute - the file exists as soon as it is opened like on the local file system
+        if mode[0] == 'a':
+            self.seek(0, os.SEEK_END)
+
+        self._backend._commit(self._path, content)
+
+    # COMMANDS #
+
+    def close(self):
+        """store the content and close the file
+        """
+
+        # execute
+        if not self.closed:
+            self.flush()
+
+        super(_MemoryFile, self).close()
+
+    def flush(self):
+        """store the content of the file
+        """
+
+        # execute
+        super(_MemoryFile, self).flush()
+        self._backend._commit(self._path, self.getvalue())
+
+
+# COMMANDS #
+
+
+def copyFile(source, destination):
+    """copy the file - streamed between the storage backends of the source and the destination if they differ
+
+    :param source: path of the file to copy
+    :type source: str
+
+    :param destination: path of the copied file
+    :type destination: str
+    """
+
+    # init
+    sourceBackend = storageBackend(source)
+    destinationBackend = storageBackend(destination)
+
+    # execute
+    if sourceBackend is destinationBackend:
+        sourceBackend.copyFile(source, destination)
+        return
+
+    with sourceBackend.open(source, 'rb') as toRead:
+        with destinationBackend.open(destination, 'wb') as toWrite:
+            shutil.copyfileobj(toRead, toWrite)
+
+
+def entityBackend(entity):
+    """the storage backend of the path or of the file/directory object - a directory object can have its own backend,
+    such as a :class:`cgp_generic_utils.files.ZipDirectory` being the root of its archive
+
+    :param entity: path or file/directory object
+    :type entity: str or :class:`cgp_generic_utils.files.Path`
+
+    :return: the storage backend of the entity
+    :rtype: :class:`cgp_generic_utils.files.StorageBackend`
+    """
+
+    # return
+    if hasattr(entity, '_storageBackend'):
+        return entity._storageBackend()
+
+    return storageBackend(os.path.abspath(str(entity)))
+
+
+def mountStorageBackend(path, backend):
+    """mount the storage backend on the path - the files and directories under the path operate on the backend
+
+    :param path: path the backend is mounted on - the path itself keeps its current backend
+    :type path: str
+
+    :param backend: storage backend to mount - if None, the backend mounted on the path is unmounted
+    :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+    """
+
+    # init
+    global _MOUNTS
+    path = os.path.abspath(str(path))
+
+    # execute - the mounts are replaced and never modified so they are read without lock
+    with _MOUNT_LOCK:
+        mounts = dict(_MOUNTS)
+
+        if backend:
+            mounts[path] = backend
+        else:
+            mounts.pop(path, None)
+
+        _MOUNTS = tuple(sorted(mounts.items(), key=lambda item: len(item[0]), reverse=True))
+
+
+def movePath(source, destination):
+    """move the file/directory - files are copied then removed if the source and destination backends differ
+
+    :param source: path of the file/directory to move
+    :type source: str
+
+    :param destination: path the file/directory is moved to
+    :type destination: str
+    """
+
+    # init
+    sourceBackend = storageBackend(source)
+
+    # execute
+    if sourceBackend is storageBackend(destination):
+        sourceBackend.move(source, destination)
+        return
+
+    # errors
+    if not sourceBackend.isFile(source):
+        raise ValueError('{0} is not a file - only files can be moved across storage backends'.format(source))
+
+    # execute
+    copyFile(source, destination)
+    sourceBackend.remove(source)
+
+
+def setStorageBackend(backend):
+    """set the storage backend the file and directory objects operate on
+
+    :param backend: storage backend to use - if None, the local file system is used
+    :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+
+    :return: the previous storage backend - to restore it afterwards
+    :rtype: :class:`cgp_generic_utils.files.StorageBackend`
+    """
+
+    # init
+    global _STORAGE_BACKEND
+    previousBackend = _STORAGE_BACKEND
+
+    # execute
+    _STORAGE_BACKEND = backend or LocalBackend()
+
+    # return
+    return previousBackend
+
+
+def storageBackend(path=None):
+    """the storage backend the file and directory objects operate on
+
+    :param path: path to get the storage backend of - the backend mounted on one of its parents if any
+    :type path: str
+
+    :return: the storage backend
+    :rtype: :class:`cgp_generic_utils.files.StorageBackend`
+    """
+
+    # return mounted backend - mounts are sorted from the longest path so nested mounts win
+    if path and _MOUNTS:
+        for mountPath, backend in _MOUNTS:
+            if path.startswith(mountPath) and path[len(mountPath):len(mountPath) + 1] == os.sep:
+                return backend
+
+    # return
+    return _STORAGE_BACKEND
+
+
+def walkDirectory(path, recursive=True, backend=None):
+    """walk the directory on its storage backend - like ``os.walk``, the names of the sub directories can be removed
+    by the caller so they are not walked
+
+    :param path: path of the directory
+    :type path: str
+
+    :param recursive: ``True`` : the sub directories are walked - ``False`` : only the directory is listed
+    :type recursive: bool
+
+    :param backend: storage backend of the directory - default is the backend the path is mounted on
+    :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+
+    :return: the path, the names of the sub directories and the names of the files of each walked directory -
+             (root, directoryNames, fileNames)
+    :rtype: generator[tuple[str, list[str], list[str]]]
+    """
+
+    # init
+    backend = backend or storageBackend(path)
+
+    # walk the local file system - the links to directories are listed but not walked
+    if backend.isLocal():
+        for root, directoryNames, fileNames in os.walk(path):
+            yield root, directoryNames, fileNames
+
+            if not recursive:
+                return
+
+        return
+
+    # walk the other backends - each directory is listed on the backend it is mounted on
+    pending = [path]
+
+    while pending:
+        root = pending.pop()
+        children = (backend if root == path else storageBackend(root)).listChildren(root)
+        directoryNames = sorted(name for name, isDirectory in children if isDirectory)
+        fileNames = sorted(name for name, isDirectory in children if not isDirectory)
+
+        yield root, directoryNames, fileNames
+
+        if recursive:
+            pending.extend(os.path.join(root, name) for name in reversed(directoryNames))
@@ -0,0 +1,353 @@
+"""
+code object and module cache library
+"""
+
+# imports python
+import os
+import sys
+import ast
+import types
+import struct
+import marshal
+import hashlib
+import threading
+
+# imports local
+import cgp_generic_utils.python._compat
+from . import _backend
+
+
+# CACHE OBJECTS #
+
+
+class CodeCache(object):
+    """cache of the compiled code objects and loaded modules of python source files
+
+    entries are keyed on the (path, mtime, size) of the source file, so an unchanged file is never parsed twice -
+    compiled code objects can also be persisted on disk as bytecode to be shared between sessions
+    """
+
+    # ATTRIBUTES #
+
+    _header = struct.Struct('<4sdQ')
+
+    # INIT #
+
+    def __init__(self, directory=None):
+        """CodeCache class initialization
+
+        :param directory: directory where the compiled code objects are persisted - if None, nothing is persisted
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        self._directory = None
+        self._codes = {}
+        self._modules = {}
+        self._lock = threading.RLock()
+
+        # execute
+        self.setDirectory(directory)
+
+    # COMMANDS #
+
+    def code(self, path, mode='exec'):
+        """the compiled code object of the source file
+
+        :param path: path of the source file
+        :type path: str
+
+        :param mode: mode used to compile the source - ``exec`` - ``eval`` - ``ast``
+        :type mode: str
+
+        :return: the compiled code object - the parsed expression node if mode is ``ast``
+        :rtype: code or :class:`ast.Expression`
+        """
+
+        # errors
+        if mode not in ['exec', 'eval', 'ast']:
+            raise ValueError('{0} is not a compile mode - Expected : [\'exec\', \'eval\', \'ast\']'.format(mode))
+
+        # init
+        path = os.path.abspath(str(path))
+        key = self.key(path)
+
+        # return cached code if the source is unchanged
+        with self._lock:
+            cached = self._codes.get((path, mode))
+
+        if cached and cached[0] == key:
+            return cached[1]
+
+        # get code from the bytecode persisted on disk
+        code = self._loadBytecode(path, mode, key) if mode != 'ast' else None
+
+        # compile the source - read as bytes so the encoding declared by the source is used
+        if code is None:
+            with _backend.storageBackend(path).open(path, 'rb') as toRead:
+                source = toRead.read()
+
+            if mode == 'ast':
+                code = compile(source, path, 'eval', ast.PyCF_ONLY_AST)
+            else:
+                code = compile(source, path, mode, 0, True)
+                self._saveBytecode(path, mode, key, code)
+
+        # update cache
+        with self._lock:
+            self._codes[(path, mode)] = (key, code)
+
+        # return
+        return code
+
+    def directory(self):
+        """the directory where the compiled code objects are persisted
+
+        :return: the directory of the persisted bytecode - None if nothing is persisted
+        :rtype: str
+        """
+
+        # return
+        return self._directory
+
+    def invalidate(self, path=None):
+        """invalidate the cached entries of the source file
+
+        :param path: path of the source file to invalidate - if None, the entire cache is invalidated
+        :type path: str or :class:`cgp_generic_utils.files.File`
+        """
+
+        # init
+        path = os.path.abspath(str(path)) if path else None
+
+        # execute
+        with self._lock:
+
+            for cacheKey in list(self._codes):
+                if path is None or cacheKey[0] == path:
+                    del self._codes[cacheKey]
+
+            for cacheKey in list(self._modules):
+                if path is None or cacheKey == path:
+                    del self._modules[cacheKey]
+
+        # remove persisted bytecode
+        if self._directory and path:
+            for mode in ['exec', 'eval']:
+                bytecodePath = self._bytecodePath(path, mode)
+                if os.path.isfile(bytecodePath):
+                    os.remove(bytecodePath)
+
+    def key(self, path):
+        """the key identifying the current state of the source file
+
+        :param path: path of the source file
+        :type path: str
+
+        :return: the key of the source file - (path, mtime, size)
+        :rtype: tuple[str, float, int]
+        """
+
+        # init
+        mtime, size = _backend.storageBackend(path).stat(path)
+
+        # return
+        return path, mtime, size
+
+    def module(self, path, name=None, reload=False):
+        """the module loaded from the source file
+
+        :param path: path of the source file
+        :type path: str
+
+        :param name: name of the module - default is the name of the source file without extension
+        :type name: str
+
+        :param reload: ``True`` : the module is executed again even if the source is unchanged -
+                       ``False`` : the cached module is returned if the source is unchanged
+        :type reload: bool
+
+        :return: the module object
+        :rtype: module
+        """
+
+        # init
+        path = os.path.abspath(str(path))
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        key = self.key(path)
+
+        # return cached module if the source is unchanged
+        with self._lock:
+            cached = self._modules.get(path)
+
+        if not reload and cached and cached[0] == key and cached[1].__name__ == name:
+            sys.modules[name] = cached[1]
+            return cached[1]
+
+        # get code
+        code = self.code(path, mode='exec')
+
+        # create module - same behavior as imp.load_source
+        module = sys.modules.get(name) if reload and name in sys.modules else types.ModuleType(name)
+        module.__file__ = path
+        sys.modules[name] = module
+
+        # execute
+        try:
+            exec(code, module.__dict__)
+        except BaseException:
+            del sys.modules[name]
+            raise
+
+        # update cache
+        with self._lock:
+            self._modules[path] = (key, module)
+
+        # return
+        return module
+
+    def setDirectory(self, directory):
+        """set the directory where the compiled code objects are persisted
+
+        :param directory: directory of the persisted bytecode - if None, nothing is persisted
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        directory = os.path.abspath(str(directory)) if directory else None
+
+        # execute
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._directory = directory
+
+    # PRIVATE COMMANDS #
+
+    def _bytecodePath(self, path, mode):
+        """the path of the persisted bytecode of the source file
+
+        :param path: path of the source file
+        :type path: str
+
+        :param mode: mode used to compile the source
+        :type mode: str
+
+        :return: the path of the persisted bytecode
+        :rtype: str
+        """
+
+        # init
+        digest = hashlib.md5(cgp_generic_utils.python._compat.toBytes(path)).hexdigest()
+
+        # return
+        return os.path.join(self._directory, '{0}.{1}.pyc'.format(digest, mode))
+
+    def _loadBytecode(self, path, mode, key):
+        """load the persisted bytecode of the source file
+
+        :param path: path of the source file
+        :type path: str
+
+        :param mode: mode used to compile the source
+        :type mode: str
+
+        :param key: key of the current state of the source file
+        :type key: tuple[str, float, int]
+
+        :return: the persisted code object - None if missing or outdated
+        :rtype: code
+        """
+
+        # return if nothing is persisted - only sources of the local file system are persisted
+        if not self._directory or not _backend.storageBackend(path).isLocal():
+            return None
+
+        # get data
+        try:
+            with open(self._bytecodePath(path, mode), 'rb') as toRead:
+                data = toRead.read()
+        except (IOError, OSError):
+            return None
+
+        # return if outdated
+        if len(data) < self._header.size:
+            return None
+
+        magic, mtime, size = self._header.unpack_from(data)
+
+        if magic != cgp_generic_utils.python._compat.MAGIC_NUMBER or (path, mtime, size) != key:
+            return None
+
+        # return
+        try:
+            return marshal.loads(data[self._header.size:])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _saveBytecode(self, path, mode, key, code):
+        """persist the bytecode of the source file
+
+        :param path: path of the source file
+        :type path: str
+
+        :param mode: mode used to compile the source
+        :type mode: str
+
+        :param key: key of the current state of the source file
+        :type key: tuple[str, float, int]
+
+        :param code: code object to persist
+        :type code: code
+        """
+
+        # return if nothing is persisted - only sources of the local file system are persisted
+        if not self._directory or not _backend.storageBackend(path).isLocal():
+            return
+
+        # init
+        bytecodePath = self._bytecodePath(path, mode)
+        temporaryPath = '{0}.{1}.tmp'.format(bytecodePath, os.getpid())
+
+        # execute - write in a temporary file first so concurrent readers never get a partial bytecode
+        try:
+            with open(temporaryPath, 'wb') as toWrite:
+                toWrite.write(self._header.pack(cgp_generic_utils.python._compat.MAGIC_NUMBER, key[1], key[2]))
+                marshal.dump(code, toWrite)
+
+            if os.path.isfile(bytecodePath):
+                os.remove(bytecodePath)
+
+            os.rename(temporaryPath, bytecodePath)
+
+        except (IOError, OSError):
+            if os.path.isfile(temporaryPath):
+                os.remove(temporaryPath)
+
+
+CODE_CACHE = CodeCache()
+
+
+# COMMANDS #
+
+
+def invalidateCodeCache(path=None):
+    """invalidate the cached code objects and modules of the source file
+
+    :param path: path of the source file to invalidate - if None, the entire cache is invalidated
+    :type path: str or :class:`cgp_generic_utils.files.File`
+    """
+
+    # execute
+    CODE_CACHE.invalidate(path=path)
+
+
+def setCodeCacheDirectory(directory):
+    """set the directory where the compiled code objects are persisted between sessions
+
+    :param directory: directory of the persisted bytecode - if None, nothing is persisted
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+    """
+
+    # execute
+    CODE_CACHE.setDirectory(directory)
@@ -0,0 +1,224 @@
+"""
+scene dependency library
+"""
+
+# imports python
+import os
+import re
+import glob
+import threading
+import multiprocessing
+
+# imports local
+from . import _maya
+
+
+_SCENE_TYPES = {'.ma': _maya.MaFile, '.mb': _maya.MbFile}
+_TOKEN_PATTERN = re.compile(r'<[^<>/\\]+>|#+|%0?\d*d')
+
+
+# CACHE OBJECTS #
+
+
+class SceneDependencyCache(object):
+    """cache of the dependencies of the scene files keyed on the mtime and size of each scene
+
+    a scene is only scanned again when its mtime or size changes so repeated queries only rescan the modified scenes -
+    the other files are only checked for existence
+    """
+
+    # INIT #
+
+    def __init__(self):
+        """SceneDependencyCache class initialization
+        """
+
+        # init
+        self._records = {}
+        self._lock = threading.RLock()
+
+    # COMMANDS #
+
+    def graph(self, scenes, processes=None):
+        """the dependency graph of the scenes - the referenced scenes are followed recursively
+
+        :param scenes: the scenes to get the dependencies of
+        :type scenes: list[str] or list[:class:`cgp_generic_utils.files.File`]
+
+        :param processes: count of processes used to scan the scenes - default is the count of cpus
+        :type processes: int
+
+        :return: the graph - {graph: {path: [dependencyPath]}, missing: [path]} - the graph holds every file of the
+                 closure, the files that are not scenes don't have any dependency
+        :rtype: dict
+        """
+
+        # init
+        processes = processes or multiprocessing.cpu_count()
+        graph = {}
+        missing = set()
+        pending = sorted(set(os.path.abspath(str(scene)) for scene in scenes))
+        pool = None
+
+        # scan level by level
+        try:
+            while pending:
+
+                # get outdated scenes
+                toScan = []
+
+                for path in pending:
+                    try:
+                        pathStat = os.stat(path)
+                    except OSError:
+                        missing.add(path)
+                        graph[path] = []
+                        continue
+
+                    if os.path.splitext(path)[1].lower() not in _SCENE_TYPES:
+                        graph[path] = []
+                        continue
+
+                    with self._lock:
+                        cached = self._records.get(path)
+
+                    if cached and cached[0] == (pathStat.st_mtime, pathStat.st_size):
+                        graph[path] = _expandTokens(cached[1])
+                    else:
+                        toScan.append(path)
+
+                # scan outdated scenes - the pool is only started when there is work worth it
+                if processes > 1 and len(toScan) > 1:
+                    pool = pool or multiprocessing.Pool(processes)
+                    results = pool.map(_scanDependencies, toScan, chunksize=1)
+                else:
+                    results = [_scanDependencies(path) for path in toScan]
+
+                with self._lock:
+                    for path, key, dependencies in results:
+                        self._records[path] = (key, dependencies)
+                        graph[path] = _expandTokens(dependencies)
+
+                # get next level
+                pending = sorted(set(dependency
+                                     for path in pending
+                                     for dependency in graph[path]
+                                     if dependency not in graph))
+
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+        # return
+        return {'graph': graph, 'missing': sorted(missing)}
+
+    def invalidate(self, path=None):
+        """invalidate the cached dependencies of the scene or of the scenes of the directory
+
+        :param path: path of the scene or directory to invalidate - if None, the entire cache is invalidated
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+        """
+
+        # init
+        path = os.path.abspath(str(path)) if path else None
+        prefix = os.path.join(path, '') if path else None
+
+        # execute
+        with self._lock:
+            for cachedPath in list(self._records):
+                if path is None or cachedPath == path or cachedPath.startswith(prefix):
+                    del self._records[cachedPath]
+
+
+SCENE_DEPENDENCY_CACHE = SceneDependencyCache()
+
+
+# COMMANDS #
+
+
+def invalidateSceneDependencyCache(path=None):
+    """invalidate the cached dependencies of the scene or of the scenes of the directory
+
+    :param path: path of the scene or directory to invalidate - if None, the entire cache is invalidated
+    :type path: str or :class:`cgp_generic_utils.files.Path`
+    """
+
+    # execute
+    SCENE_DEPENDENCY_CACHE.invalidate(path=path)
+
+
+def sceneDependencies(scenes, processes=None):
+    """the dependency closure of the scenes - references, textures, caches ... - with the missing files
+
+    the referenced scenes are scanned recursively in parallel, the dependencies of each scene are cached until
+    the scene is modified so scanning the same scenes again only rescans the modified ones
+
+    :param scenes: the scenes to get the dependencies of
+    :type scenes: list[str] or list[:class:`cgp_generic_utils.files.File`]
+
+    :param processes: count of processes used to scan the scenes - default is the count of cpus
+    :type processes: int
+
+    :return: the graph - {graph: {path: [dependencyPath]}, missing: [path]} - the graph holds every file of the
+             closure, the files that are not scenes don't have any dependency
+    :rtype: dict
+    """
+
+    # return
+    return SCENE_DEPENDENCY_CACHE.graph(scenes, processes=processes)
+
+
+# PRIVATE COMMANDS #
+
+
+def _expandTokens(paths):
+    """the files matching the tokens of the paths - ``<UDIM>``, ``<f>``, ``####``, ``%04d`` ...
+
+    the tokens are expanded on each query as new files matching them don't modify the scene
+
+    :param paths: the paths - some of them holding tokens
+    :type paths: list[str]
+
+    :return: the files - a path holding tokens is kept as it is if no file matches it
+    :rtype: list[str]
+    """
+
+    # init
+    files = []
+
+    # execute
+    for path in paths:
+        if not _TOKEN_PATTERN.search(path):
+            files.append(path)
+        else:
+            files.extend(sorted(glob.glob(_TOKEN_PATTERN.sub('*', re.sub(r'([\[\]?*])', r'[\1]', path)))) or [path])
+
+    # return
+    return files
+
+
+def _scanDependencies(path):
+    """scan the dependencies of the scene - module level to be picklable by the process pool
+
+    :param path: path of the scene
+    :type path: str
+
+    :return: the path, the mtime and size of the scene and its dependencies - (path, (mtime, size), dependencies)
+    :rtype: tuple
+    """
+
+    # init - the stat is get before scanning so a modification during the scan invalidates the record
+    try:
+        pathStat = os.stat(path)
+    except OSError:
+        return path, None, []
+
+    # execute
+    try:
+        dependencies = _SCENE_TYPES[os.path.splitext(path)[1].lower()](path).dependencies()
+    except (IOError, OSError, ValueError):
+        dependencies = []
+
+    # return
+    return path, (pathStat.st_mtime, pathStat.st_size), dependencies
@@ -5,22 +5,29 @@ generic file object library
 # imports python
 import os
 import ast
-import subprocess
-import shutil
+import functools
+import itertools
 
 # imports local
 import cgp_generic_utils.python
+import cgp_generic_utils.python._compat
 import cgp_generic_utils.constants
 import cgp_generic_utils.files._api
+from . import _backend, _cache, _search, _sequence, _usage, _version
 
 
 # GENERIC FILE OBJECTS #
 
 
+@functools.total_ordering
 class Path(object):
     """path object that manipulates any kind of entity on the file system
     """
 
+    # ATTRIBUTES #
+
+    __slots__ = ('_path', '_baseName', '_stem', '_suffix', '_parent')
+
     # INIT #
 
     def __init__(self, path):
@@ -33,6 +40,12 @@ class Path(object):
         # init
         self._path = os.path.abspath(path)
 
+        # derived parts computed lazily
+        self._baseName = None
+        self._stem = None
+        self._suffix = None
+        self._parent = None
+
     def __eq__(self, path):
         """check if the Path has the same name as the other path
 
@@ -44,7 +57,30 @@ class Path(object):
         """
 
         # return
-        return self.path() == str(path)
+        return self._path == str(path)
+
+    def __hash__(self):
+        """the hash of the path - identical to the hash of its string so paths and strings share dict keys
+
+        :return: the hash of the path
+        :rtype: int
+        """
+
+        # return
+        return hash(self._path)
+
+    def __lt__(self, path):
+        """check if the Path is sorted before the other path
+
+        :param path: path to check with
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+
+        :return : ``True`` : the path is sorted before the other path - ``False`` : the path is sorted after
+        :rtype: bool
+        """
+
+        # return
+        return self._path < str(path)
 
     def __ne__(self, path):
         """check if the Path has not the same name as the other path
@@ -57,7 +93,17 @@ class Path(object):
         """
 
         # return
-        return self.path() != str(path)
+        return self._path != str(path)
+
+    def __reduce__(self):
+        """the pickle data of the path
+
+        :return: the class and the initialization arguments of the path
+        :rtype: tuple
+        """
+
+        # return
+        return self.__class__, (self._path,)
 
     def __repr__(self):
         """the representation of the path
@@ -77,7 +123,7 @@ class Path(object):
         """
 
         # return
-        return self.path()
+        return self._path
 
     # COMMANDS #
 
@@ -91,19 +137,21 @@ class Path(object):
         :rtype: str
         """
 
+        # init
+        backend = self._storageBackend()
+        isFile = backend.isFile(self._path)
+
         # errors
-        if not os.path.isdir(self.path()) and not os.path.isfile(self.path()):
-            raise ValueError('{0} is not a valid path'.format(self.path()))
+        if not isFile and not backend.isDirectory(self._path):
+            raise ValueError('{0} is not a valid path'.format(self._path))
 
         # get baseName
-        baseName = os.path.basename(self.path())
-
-        # execute
-        if os.path.isfile(self.path()) and not withExtension:
-            baseName = baseName.split('.')[0]
+        if self._baseName is None:
+            self._baseName = os.path.basename(self._path)
+            self._stem = self._baseName.split('.')[0]
 
         # return
-        return baseName
+        return self._stem if isFile and not withExtension else self._baseName
 
     def directory(self):
         """the parent directory of the path
@@ -112,8 +160,12 @@ class Path(object):
         :rtype: :class:`cgp_generic_utils.files.Directory`
         """
 
+        # get parent
+        if self._parent is None:
+            self._parent = os.path.dirname(self._path)
+
         # return
-        return cgp_generic_utils.files._api.entity(os.path.dirname(self.path()))
+        return cgp_generic_utils.files._api.entity(self._parent)
 
     def extension(self):
         """the extension of the path
@@ -123,12 +175,11 @@ class Path(object):
         """
 
         # get extension
-        extension = os.path.splitext(self.path())[-1][1:]
+        if self._suffix is None:
+            self._suffix = os.path.splitext(self._path)[-1][1:]
 
         # return
-        return (extension
-                if extension and (self.isFile() or not self.isFile() and not self.isDirectory())
-                else None)
+        return self._suffix if self._suffix and not self._storageBackend().isDirectory(self._path) else None
 
     def isDirectory(self):
         """check if the path is a directory
@@ -138,7 +189,7 @@ class Path(object):
         """
 
         # return
-        return os.path.isdir(self.path())
+        return self._storageBackend().isDirectory(self.path())
 
     def isFile(self):
         """check if the path is a file
@@ -148,7 +199,7 @@ class Path(object):
         """
 
         # return
-        return os.path.isfile(self.path())
+        return self._storageBackend().isFile(self.path())
 
     def path(self):
         """the path of the entity on the file system
@@ -171,6 +222,30 @@ class Path(object):
         return (cgp_generic_utils.constants.FileFilter.DIRECTORY if self.isDirectory()
                 else cgp_generic_utils.constants.FileFilter.FILE)
 
+    # PRIVATE COMMANDS #
+
+    def _checkLocal(self, command):
+        """check that the path is on the local file system - the command works on the raw path
+
+        :param command: name of the command needing the local file system
+        :type command: str
+        """
+
+        # errors
+        if not self._storageBackend().isLocal():
+            raise ValueError('{0} is not on the local file system - {1} is not supported by its storage backend'
+                             .format(self._path, command))
+
+    def _storageBackend(self):
+        """the storage backend the path operates on
+
+        :return: the storage backend of the path
+        :rtype: :class:`cgp_generic_utils.files.StorageBackend`
+        """
+
+        # return
+        return _backend.storageBackend(self._path)
+
 
 class File(Path):
     """file object that manipulates any kind of file on the file system
@@ -178,7 +253,9 @@ class File(Path):
 
     # ATTRIBUTES #
 
+    __slots__ = ()
     _extension = None
+    _signatures = ()
 
     # OBJECT COMMANDS #
 
@@ -201,7 +278,9 @@ class File(Path):
             raise ValueError('{0} is not a {1} path'.format(path, cls.__class__.__name__))
 
         # execute
-        with open(path, 'w') as toWrite:
+        path = os.path.abspath(path)
+
+        with _backend.storageBackend(path).open(path, 'w') as toWrite:
             toWrite.write(str(content or ''))
 
         # return
@@ -231,31 +310,32 @@ class File(Path):
                            if destinationName
                            else self.baseName(withExtension=True))
 
-        destinationFileName = os.path.join(destinationDirectory, destinationName)
-        isDestinationFile = os.path.isfile(destinationFileName)
+        destinationFileName = os.path.abspath(os.path.join(destinationDirectory, destinationName))
+        backend = _backend.storageBackend(destinationFileName)
+        isDestinationFile = backend.isFile(destinationFileName)
 
         # errors
-        if not os.path.isdir(destinationDirectory):
+        if not backend.isDirectory(os.path.abspath(destinationDirectory)):
             raise ValueError('{0} is not a valid directory'.format(destinationDirectory))
 
         if self.path() == destinationFileName:
             raise ValueError('can\'t copy the file on itself')
 
-        if isDestinationFile and not os.access(destinationFileName, os.W_OK):
+        if isDestinationFile and not backend.isWritable(destinationFileName):
             raise ValueError('can\'t copy the file on a readOnly file - {0}'.format(destinationFileName))
 
         # remove destination file if existing - workAround to avoid - IOError: [Errno 13] Permission denied
         if isDestinationFile:
-            os.remove(destinationFileName)
+            backend.remove(destinationFileName)
 
         # copy the file
-        shutil.copy(self.path(), destinationFileName)
+        _backend.copyFile(self.path(), destinationFileName)
 
         # return
         return cgp_generic_utils.files._api.entity(destinationFileName)
 
     def evaluate(self, asLiteral=True):
-        """evaluate the content of the file
+        """evaluate the content of the file - the parsed content is cached until the file changes
 
         :param asLiteral: ``True`` : content evaluated with ast.literal_eval - ``False`` : content evaluated with eval
         :type asLiteral: bool
@@ -265,22 +345,119 @@ class File(Path):
         """
 
         # execute
-        return ast.literal_eval(self.read()) if asLiteral else eval(self.read())
+        return (ast.literal_eval(_cache.CODE_CACHE.code(self.path(), mode='ast'))
+                if asLiteral
+                else eval(_cache.CODE_CACHE.code(self.path(), mode='eval')))
 
     def execute(self):
-        """execute the content of the file
+        """execute the content of the file - the compiled content is cached until the file changes
 
-        :return: the executed content of the file
-        :rtype: any
+        :return: the namespace of the executed content of the file
+        :rtype: dict
         """
 
+        # init
+        namespace = {'__name__': '__main__', '__file__': self.path()}
+
         # execute
-        return execfile(self.path())
+        exec(_cache.CODE_CACHE.code(self.path(), mode='exec'), namespace)
+
+        # return
+        return namespace
+
+    def lock(self, exclusive=True, timeout=None, staleAge=3600.0, useLockFile=False):
+        """the advisory lock of the file shared between threads and processes - to use as a context
+
+        :param exclusive: ``True`` : exclusive lock for writers - ``False`` : shared lock for readers
+        :type exclusive: bool
+
+        :param timeout: seconds to wait for the lock - 0 doesn't wait - if None, waits until the lock is acquired
+        :type timeout: float
+
+        :param staleAge: seconds after which a lock file is considered stale - if None, only dead owners are stale
+        :type staleAge: float
+
+        :param useLockFile: ``True`` : a lock file is used - needed on network shares not supporting fcntl -
+                            ``False`` : fcntl is used when available
+        :type useLockFile: bool
+
+        :return: the lock of the file
+        :rtype: :class:`cgp_generic_utils.files.FileLock`
+        """
+
+        # import the lock library here as it is only needed to lock files
+        from . import _lock
+
+        # return
+        return _lock.FileLock(self.path(),
+                              exclusive=exclusive,
+                              timeout=timeout,
+                              staleAge=staleAge,
+                              useLockFile=useLockFile)
+
+    def move(self, destinationDirectory=None, destinationName=None):
+        """move the file - renamed when possible, copied then deleted when moved to another device
+
+        :param destinationDirectory: directory where the file will be moved  - If None, same as original
+        :type destinationDirectory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param destinationName: name of the moved file - If None, same as original - ! HAS TO BE WITHOUT EXTENSION !
+        :type destinationName: str
+
+        :return: the moved file
+        :rtype: :class:`cgp_generic_utils.files.File`
+        """
+
+        # init
+        destinationDirectory = (str(destinationDirectory)
+                                if destinationDirectory
+                                else self.directory().path())
+
+        destinationName = ('{0}.{1}'.format(destinationName, self.extension())
+                           if destinationName and self.extension()
+                           else destinationName or self.baseName(withExtension=True))
+
+        destinationFileName = os.path.abspath(os.path.join(destinationDirectory, destinationName))
+        backend = _backend.storageBackend(destinationFileName)
+        isDestinationFile = backend.isFile(destinationFileName)
+
+        # errors
+        if not backend.isDirectory(os.path.abspath(destinationDirectory)):
+            raise ValueError('{0} is not a valid directory'.format(destinationDirectory))
+
+        if self.path() == destinationFileName:
+            raise ValueError('can\'t move the file on itself')
+
+        if isDestinationFile and not backend.isWritable(destinationFileName):
+            raise ValueError('can\'t move the file on a readOnly file - {0}'.format(destinationFileName))
+
+        # move the destination file aside - rename can't overwrite on every platform, it is restored if the move fails
+        backupPath = '{0}.{1}.backup'.format(destinationFileName, os.getpid()) if isDestinationFile else None
+
+        if backupPath:
+            backend.move(destinationFileName, backupPath)
+
+        # move the file
+        try:
+            _backend.movePath(self.path(), destinationFileName)
+        except BaseException:
+            if backupPath:
+                backend.move(backupPath, destinationFileName)
+            raise
+
+        if backupPath:
+            backend.remove(backupPath)
+
+        # return
+        return cgp_generic_utils.files._api.entity(destinationFileName)
 
     def open(self):
         """open the file in the script editor
         """
 
+        # import subprocess here as it is only needed to open files
+        import subprocess
+
         # execute
         subprocess.Popen([cgp_generic_utils.constants.Environment.SCRIPT_EDITOR, self.path()])
 
@@ -292,12 +469,46 @@ class File(Path):
         """
 
         # execute
-        with open(self.path(), 'r') as toRead:
+        with self._storageBackend().open(self.path(), 'r') as toRead:
             data = toRead.read()
 
         # return
         return data
 
+    def search(self, pattern, ignoreCase=False):
+        """search the pattern in the file - binary files are skipped
+
+        :param pattern: regular expression to search
+        :type pattern: str
+
+        :param ignoreCase: ``True`` : the search ignores case - ``False`` : the search is case sensitive
+        :type ignoreCase: bool
+
+        :return: the matches - (path, lineNumber, offset, line) with offset being the byte offset of the match
+        :rtype: list[tuple[str, int, int, str]]
+        """
+
+        # errors
+        self._checkLocal('search')
+
+        # return
+        return list(_search.search([self.path()], pattern, ignoreCase=ignoreCase, processes=1))
+
+    def stream(self, chunkSize=65536):
+        """stream the content of the file by chunks - the file is never loaded entirely in memory
+
+        :param chunkSize: maximum size in bytes of each chunk
+        :type chunkSize: int
+
+        :return: the chunks of the content of the file
+        :rtype: generator[bytes]
+        """
+
+        # execute
+        with self._storageBackend().open(self.path(), 'rb') as toRead:
+            for chunk in iter(lambda: toRead.read(chunkSize), b''):
+                yield chunk
+
     def write(self, content):
         """write data in the specified path file
 
@@ -308,11 +519,45 @@ class File(Path):
         # execute
         self.create(self.path(), content=content)
 
+    # PRIVATE COMMANDS #
+
+    def _lineChunks(self, chunkSize):
+        """stream the content of the file by chunks of entire lines
+
+        :param chunkSize: size in bytes of the blocks read from the file - a chunk holds at least one entire line
+        :type chunkSize: int
+
+        :return: the chunks - each chunk starts with a line break so line starts are found with ``\\n<prefix>`` -
+                 the chunks are split on line breaks before being decoded, so no character is split between chunks
+        :rtype: generator[str]
+        """
+
+        # init
+        remainder = b''
+
+        # execute
+        for block in self.stream(chunkSize=chunkSize):
+            lastBreak = block.rfind(b'\n')
+
+            if lastBreak == -1:
+                remainder += block
+                continue
+
+            yield cgp_generic_utils.python._compat.toText(b'\n' + remainder + block[:lastBreak + 1])
+            remainder = block[lastBreak + 1:]
+
+        if remainder:
+            yield cgp_generic_utils.python._compat.toText(b'\n' + remainder + b'\n')
+
 
 class Directory(Path):
     """directory object that manipulates a directory on the file system
     """
 
+    # ATTRIBUTES #
+
+    __slots__ = ()
+
     # OBJECT COMMANDS #
 
     @classmethod
@@ -326,15 +571,56 @@ class Directory(Path):
         :rtype: :class:`cgp_generic_utils.files.Directory`
         """
 
+        # init
+        path = os.path.abspath(path)
+        backend = _backend.storageBackend(path)
+
         # execute
-        if not os.path.exists(path):
-            os.makedirs(path)
+        if not backend.exists(path):
+            backend.makeDirectories(path)
 
         # return
         return cls(path)
 
     # COMMANDS #
 
+    def archive(self, archiveFormat=None, compression=None, archivePath=None, threads=None):
+        """archive the directory - files are streamed into the archive without staging it in memory
+
+        :param archiveFormat: format of the archive - ``cgp_generic_utils.constants.ArchiveFormat.ZIP`` is default
+        :type archiveFormat: str
+
+        :param compression: compression of the archive - ``cgp_generic_utils.constants.ArchiveFormat.COMPRESSIONS`` -
+                            default is no compression
+        :type compression: str
+
+        :param archivePath: path of the archive - default is the directory path with the archive extension
+        :type archivePath: str
+
+        :param threads: count of threads compressing a gz archive - default is the count of cpus
+        :type threads: int
+
+        :return: the archive file
+        :rtype: :class:`cgp_generic_utils.files.File`
+        """
+
+        # errors
+        self._checkLocal('archive')
+
+        if archivePath and not _backend.storageBackend(os.path.abspath(str(archivePath))).isLocal():
+            raise ValueError('{0} is not on the local file system - archive is not supported by its storage backend'
+                             .format(archivePath))
+
+        # import the archive library here as it is only needed to archive directories
+        from . import _archive
+
+        # return
+        return _archive.archiveDirectory(self.path(),
+                                         archivePath=archivePath,
+                                         archiveFormat=archiveFormat,
+                                         compression=compression,
+                                         threads=threads)
+
     def baseName(self):
         """the baseName of the directory
 
@@ -345,7 +631,7 @@ class Directory(Path):
         # return
         return super(Directory, self).baseName(withExtension=False)
 
-    def content(self, fileFilters=None, fileExtensions=None, fileExtensionsIncluded=True):
+    def content(self, fileFilters=None, fileExtensions=None, fileExtensionsIncluded=True, groupSequences=False):
         """content of the directory
 
         :param fileFilters: filter of the directory children - default is ``cgp_generic_utils.constants.FileFilter.ALL``
@@ -358,15 +644,364 @@ class Directory(Path):
                                        ``False`` : file extensions are excluded
         :type fileExtensionsIncluded: bool
 
-        :return: the content of the directory
+        :param groupSequences: ``True`` : the numbered files are collapsed into file sequences -
+                               ``False`` : each file is returned
+        :type groupSequences: bool
+
+        :return: the content of the directory - directories first, then files and file sequences sorted by name
         :rtype: list[:class:`cgp_generic_utils.files.Directory`,
                 :class:`cgp_generic_utils.files.File`,
+                :class:`cgp_generic_utils.files.FileSequence`,
                 :class:`cgp_generic_utils.files.JsonFile`,
                 :class:`cgp_generic_utils.files.PyFile`,
                 :class:`cgp_generic_utils.files.TxtFile`,
                 :class:`cgp_generic_utils.files.UiFile`]
         """
 
+        # init
+        directories = []
+        files = []
+
+        # filter depending on filter
+        for path, isDirectory in self._children(fileFilters, fileExtensions, fileExtensionsIncluded):
+            (directories if isDirectory else files).append(path)
+
+        # return if sequences are not grouped
+        if not groupSequences:
+            return [self._childEntity(path, isDirectory)
+                    for paths, isDirectory in [(sorted(directories), True), (sorted(files), False)]
+                    for path in paths]
+
+        # get sequences
+        sequences, files = _sequence.collapseSequences(files)
+
+        # return - sequences and files are sorted together, by pattern and by path
+        return ([self._childEntity(path, True) for path in sorted(directories)] +
+                sorted(sequences + [self._childEntity(path, False) for path in files], key=str))
+
+    def contentCount(self):
+        """the count of children of the directory - a cheap estimate of the content size as no filter is applied
+
+        :return: the count of children of the directory
+        :rtype: int
+        """
+
+        # return
+        return len(self._storageBackend().listDirectory(self.path()))
+
+    def contentPage(self, offset, limit, fileFilters=None, fileExtensions=None, fileExtensionsIncluded=True):
+        """a page of the content of the directory - children are sorted by name, directories and files mixed
+
+        :param offset: count of filtered children to skip
+        :type offset: int
+
+        :param limit: maximum count of children of the page
+        :type limit: int
+
+        :param fileFilters: filter of the directory children - default is ``cgp_generic_utils.constants.FileFilter.ALL``
+        :type fileFilters: list[str]
+
+        :param fileExtensions: extensions of the files to get - default is all extensions
+        :type fileExtensions: list[str]
+
+        :param fileExtensionsIncluded: ``True`` : file extensions are included -
+                                       ``False`` : file extensions are excluded
+        :type fileExtensionsIncluded: bool
+
+        :return: the page of the content of the directory
+        :rtype: list[:class:`cgp_generic_utils.files.Directory`,
+                :class:`cgp_generic_utils.files.File`]
+        """
+
+        # return
+        return next(self.contentPages(pageSize=limit,
+                                      offset=offset,
+                                      fileFilters=fileFilters,
+                                      fileExtensions=fileExtensions,
+                                      fileExtensionsIncluded=fileExtensionsIncluded), [])
+
+    def contentPages(self, pageSize=500, offset=0, fileFilters=None, fileExtensions=None, fileExtensionsIncluded=True):
+        """stream the content of the directory by pages - children are sorted by name, directories and files mixed
+
+        only the names are sorted upfront so the first page is available before the entire content is filtered
+
+        :param pageSize: maximum count of children of each page
+        :type pageSize: int
+
+        :param offset: count of filtered children to skip
+        :type offset: int
+
+        :param fileFilters: filter of the directory children - default is ``cgp_generic_utils.constants.FileFilter.ALL``
+        :type fileFilters: list[str]
+
+        :param fileExtensions: extensions of the files to get - default is all extensions
+        :type fileExtensions: list[str]
+
+        :param fileExtensionsIncluded: ``True`` : file extensions are included -
+                                       ``False`` : file extensions are excluded
+        :type fileExtensionsIncluded: bool
+
+        :return: the pages of the content of the directory
+        :rtype: generator[list[:class:`cgp_generic_utils.files.Directory`,
+                :class:`cgp_generic_utils.files.File`]]
+        """
+
+        # errors
+        if pageSize < 1:
+            raise ValueError('{0} is not a valid page size - Expected : strictly positive int'.format(pageSize))
+
+        # init
+        page = []
+        children = self._children(fileFilters, fileExtensions, fileExtensionsIncluded,
+                                  names=sorted(self._storageBackend().listDirectory(self.path())))
+
+        # execute
+        for path, isDirectory in itertools.islice(children, offset, None):
+            page.append(self._childEntity(path, isDirectory))
+
+            if len(page) == pageSize:
+                yield page
+                page = []
+
+        if page:
+            yield page
+
+    def latestVersion(self, name, extension=None):
+        """the latest version of the versioned child of the directory - ``asset_v487.ma``
+
+        the versions are get from an index of the directory refreshed when the mtime of the directory changes
+
+        :param name: name of the versioned child without the version - ``asset`` for ``asset_v001.ma``
+        :type name: str
+
+        :param extension: extension of the versioned child - default is all extensions
+        :type extension: str
+
+        :return: the latest version of the child - ``None`` if the child doesn't have any version
+        :rtype: :class:`cgp_generic_utils.files.Directory` or :class:`cgp_generic_utils.files.File`
+        """
+
+        # init
+        latest = _version.VERSION_INDEX_CACHE.latest(self.path(), name,
+                                                     extension=extension,
+                                                     backend=self._storageBackend())
+
+        # return
+        return self._versionEntity(latest[1]) if latest else None
+
+    def move(self, destinationDirectory=None, destinationName=None):
+        """move the directory - renamed when possible, copied then deleted when moved to another device
+
+        :param destinationDirectory: directory where the directory will be moved  - If None, same as original
+        :type destinationDirectory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param destinationName: name of the moved directory - If None, same as original
+        :type destinationName: str
+
+        :return: the moved directory
+        :rtype: :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        destinationDirectory = (str(destinationDirectory)
+                                if destinationDirectory
+                                else self.directory().path())
+
+        destinationPath = os.path.abspath(os.path.join(destinationDirectory, destinationName or self.baseName()))
+        backend = _backend.storageBackend(destinationPath)
+
+        # errors
+        if not backend.isDirectory(os.path.abspath(destinationDirectory)):
+            raise ValueError('{0} is not a valid directory'.format(destinationDirectory))
+
+        if backend.exists(destinationPath):
+            raise ValueError('{0} already exists'.format(destinationPath))
+
+        if destinationPath.startswith(os.path.join(self.path(), '')):
+            raise ValueError('can\'t move the directory inside itself')
+
+        # move the directory
+        _backend.movePath(self.path(), destinationPath)
+
+        # return
+        return self.__class__(destinationPath)
+
+    def nextVersionPath(self, name, extension=None):
+        """the path of the next version of the versioned child of the directory - the naming of the latest version
+        is kept, ``name_v001.extension`` is used if the child doesn't have any version
+
+        :param name: name of the versioned child without the version - ``asset`` for ``asset_v001.ma``
+        :type name: str
+
+        :param extension: extension of the versioned child - default is all extensions
+        :type extension: str
+
+        :return: the path of the next version of the child
+        :rtype: str
+        """
+
+        # init
+        backend = self._storageBackend()
+        path = None
+
+        # get path - the directory is indexed again if the path is taken, as a coarse mtime can hide a new version
+        for useCache in (True, False):
+            if not useCache:
+                _version.VERSION_INDEX_CACHE.invalidate(self.path())
+
+            latest = _version.VERSION_INDEX_CACHE.latest(self.path(), name, extension=extension, backend=backend)
+            path = os.path.join(self.path(),
+                                _version.versionName(latest[1], latest[0] + 1)
+                                if latest
+                                else '{0}_v001{1}'.format(name, '.{0}'.format(extension) if extension else ''))
+
+            if not backend.exists(path):
+                break
+
+        # return
+        return path
+
+    def search(self, pattern, fileExtensions=None, recursive=True, ignoreCase=False, processes=None):
+        """search the pattern in the files of the directory - matches are streamed as soon as a file is scanned
+
+        :param pattern: regular expression to search
+        :type pattern: str
+
+        :param fileExtensions: extensions of the files to search in - default is all extensions
+        :type fileExtensions: list[str]
+
+        :param recursive: ``True`` : the sub directories are searched - ``False`` : only the directory is searched
+        :type recursive: bool
+
+        :param ignoreCase: ``True`` : the search ignores case - ``False`` : the search is case sensitive
+        :type ignoreCase: bool
+
+        :param processes: count of processes used to search the files - default is the count of cpus
+        :type processes: int
+
+        :return: the matches - (path, lineNumber, offset, line) with offset being the byte offset of the match
+        :rtype: generator[tuple[str, int, int, str]]
+        """
+
+        # errors
+        self._checkLocal('search')
+
+        # return
+        return _search.search([self.path()], pattern,
+                              fileExtensions=fileExtensions,
+                              recursive=recursive,
+                              ignoreCase=ignoreCase,
+                              processes=processes)
+
+    def size(self, processes=None, useCache=False):
+        """the total size of the files of the directory and its sub directories - hardlinks are counted once
+
+        with the cache, the content of each directory is kept until its mtime changes so repeated calls only rescan
+        modified directories - the mtime of a directory doesn't change when a file is modified in place
+
+        :param processes: count of threads used to scan the directories - default is the count of cpus
+        :type processes: int
+
+        :param useCache: ``True`` : only the directories with a modified mtime are scanned -
+                         ``False`` : every directory is scanned so the size is exact
+        :type useCache: bool
+
+        :return: the size of the directory in bytes
+        :rtype: int
+        """
+
+        # errors
+        self._checkLocal('size')
+
+        # return
+        return _usage.DISK_USAGE_CACHE.sizes(self.path(), processes=processes, useCache=useCache)[self.path()]
+
+    def version(self, name, version, extension=None):
+        """the specific version of the versioned child of the directory
+
+        :param name: name of the versioned child without the version - ``asset`` for ``asset_v001.ma``
+        :type name: str
+
+        :param version: the version to get
+        :type version: int
+
+        :param extension: extension of the versioned child - default is all extensions
+        :type extension: str
+
+        :return: the version of the child - ``None`` if the child doesn't have this version
+        :rtype: :class:`cgp_generic_utils.files.Directory` or :class:`cgp_generic_utils.files.File`
+        """
+
+        # execute
+        for childVersion, childName in _version.VERSION_INDEX_CACHE.versions(self.path(), name,
+                                                                             extension=extension,
+                                                                             backend=self._storageBackend()):
+            if childVersion == version:
+                return self._versionEntity(childName)
+
+        # return
+        return None
+
+    def versions(self, name, extension=None):
+        """the versions of the versioned child of the directory
+
+        :param name: name of the versioned child without the version - ``asset`` for ``asset_v001.ma``
+        :type name: str
+
+        :param extension: extension of the versioned child - default is all extensions
+        :type extension: str
+
+        :return: the sorted versions of the child
+        :rtype: list[int]
+        """
+
+        # return
+        return [version for version, _ in _version.VERSION_INDEX_CACHE.versions(self.path(), name,
+                                                                                extension=extension,
+                                                                                backend=self._storageBackend())]
+
+    # PRIVATE COMMANDS #
+
+    def _childEntity(self, path, isDirectory):
+        """the file/directory object of the child of the directory
+
+        :param path: path of the child
+        :type path: str
+
+        :param isDirectory: ``True`` : the child is a directory - ``False`` : the child is a file
+        :type isDirectory: bool
+
+        :return: the file/directory object of the child
+        :rtype: :class:`cgp_generic_utils.files.Directory`, :class:`cgp_generic_utils.files.File`
+        """
+
+        # init
+        fileTypes = cgp_generic_utils.files._api.registeredFileTypes()
+
+        # return
+        return (fileTypes['directory'](path) if isDirectory
+                else fileTypes.get(os.path.splitext(path)[-1][1:], fileTypes['file'])(path))
+
+    def _children(self, fileFilters, fileExtensions, fileExtensionsIncluded, names=None):
+        """the filtered children of the directory
+
+        :param fileFilters: filter of the directory children - default is ``cgp_generic_utils.constants.FileFilter.ALL``
+        :type fileFilters: list[str]
+
+        :param fileExtensions: extensions of the files to get - default is all extensions
+        :type fileExtensions: list[str]
+
+        :param fileExtensionsIncluded: ``True`` : file extensions are included -
+                                       ``False`` : file extensions are excluded
+        :type fileExtensionsIncluded: bool
+
+        :param names: names of the children to filter - default is the names listed in the directory
+        :type names: list[str]
+
+        :return: the paths of the filtered children and whether they are directories - (path, isDirectory)
+        :rtype: generator[tuple[str, bool]]
+        """
+
         # init
         fileFilters = fileFilters or cgp_generic_utils.constants.FileFilter.ALL
 
@@ -377,36 +1012,49 @@ class Directory(Path):
                                  .format(fileFilter, cgp_generic_utils.constants.FileFilter.ALL))
 
         # init
-        filterChildren = {'directories': [],
-                          'files': []}
+        keepDirectories = cgp_generic_utils.constants.FileFilter.DIRECTORY in fileFilters
+        keepFiles = cgp_generic_utils.constants.FileFilter.FILE in fileFilters
+        backend = self._storageBackend()
 
-        # get folder children
-        children = os.listdir(self.path())
+        # get children - their types are read with the listing when the names are not given
+        children = (backend.listChildren(self.path()) if names is None
+                    else [(name, backend.isDirectory(os.path.join(self.path(), name))) for name in names])
 
         # filter depending on filter
-        for child in children:
+        for name, isDirectory in children:
 
             # get child absolute path
-            absChild = Path(os.path.join(self.path(), child))
+            path = os.path.join(self.path(), name)
 
-            # get extension
-            extension = absChild.extension()
+            # directories
+            if isDirectory:
+                if keepDirectories:
+                    yield path, True
+                continue
 
-            # check validity
-            if (cgp_generic_utils.constants.FileFilter.DIRECTORY not in fileFilters and absChild.isDirectory()
-                    or cgp_generic_utils.constants.FileFilter.FILE not in fileFilters and absChild.isFile()):
+            # files
+            if not keepFiles or (names is not None and not backend.isFile(path)):
                 continue
 
-            # directories
-            if absChild.isDirectory():
-                filterChildren['directories'].append(absChild.path())
+            extension = os.path.splitext(name)[-1][1:] or None
 
-            # update filterChildren
-            elif (not fileExtensions and fileExtensionsIncluded
+            if (not fileExtensions and fileExtensionsIncluded
                     or fileExtensions and fileExtensionsIncluded and extension in fileExtensions
                     or fileExtensions and not fileExtensionsIncluded and extension not in fileExtensions):
-                filterChildren['files'].append(absChild.path())
+                yield path, False
+
+    def _versionEntity(self, childName):
+        """the file/directory object of the versioned child of the directory
+
+        :param childName: name of the versioned child
+        :type childName: str
+
+        :return: the file/directory object of the versioned child
+        :rtype: :class:`cgp_generic_utils.files.Directory`, :class:`cgp_generic_utils.files.File`
+        """
+
+        # init
+        path = os.path.join(self.path(), childName)
 
         # return
-        return [cgp_generic_utils.files._api.entity(path)
-                for path in sorted(filterChildren['directories']) + sorted(filterChildren['files'])]
+        return self._childEntity(path, self._storageBackend().isDirectory(path))
@@ -0,0 +1,699 @@
+"""
+geometry file object library
+"""
+
+# imports python
+import os
+import re
+import json
+import array
+
+# imports local
+from . import _backend, _generic
+
+
+_CHUNK_SIZE = 16 * 1024 * 1024
+_WRITE_BLOCK_SIZE = 65536
+_ELEMENT_PATTERNS = {'v': re.compile(r'\nv[ \t]+([^\n]*)'),
+                     'vt': re.compile(r'\nvt[ \t]+([^\n]*)'),
+                     'vn': re.compile(r'\nvn[ \t]+([^\n]*)'),
+                     'f': re.compile(r'\nf[ \t]+([^\n]*)')}
+_MARKER_PATTERN = re.compile(r'\n(o|g|usemtl|mtllib)[ \t]+([^\n]*?)[ \t\r]*(?=\n)')
+_DIGITS_TABLE = str.maketrans('', '', '0123456789') if hasattr(str, 'maketrans') else None
+_NUMPY = None
+
+
+# GEOMETRY OBJECTS #
+
+
+class ObjMesh(object):
+    """polygon mesh held in flat arrays - the arrays expose the buffer protocol so ``numpy.frombuffer`` wraps them
+
+    indices are 0-based, faces are described by their vertex counts and the flat indices of their corners -
+    uv and normal indices are empty if the mesh has none and -1 for the corners without any
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('points', 'uvs', 'normals',
+                 'faceVertexCounts', 'faceVertexIndices', 'faceUvIndices', 'faceNormalIndices',
+                 'groups', 'materials', 'materialLibraries')
+
+    # INIT #
+
+    def __init__(self, points=None, faceVertexCounts=None, faceVertexIndices=None,
+                 uvs=None, faceUvIndices=None, normals=None, faceNormalIndices=None,
+                 groups=None, materials=None, materialLibraries=None):
+        """ObjMesh class initialization
+
+        :param points: flat x, y, z coordinates of the vertices
+        :type points: list[float] or :class:`array.array`
+
+        :param faceVertexCounts: count of vertices of each face
+        :type faceVertexCounts: list[int] or :class:`array.array`
+
+        :param faceVertexIndices: vertex index of each face corner
+        :type faceVertexIndices: list[int] or :class:`array.array`
+
+        :param uvs: flat u, v coordinates of the uvs
+        :type uvs: list[float] or :class:`array.array`
+
+        :param faceUvIndices: uv index of each face corner
+        :type faceUvIndices: list[int] or :class:`array.array`
+
+        :param normals: flat x, y, z coordinates of the normals
+        :type normals: list[float] or :class:`array.array`
+
+        :param faceNormalIndices: normal index of each face corner
+        :type faceNormalIndices: list[int] or :class:`array.array`
+
+        :param groups: names of the groups/objects and index of their first face - [(name, faceIndex)]
+        :type groups: list[tuple[str, int]]
+
+        :param materials: names of the materials and index of their first face - [(name, faceIndex)]
+        :type materials: list[tuple[str, int]]
+
+        :param materialLibraries: names of the material libraries
+        :type materialLibraries: list[str]
+        """
+
+        # init
+        self.points = array.array('d', points or [])
+        self.uvs = array.array('d', uvs or [])
+        self.normals = array.array('d', normals or [])
+        self.faceVertexCounts = array.array('i', faceVertexCounts or [])
+        self.faceVertexIndices = array.array('i', faceVertexIndices or [])
+        self.faceUvIndices = array.array('i', faceUvIndices or [])
+        self.faceNormalIndices = array.array('i', faceNormalIndices or [])
+        self.groups = list(groups or [])
+        self.materials = list(materials or [])
+        self.materialLibraries = list(materialLibraries or [])
+
+    def __repr__(self):
+        """the representation of the mesh
+
+        :return: the representation of the mesh
+        :rtype: str
+        """
+
+        # return
+        return '{0}({1} vertices, {2} faces)'.format(self.__class__.__name__, self.vertexCount(), self.faceCount())
+
+    # COMMANDS #
+
+    def bounds(self):
+        """the bounding box of the vertices
+
+        :return: the minimum and maximum corners of the bounding box - None if the mesh has no vertex
+        :rtype: tuple[tuple[float, float, float], tuple[float, float, float]]
+        """
+
+        # return
+        return _bounds(self.points)
+
+    def faceCount(self):
+        """the count of faces of the mesh
+
+        :return: the count of faces
+        :rtype: int
+        """
+
+        # return
+        return len(self.faceVertexCounts)
+
+    def vertexCount(self):
+        """the count of vertices of the mesh
+
+        :return: the count of vertices
+        :rtype: int
+        """
+
+        # return
+        return len(self.points) // 3
+
+
+# GEOMETRY FILE OBJECTS #
+
+
+class ObjFile(_generic.File):
+    """file object that manipulates a ``.obj`` file on the file system
+
+    the file is streamed once by chunks and each kind of element is tokenized in bulk into flat arrays -
+    numpy is used to convert the coordinates when available
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ()
+    _extension = 'obj'
+    _signatures = (r'(?:(?:#|mtllib |o |g )[^\n]*\n|\s)*v +-?[\d.]',)
+
+    # OBJECT COMMANDS #
+
+    @classmethod
+    def create(cls, path, content=None, **__):
+        """create an obj file
+
+        :param path: path of the obj file
+        :type path: str
+
+        :param content: content of the obj file - a mesh or the text of the file
+        :type content: :class:`cgp_generic_utils.files.ObjMesh` or str
+
+        :return: the created obj file
+        :rtype: :class:`cgp_generic_utils.files.ObjFile`
+        """
+
+        # errors
+        if not _generic.Path(path).extension() == cls._extension:
+            raise ValueError('{0} is not an ObjFile path'.format(path))
+
+        # init
+        path = os.path.abspath(path)
+
+        # execute
+        with _backend.storageBackend(path).open(path, 'w') as toWrite:
+            if isinstance(content, ObjMesh):
+                for block in _formatMesh(content):
+                    toWrite.write(block)
+            else:
+                toWrite.write(str(content or ''))
+
+        # return
+        return cls(path)
+
+    # COMMANDS #
+
+    def read(self):
+        """read the obj file
+
+        :return: the mesh of the obj file
+        :rtype: :class:`cgp_generic_utils.files.ObjMesh`
+        """
+
+        # init
+        parser = _ObjParser()
+
+        # execute
+        for chunk in self._lineChunks(_CHUNK_SIZE):
+            parser.parse(chunk)
+
+        # return
+        return parser.mesh
+
+    def stats(self, bounds=True):
+        """the statistics of the obj file - elements are counted without being parsed
+
+        :param bounds: ``True`` : the vertices are parsed to get the bounding box - ``False`` : only counts are get
+        :type bounds: bool
+
+        :return: the statistics - {vertices: int, uvs: int, normals: int, faces: int, bounds: tuple}
+        :rtype: dict
+        """
+
+        # init
+        stats = {'vertices': 0, 'uvs': 0, 'normals': 0, 'faces': 0, 'bounds': None}
+        minimum = None
+        maximum = None
+
+        # execute
+        for chunk in self._lineChunks(_CHUNK_SIZE):
+            stats['vertices'] += _countElements(chunk, 'v')
+            stats['uvs'] += _countElements(chunk, 'vt')
+            stats['normals'] += _countElements(chunk, 'vn')
+            stats['faces'] += _countElements(chunk, 'f')
+
+            if bounds:
+                points = array.array('d')
+                _extendFloats(points, _ELEMENT_PATTERNS['v'].findall(chunk), 3)
+                chunkBounds = _bounds(points)
+
+                if chunkBounds:
+                    minimum = list(map(min, zip(minimum, chunkBounds[0]))) if minimum else chunkBounds[0]
+                    maximum = list(map(max, zip(maximum, chunkBounds[1]))) if maximum else chunkBounds[1]
+
+        if minimum:
+            stats['bounds'] = (tuple(minimum), tuple(maximum))
+
+        # return
+        return stats
+
+    def write(self, content):
+        """write the mesh in the obj file
+
+        :param content: content of the obj file - a mesh or the text of the file
+        :type content: :class:`cgp_generic_utils.files.ObjMesh` or str
+        """
+
+        # execute
+        self.create(self.path(), content=content)
+
+
+# PRIVATE OBJECTS #
+
+
+class _ObjParser(object):
+    """parser filling a mesh chunk by chunk
+    """
+
+    # INIT #
+
+    def __init__(self):
+        """_ObjParser class initialization
+        """
+
+        # init
+        self.mesh = ObjMesh()
+
+    # COMMANDS #
+
+    def parse(self, chunk):
+        """parse the chunk of the obj file
+
+        :param chunk: chunk of entire lines starting with a line break
+        :type chunk: str
+        """
+
+        # init
+        mesh = self.mesh
+        facePayloads = _ELEMENT_PATTERNS['f'].findall(chunk)
+
+        # get markers - the index of their first face is the count of faces before them
+        faceIndex = mesh.faceCount()
+        position = 0
+
+        for match in _MARKER_PATTERN.finditer(chunk):
+            faceIndex += _countElements(chunk, 'f', position, match.start())
+            position = match.start()
+            kind, name = match.groups()
+
+            if kind == 'mtllib':
+                mesh.materialLibraries.extend(name.split())
+            else:
+                (mesh.materials if kind == 'usemtl' else mesh.groups).append((name, faceIndex))
+
+        # negative indices are relative to the elements defined before each face so lines are parsed in order
+        if '-' in ''.join(facePayloads):
+            self._parseInOrder(chunk)
+            return
+
+        # parse each kind of element in bulk
+        _extendFloats(mesh.points, _ELEMENT_PATTERNS['v'].findall(chunk), 3)
+        _extendFloats(mesh.uvs, _ELEMENT_PATTERNS['vt'].findall(chunk), 2)
+        _extendFloats(mesh.normals, _ELEMENT_PATTERNS['vn'].findall(chunk), 3)
+        self._parseFaces(facePayloads)
+
+    # PRIVATE COMMANDS #
+
+    def _addCorners(self, counts, vertexIndices, uvIndices, normalIndices):
+        """add faces to the mesh - uv and normal indices are padded with -1 so every corner has one
+
+        :param counts: count of vertices of each face
+        :type counts: list[int]
+
+        :param vertexIndices: vertex index of each corner
+        :type vertexIndices: list[int] or :class:`array.array`
+
+        :param uvIndices: uv index of each corner - None if the faces have no uv
+        :type uvIndices: list[int] or :class:`array.array`
+
+        :param normalIndices: normal index of each corner - None if the faces have no normal
+        :type normalIndices: list[int] or :class:`array.array`
+        """
+
+        # init
+        mesh = self.mesh
+        start = len(mesh.faceVertexIndices)
+
+        # execute
+        mesh.faceVertexCounts.extend(counts)
+        mesh.faceVertexIndices.extend(vertexIndices)
+
+        for indices, target in [(uvIndices, mesh.faceUvIndices), (normalIndices, mesh.faceNormalIndices)]:
+            if indices is None and not target:
+                continue
+
+            if len(target) < start:
+                target.extend([-1] * (start - len(target)))
+
+            target.extend(indices if indices is not None else [-1] * len(vertexIndices))
+
+    def _parseFaces(self, payloads):
+        """parse the faces in bulk when all the corners share the same layout
+
+        :param payloads: content of the face lines without the ``f`` prefix
+        :type payloads: list[str]
+        """
+
+        # return if no face
+        if not payloads:
+            return
+
+        # init
+        counts = list(map(len, map(str.split, payloads)))
+        cornerCount = sum(counts)
+        text = ' '.join(payloads)
+
+        # get the separators of each corner - corners without separator are dropped
+        separators = _deleteDigits(text).split()
+        doubleSlashCount = text.count('//')
+
+        # get corner layout - v, v/vt, v//vn, v/vt/vn - None if the corners don't share the same layout
+        if not separators:
+            layout = (False, False)
+        elif len(separators) != cornerCount or len(set(separators)) != 1:
+            layout = None
+        else:
+            layout = {('/', 0): (True, False),
+                      ('//', cornerCount): (False, True),
+                      ('//', 0): (True, True)}.get((separators[0], doubleSlashCount))
+
+        if layout:
+            stride = 1 + layout[0] + layout[1]
+            indices = array.array('i', map((-1).__add__,
+                                           _toNumbers(text.replace('//', '/').replace('/', ' ').split(), int)))
+
+            if len(indices) == cornerCount * stride:
+                self._addCorners(counts,
+                                 indices[0::stride],
+                                 indices[1::stride] if layout[0] else None,
+                                 indices[stride - 1::stride] if layout[1] else None)
+                return
+
+        # mixed layouts
+        self._addFaces(payloads)
+
+    def _addFaces(self, payloads):
+        """parse the faces corner by corner - handles mixed layouts and negative indices
+
+        :param payloads: content of the face lines without the ``f`` prefix
+        :type payloads: list[str]
+        """
+
+        # init
+        mesh = self.mesh
+        elementCounts = (mesh.vertexCount(), len(mesh.uvs) // 2, len(mesh.normals) // 3)
+        counts = []
+        indices = ([], [], [])
+
+        # execute
+        for payload in payloads:
+            corners = payload.split()
+            counts.append(len(corners))
+
+            for corner in corners:
+                parts = corner.split('/')
+
+                for component in range(3):
+                    value = int(parts[component]) if len(parts) > component and parts[component] else 0
+                    indices[component].append(value - 1 if value > 0
+                                              else elementCounts[component] + value if value < 0
+                                              else -1)
+
+        self._addCorners(counts,
+                         indices[0],
+                         indices[1] if any(index != -1 for index in indices[1]) else None,
+                         indices[2] if any(index != -1 for index in indices[2]) else None)
+
+    def _parseInOrder(self, chunk):
+        """parse the elements line by line in their order in the chunk
+
+        :param chunk: chunk of entire lines starting with a line break
+        :type chunk: str
+        """
+
+        # init
+        mesh = self.mesh
+        targets = {'v': (mesh.points, 3), 'vt': (mesh.uvs, 2), 'vn': (mesh.normals, 3)}
+
+        # execute
+        for line in chunk.split('\n'):
+            kind, _, payload = line.replace('\t', ' ').partition(' ')
+
+            if kind in targets:
+                _extendFloats(targets[kind][0], [payload], targets[kind][1])
+            elif kind == 'f':
+                self._addFaces([payload])
+
+
+# PRIVATE COMMANDS #
+
+
+def _bounds(points):
+    """the bounding box of flat x, y, z coordinates
+
+    :param points: flat coordinates
+    :type points: :class:`array.array`
+
+    :return: the minimum and maximum corners of the bounding box - None if there is no point
+    :rtype: tuple[tuple[float, float, float], tuple[float, float, float]]
+    """
+
+    # return
+    if not points:
+        return None
+
+    return (tuple(min(points[axis::3]) for axis in range(3)),
+            tuple(max(points[axis::3]) for axis in range(3)))
+
+
+def _countElements(chunk, kind, start=0, end=None):
+    """the count of the element lines of the chunk - the prefix of the lines is followed by a space or a tab
+
+    :param chunk: chunk of entire lines starting with a line break
+    :type chunk: str
+
+    :param kind: prefix of the element lines - ``v``, ``vt``, ``vn`` or ``f``
+    :type kind: str
+
+    :param start: index of the chunk the count starts from
+    :type start: int
+
+    :param end: index of the chunk the count ends at - if None, the count ends at the end of the chunk
+    :type end: int
+
+    :return: the count of the element lines
+    :rtype: int
+    """
+
+    # init
+    end = len(chunk) if end is None else end
+
+    # return
+    return chunk.count('\n{0} '.format(kind), start, end) + chunk.count('\n{0}\t'.format(kind), start, end)
+
+
+def _deleteDigits(text):
+    """the text without its digits
+
+    :param text: text to delete the digits from
+    :type text: str
+
+    :return: the text without its digits
+    :rtype: str
+    """
+
+    # return - str.translate takes the characters to delete as second argument on python 2
+    return text.translate(_DIGITS_TABLE) if _DIGITS_TABLE else text.translate(None, '0123456789')
+
+
+def _extendFloats(target, payloads, stride):
+    """convert the coordinates of the element lines and add them to the target
+
+    :param target: array the coordinates are added to
+    :type target: :class:`array.array`
+
+    :param payloads: content of the element lines without their prefix
+    :type payloads: list[str]
+
+    :param stride: count of coordinates kept per element - extra coordinates are ignored, missing ones are 0
+    :type stride: int
+    """
+
+    # return if no element
+    if not payloads:
+        return
+
+    # init
+    text = ' '.join(payloads)
+    numpy = _numpy()
+
+    # convert in bulk with numpy
+    if numpy is not None:
+        values = numpy.fromstring(text, dtype=numpy.float64, sep=' ')
+
+        if len(values) == len(payloads) * stride:
+
+            # frombytes on python 3 - fromstring is removed from python 3.9
+            if hasattr(target, 'frombytes'):
+                target.frombytes(values.tobytes())
+            else:
+                target.fromstring(values.tobytes())
+
+            return
+
+    # convert in bulk
+    tokens = text.split()
+
+    if len(tokens) == len(payloads) * stride:
+        target.extend(_toNumbers(tokens, float))
+        return
+
+    # convert element by element when the count of coordinates varies
+    for payload in payloads:
+        target.extend(map(float, (payload.split() + ['0'] * stride)[:stride]))
+
+
+def _formatMesh(mesh):
+    """the text of the obj file of the mesh by blocks
+
+    :param mesh: mesh to format
+    :type mesh: :class:`cgp_generic_utils.files.ObjMesh`
+
+    :return: the blocks of text
+    :rtype: generator[str]
+    """
+
+    # material libraries
+    if mesh.materialLibraries:
+        yield 'mtllib {0}\n'.format(' '.join(mesh.materialLibraries))
+
+    # elements - formatted by blocks with a single format operation each
+    for prefix, values, stride in [('v', mesh.points, 3), ('vt', mesh.uvs, 2), ('vn', mesh.normals, 3)]:
+        template = prefix + ' %r' * stride + '\n'
+
+        for start in range(0, len(values), _WRITE_BLOCK_SIZE * stride):
+            block = values[start:start + _WRITE_BLOCK_SIZE * stride]
+            yield (template * (len(block) // stride)) % tuple(block)
+
+    # faces - split at the markers
+    markers = sorted([(faceIndex, 'g', name) for name, faceIndex in mesh.groups] +
+                     [(faceIndex, 'usemtl', name) for name, faceIndex in mesh.materials],
+                     key=lambda marker: marker[0])
+    boundaries = sorted(set([0, mesh.faceCount()] + [marker[0] for marker in markers]))
+    offsets = array.array('l', [0])
+    markerIndex = 0
+
+    for count in mesh.faceVertexCounts:
+        offsets.append(offsets[-1] + count)
+
+    for segmentStart, segmentEnd in zip(boundaries, boundaries[1:] + [None]):
+
+        while markerIndex < len(markers) and markers[markerIndex][0] == segmentStart:
+            yield '{0} {1}\n'.format(*markers[markerIndex][1:])
+            markerIndex += 1
+
+        for start in range(segmentStart, segmentEnd or segmentStart, _WRITE_BLOCK_SIZE):
+            yield _formatFaces(mesh, offsets, start, min(start + _WRITE_BLOCK_SIZE, segmentEnd))
+
+
+def _formatCorner(mesh, corner):
+    """the text of the face corner - v, v/vt, v//vn or v/vt/vn
+
+    :param mesh: mesh of the corner
+    :type mesh: :class:`cgp_generic_utils.files.ObjMesh`
+
+    :param corner: index of the face corner
+    :type corner: int
+
+    :return: the text of the face corner
+    :rtype: str
+    """
+
+    # init
+    uvIndex = mesh.faceUvIndices[corner] if mesh.faceUvIndices else -1
+    normalIndex = mesh.faceNormalIndices[corner] if mesh.faceNormalIndices else -1
+
+    # return
+    return '/'.join([str(mesh.faceVertexIndices[corner] + 1),
+                     str(uvIndex + 1) if uvIndex != -1 else '',
+                     str(normalIndex + 1) if normalIndex != -1 else '']).rstrip('/')
+
+
+def _toNumbers(tokens, numberType):
+    """convert the tokens to numbers - the json decoder converts in bulk much faster than a conversion per token
+
+    :param tokens: tokens to convert
+    :type tokens: list[str]
+
+    :param numberType: type of the numbers - used if the tokens are not valid json numbers like ``.5``
+    :type numberType: type
+
+    :return: the numbers
+    :rtype: list[int] or list[float]
+    """
+
+    # return
+    try:
+        return json.loads('[{0}]'.format(','.join(tokens)))
+    except ValueError:
+        return list(map(numberType, tokens))
+
+
+def _formatFaces(mesh, offsets, start, end):
+    """the text of the faces - formatted with a single format operation if the faces share the same layout
+
+    :param mesh: mesh of the faces
+    :type mesh: :class:`cgp_generic_utils.files.ObjMesh`
+
+    :param offsets: index of the first corner of each face
+    :type offsets: :class:`array.array`
+
+    :param start: index of the first face to format
+    :type start: int
+
+    :param end: index after the last face to format
+    :type end: int
+
+    :return: the text of the faces
+    :rtype: str
+    """
+
+    # init
+    counts = mesh.faceVertexCounts[start:end]
+    firstCorner = offsets[start]
+    lastCorner = offsets[end]
+    columns = [mesh.faceVertexIndices[firstCorner:lastCorner]]
+    cornerTemplate = {(False, False): '%d', (True, False): '%d/%d', (False, True): '%d//%d', (True, True): '%d/%d/%d'}
+
+    for indices in [mesh.faceUvIndices, mesh.faceNormalIndices]:
+        if indices:
+            columns.append(indices[firstCorner:lastCorner])
+
+    # format face by face if the faces don't share the same layout
+    if counts.count(counts[0]) != len(counts) or any(-1 in column for column in columns[1:]):
+        return ''.join('f {0}\n'.format(' '.join(_formatCorner(mesh, corner)
+                                                 for corner in range(offsets[faceIndex], offsets[faceIndex + 1])))
+                       for faceIndex in range(start, end))
+
+    # interleave the 1-based indices of the corners
+    values = [None] * (len(columns) * (lastCorner - firstCorner))
+
+    for index, column in enumerate(columns):
+        values[index::len(columns)] = map((1).__add__, column)
+
+    # return
+    template = cornerTemplate[(bool(mesh.faceUvIndices), bool(mesh.faceNormalIndices))]
+    return (('f' + ' ' + ' '.join([template] * counts[0]) + '\n') * len(counts)) % tuple(values)
+
+
+def _numpy():
+    """the numpy module - an optional dependency imported on first use
+
+    :return: the numpy module - None if numpy is not available
+    :rtype: module
+    """
+
+    # init
+    global _NUMPY
+
+    # import numpy here as it is an optional dependency
+    if _NUMPY is None:
+        try:
+            import numpy
+            _NUMPY = numpy
+        except ImportError:
+            _NUMPY = False
+
+    # return
+    return _NUMPY or None
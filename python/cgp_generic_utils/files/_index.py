@@ -0,0 +1,237 @@
+"""
+static symbol index library
+"""
+
+# imports python
+import os
+import json
+import multiprocessing
+
+# imports local
+from . import _backend, _python
+
+
+# INDEX OBJECTS #
+
+
+class SymbolIndex(object):
+    """index of the top-level symbols of the python files of a directory - the files are never imported
+
+    the index is refreshed incrementally by mtime and can be persisted in a ``.json`` file between sessions
+    """
+
+    # INIT #
+
+    def __init__(self, directory, indexFile=None, recursive=True):
+        """SymbolIndex class initialization
+
+        :param directory: directory holding the python files to index
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param indexFile: ``.json`` file where the index is persisted - if None, the index is not persisted
+        :type indexFile: str or :class:`cgp_generic_utils.files.JsonFile`
+
+        :param recursive: ``True`` : the sub directories are indexed - ``False`` : only the directory is indexed
+        :type recursive: bool
+        """
+
+        # init
+        self._directory = os.path.abspath(str(directory))
+        self._indexFile = os.path.abspath(str(indexFile)) if indexFile else None
+        self._recursive = recursive
+        self._entries = {}
+
+        # errors - the python files are parsed by a process pool so they are read from the local file system
+        for entity in [directory, indexFile]:
+            if entity and not _backend.entityBackend(entity).isLocal():
+                raise ValueError('{0} is not on the local file system - SymbolIndex is not supported by its storage '
+                                 'backend'.format(entity))
+
+        if not os.path.isdir(self._directory):
+            raise ValueError('{0} is not an existing directory'.format(self._directory))
+
+        # load the persisted index
+        if self._indexFile and os.path.isfile(self._indexFile):
+            with open(self._indexFile, 'r') as toRead:
+                data = json.load(toRead)
+
+            if data.get('directory') == self._directory:
+                self._entries = data.get('entries', {})
+
+    # COMMANDS #
+
+    def find(self, name):
+        """find the python files defining the top-level symbol
+
+        :param name: name of the symbol to find
+        :type name: str
+
+        :return: the python files defining the symbol - [(path, symbolType)] with symbolType being class or function
+        :rtype: list[tuple[str, str]]
+        """
+
+        # init
+        found = []
+
+        # execute
+        for path in sorted(self._entries):
+            symbols = self._entries[path]['symbols'] or {}
+
+            for symbolType, key in [('class', 'classes'), ('function', 'functions')]:
+                if any(symbol['name'] == name for symbol in symbols.get(key, [])):
+                    found.append((path, symbolType))
+
+        # return
+        return found
+
+    def paths(self):
+        """the paths of the indexed python files
+
+        :return: the paths of the indexed python files
+        :rtype: list[str]
+        """
+
+        # return
+        return sorted(self._entries)
+
+    def refresh(self, processes=None):
+        """refresh the index - only the new or modified python files are parsed
+
+        :param processes: count of processes used to parse the python files - default is the count of cpus
+        :type processes: int
+
+        :return: the paths of the parsed python files
+        :rtype: list[str]
+        """
+
+        # init
+        stats = {}
+        toParse = []
+
+        # get current python files
+        for path in self._pyFiles():
+            stat = os.stat(path)
+            stats[path] = [stat.st_mtime, stat.st_size]
+
+        # remove deleted files
+        for path in list(self._entries):
+            if path not in stats:
+                del self._entries[path]
+
+        # get modified files
+        for path, stat in stats.items():
+            entry = self._entries.get(path)
+            if not entry or [entry['mtime'], entry['size']] != stat:
+                toParse.append(path)
+
+        # parse in parallel if worth it
+        processes = processes or multiprocessing.cpu_count()
+
+        if processes > 1 and len(toParse) > processes:
+            pool = multiprocessing.Pool(processes)
+            try:
+                results = pool.map(_inspect, toParse, chunksize=max(1, len(toParse) // (processes * 4)))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_inspect(path) for path in toParse]
+
+        # update entries
+        for path, symbols, error in results:
+            self._entries[path] = {'mtime': stats[path][0],
+                                   'size': stats[path][1],
+                                   'symbols': symbols,
+                                   'error': error}
+
+        # save
+        if self._indexFile and (toParse or not os.path.isfile(self._indexFile)):
+            self.save()
+
+        # return
+        return sorted(toParse)
+
+    def save(self):
+        """save the index in its ``.json`` file
+        """
+
+        # errors
+        if not self._indexFile:
+            raise RuntimeError('no index file specified to save the index in')
+
+        # execute - write in a temporary file first so concurrent readers never get a partial index
+        temporaryPath = '{0}.{1}.tmp'.format(self._indexFile, os.getpid())
+
+        with open(temporaryPath, 'w') as toWrite:
+            json.dump({'directory': self._directory, 'entries': self._entries}, toWrite)
+
+        if os.path.isfile(self._indexFile):
+            os.remove(self._indexFile)
+
+        os.rename(temporaryPath, self._indexFile)
+
+    def symbols(self, path):
+        """the top-level symbols of the indexed python file
+
+        :param path: path of the indexed python file
+        :type path: str or :class:`cgp_generic_utils.files.PyFile`
+
+        :return: the symbols of the python file - {docstring: str, all: list, classes: list, functions: list}
+        :rtype: dict
+        """
+
+        # init
+        path = os.path.abspath(str(path))
+
+        # errors
+        if path not in self._entries:
+            raise ValueError('{0} is not an indexed python file'.format(path))
+
+        if self._entries[path]['error']:
+            raise ValueError('{0} can\'t be parsed - {1}'.format(path, self._entries[path]['error']))
+
+        # return
+        return self._entries[path]['symbols']
+
+    # PRIVATE COMMANDS #
+
+    def _pyFiles(self):
+        """the python files of the indexed directory
+
+        :return: the paths of the python files
+        :rtype: list[str]
+        """
+
+        # init
+        paths = []
+
+        # execute
+        for root, directories, files in os.walk(self._directory):
+
+            paths.extend(os.path.join(root, fileName) for fileName in files if fileName.endswith('.py'))
+
+            if not self._recursive:
+                break
+
+        # return
+        return paths
+
+
+# PRIVATE COMMANDS #
+
+
+def _inspect(path):
+    """inspect the python file - module level to be picklable by the process pool
+
+    :param path: path of the python file
+    :type path: str
+
+    :return: the path, the symbols and the parse error of the python file
+    :rtype: tuple[str, dict, str]
+    """
+
+    # return - ast raises a ValueError on python 3 if the source holds null bytes
+    try:
+        return path, _python.PyFile(path).symbols(), None
+    except (SyntaxError, TypeError, ValueError, IOError) as error:
+        return path, None, str(error)
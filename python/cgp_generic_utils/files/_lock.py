@@ -0,0 +1,365 @@
+"""
+inter-process file locking library
+"""
+
+# imports python
+import os
+import time
+import errno
+import socket
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+_PROCESS_LOCKS = {}
+_PROCESS_LOCKS_LOCK = threading.Lock()
+
+
+# LOCK OBJECTS #
+
+
+class FileLock(object):
+    """advisory lock of a file shared between threads, processes and hosts - also usable as a context
+
+    locks are taken with ``fcntl.lockf`` on a ``.flock`` file next to the locked file - on systems without fcntl or on
+    network shares not supporting it, a ``.lock`` file is created exclusively instead and holds the host, the pid and
+    the time of its owner so stale locks left by dead processes are detected and broken
+
+    fcntl locks belong to the whole process, so the locks of a process on the same file go through a single shared lock
+    that excludes its threads - the ``.flock`` file is removed when an exclusive lock is released, it is only left
+    next to the locked file after a shared lock
+    """
+
+    # INIT #
+
+    def __init__(self, path, exclusive=True, timeout=None, staleAge=3600.0, useLockFile=False):
+        """FileLock class initialization
+
+        :param path: path of the file to lock
+        :type path: str or :class:`cgp_generic_utils.files.File`
+
+        :param exclusive: ``True`` : exclusive lock for writers - ``False`` : shared lock for readers -
+                          lock files are always exclusive
+        :type exclusive: bool
+
+        :param timeout: seconds to wait for the lock - 0 doesn't wait - if None, waits until the lock is acquired
+        :type timeout: float
+
+        :param staleAge: seconds after which a lock file is considered stale - if None, only dead owners are stale
+        :type staleAge: float
+
+        :param useLockFile: ``True`` : a lock file is used - needed on network shares not supporting fcntl -
+                            ``False`` : fcntl is used when available
+        :type useLockFile: bool
+        """
+
+        # init
+        self._path = os.path.abspath(str(path))
+        self._exclusive = exclusive
+        self._timeout = timeout
+        self._staleAge = staleAge
+        self._useLockFile = useLockFile or fcntl is None
+        self._isLocked = False
+
+    def __enter__(self):
+        """enter FileLock context
+        """
+
+        # execute
+        self.acquire()
+
+        # return
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """exit FileLock context
+        """
+
+        # execute
+        self.release()
+
+    def __repr__(self):
+        """the representation of the lock
+
+        :return: the representation of the lock
+        :rtype: str
+        """
+
+        # return
+        return '{0}(\'{1}\', exclusive={2})'.format(self.__class__.__name__, self._path, self._exclusive)
+
+    # COMMANDS #
+
+    def acquire(self):
+        """acquire the lock - waits until the lock is acquired or the timeout is reached
+        """
+
+        # errors
+        if self._isLocked:
+            raise RuntimeError('{0} is already locked by this lock'.format(self._path))
+
+        # init
+        startTime = time.time()
+        delay = 0.005
+
+        # execute - retry with an exponential backoff
+        while not self._acquireProcessLock():
+
+            if self._timeout is not None and time.time() - startTime >= self._timeout:
+                raise RuntimeError('{0} can\'t be locked within {1} seconds'.format(self._path, self._timeout))
+
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        self._isLocked = True
+
+    def isLocked(self):
+        """check if the lock is acquired
+
+        :return: ``True`` : the lock is acquired - ``False`` : the lock is released
+        :rtype: bool
+        """
+
+        # return
+        return self._isLocked
+
+    def lockPath(self):
+        """the path of the file holding the lock
+
+        :return: the path of the lock file
+        :rtype: str
+        """
+
+        # return
+        return '{0}.{1}'.format(self._path, 'lock' if self._useLockFile else 'flock')
+
+    def release(self):
+        """release the lock
+        """
+
+        # return if not locked
+        if not self._isLocked:
+            return
+
+        # execute - the lock of the process is released with its last holder
+        with _PROCESS_LOCKS_LOCK:
+            processLock = _PROCESS_LOCKS[self.lockPath()]
+            processLock.holders -= 1
+
+            if not processLock.holders:
+                del _PROCESS_LOCKS[self.lockPath()]
+
+                # the .flock file is removed while still locked, so the processes waiting for it lock it again once
+                # created anew - it is kept after a shared lock as other processes may still share it
+                if self._useLockFile or processLock.exclusive:
+                    try:
+                        os.remove(self.lockPath())
+                    except OSError:
+                        pass
+
+                if processLock.fileObject is not None:
+                    fcntl.lockf(processLock.fileObject, fcntl.LOCK_UN)
+                    processLock.fileObject.close()
+
+        self._isLocked = False
+
+    # PRIVATE COMMANDS #
+
+    def _acquireFcntl(self):
+        """try to acquire the lock with fcntl - the kernel releases it if the owner dies so it is never stale
+
+        :return: the file object holding the lock - None if the lock is owned by another process
+        :rtype: file
+        """
+
+        # init
+        fileObject = open(self.lockPath(), 'a+')
+
+        # execute
+        try:
+            fcntl.lockf(fileObject, (fcntl.LOCK_EX if self._exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        except IOError as error:
+            fileObject.close()
+            if error.errno not in [errno.EACCES, errno.EAGAIN]:
+                raise
+            return None
+
+        # the lock file may have been removed by its previous owner meanwhile - the new lock file is locked instead
+        try:
+            isLockFile = os.path.samestat(os.fstat(fileObject.fileno()), os.stat(self.lockPath()))
+        except OSError:
+            isLockFile = False
+
+        if not isLockFile:
+            fileObject.close()
+            return None
+
+        # return
+        return fileObject
+
+    def _acquireLockFile(self):
+        """try to acquire the lock by creating the lock file exclusively - stale lock files are broken
+
+        :return: ``True`` : the lock is acquired - ``False`` : the lock is owned by another process
+        :rtype: bool
+        """
+
+        # execute
+        try:
+            descriptor = os.open(self.lockPath(), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+            owner = self._staleOwner()
+            if owner is not None:
+                self._breakLockFile(owner)
+            return False
+
+        # write owner
+        with os.fdopen(descriptor, 'w') as toWrite:
+            toWrite.write('{0} {1} {2}'.format(socket.gethostname(), os.getpid(), time.time()))
+
+        # return
+        return True
+
+    def _acquireProcessLock(self):
+        """try to acquire the lock shared by the locks of the process on the same file - its first holder acquires the
+        lock from the other processes, shared locks of the process share it while exclusive locks wait for its release
+
+        :return: ``True`` : the lock is acquired - ``False`` : the lock is owned by another thread or process
+        :rtype: bool
+        """
+
+        # execute
+        with _PROCESS_LOCKS_LOCK:
+            processLock = _PROCESS_LOCKS.get(self.lockPath())
+
+            # owned by other locks of the process
+            if processLock:
+                if self._exclusive or processLock.exclusive:
+                    return False
+
+                processLock.holders += 1
+                return True
+
+            # acquire from the other processes
+            if self._useLockFile:
+                if not self._acquireLockFile():
+                    return False
+                fileObject = None
+
+            else:
+                fileObject = self._acquireFcntl()
+                if fileObject is None:
+                    return False
+
+            _PROCESS_LOCKS[self.lockPath()] = _ProcessLock(self._exclusive, fileObject)
+
+        # return
+        return True
+
+    def _breakLockFile(self, owner):
+        """break the stale lock file - renamed first so only one process breaks it, the lock is then acquired again by
+        creating the lock file exclusively
+
+        :param owner: content of the lock file detected as stale
+        :type owner: str
+        """
+
+        # init
+        brokenPath = '{0}.{1}.{2}.broken'.format(self.lockPath(), socket.gethostname(), os.getpid())
+
+        # execute
+        try:
+            os.rename(self.lockPath(), brokenPath)
+        except OSError:
+            return
+
+        # restore the lock file if another process took the lock in between - created exclusively so a lock file
+        # created by a third process meanwhile is never overwritten
+        try:
+            with open(brokenPath, 'r') as toRead:
+                content = toRead.read()
+
+            if content != owner:
+                descriptor = os.open(self.lockPath(), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+
+                with os.fdopen(descriptor, 'w') as toWrite:
+                    toWrite.write(content)
+
+        except (IOError, OSError):
+            pass
+
+        finally:
+            os.remove(brokenPath)
+
+    def _staleOwner(self):
+        """the owner of the lock file if it is stale
+
+        :return: the content of the lock file if stale - None if the lock file is owned by a living process
+        :rtype: str
+        """
+
+        # get owner
+        try:
+            with open(self.lockPath(), 'r') as toRead:
+                owner = toRead.read()
+            lockTime = os.path.getmtime(self.lockPath())
+        except (IOError, OSError):
+            return None
+
+        try:
+            host, pid, lockTime = owner.split()
+            pid = int(pid)
+            lockTime = float(lockTime)
+        except ValueError:
+            # owner not written yet or corrupted lock file - rely on the mtime of the lock file
+            host, pid = None, None
+
+        # stale by age
+        if self._staleAge is not None and time.time() - lockTime > self._staleAge:
+            return owner
+
+        # stale if the owner is a dead process of this host - os.kill would terminate the process on windows
+        if host == socket.gethostname() and pid and os.name != 'nt':
+            try:
+                os.kill(pid, 0)
+            except OSError as error:
+                if error.errno == errno.ESRCH:
+                    return owner
+
+        # return
+        return None
+
+
+# PRIVATE OBJECTS #
+
+
+class _ProcessLock(object):
+    """lock of a file shared by the locks of the process - holds the fcntl lock of the process on the file
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('exclusive', 'fileObject', 'holders')
+
+    # INIT #
+
+    def __init__(self, exclusive, fileObject):
+        """_ProcessLock class initialization
+
+        :param exclusive: ``True`` : exclusive lock - ``False`` : shared lock
+        :type exclusive: bool
+
+        :param fileObject: file object holding the fcntl lock - None if a lock file is used
+        :type fileObject: file
+        """
+
+        # init
+        self.exclusive = exclusive
+        self.fileObject = fileObject
+        self.holders = 1
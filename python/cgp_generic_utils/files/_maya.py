@@ -0,0 +1,627 @@
+"""
+maya file object library - scans maya scene files without maya
+"""
+
+# imports python
+import os
+import re
+import struct
+
+# imports local
+import cgp_generic_utils.python._compat
+from . import _generic
+
+
+_CHUNK_SIZE = 16 * 1024 * 1024
+_STRING = r'"(?:[^"\\\n]|\\.)*"'
+_STATEMENT_PATTERN = re.compile(r'\n(?:(createNode|requires|file|fileInfo|select)\s((?:[^;"]|{0})*);'
+                                r'|\t+setAttr\s(?=[^;]*?-type\s+"string")((?:[^;"(]|{0}|\((?:[^;"()]|{0})*\))*);)'
+                                .format(_STRING))
+_HEADER_PATTERN = re.compile(r'\n//(?:Maya ASCII (\S+) scene|Name: ([^\r\n]*)|Last modified: ([^\r\n]*)'
+                             r'|Codeset: ([^\r\n]*))')
+_TOKEN_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"|([^\s"()+]+)')
+_ESCAPE_PATTERN = re.compile(r'\\(.)')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+_PATH_PATTERN = re.compile(r'(?![a-zA-Z][\w+.-]*://)[^\n]*[/\\][^/\\\n]*\.\w{1,8}$')
+_COPY_NUMBER_PATTERN = re.compile(r'\{\d+\}$')
+_IFF_LAYOUTS = {'FOR4': (struct.Struct('>4sL'), 4),
+                'FOR8': (struct.Struct('>4s4xQ'), 8)}
+_IFF_GROUPS = frozenset(['FORM', 'FOR4', 'FOR8', 'LIST', 'LIS4', 'LIS8',
+                         'CAT ', 'CAT4', 'CAT8', 'PROP', 'PRO4', 'PRO8'])
+
+
+# MAYA OBJECTS #
+
+
+class MbChunk(object):
+    """chunk of the IFF structure of a maya binary file - only its location is held, its data is read on demand
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('tag', 'formType', 'offset', 'size', '_alignment')
+
+    # INIT #
+
+    def __init__(self, tag, formType, offset, size, alignment):
+        """MbChunk class initialization
+
+        :param tag: tag of the chunk - ``FOR4``, ``VERS`` ...
+        :type tag: str
+
+        :param formType: type of the group chunk - ``None`` if the chunk is a data chunk
+        :type formType: str
+
+        :param offset: offset in bytes of the data of the chunk in the file
+        :type offset: int
+
+        :param size: size in bytes of the data of the chunk
+        :type size: int
+
+        :param alignment: alignment in bytes of the chunks of the file
+        :type alignment: int
+        """
+
+        # init
+        self.tag = tag
+        self.formType = formType
+        self.offset = offset
+        self.size = size
+        self._alignment = alignment
+
+    def __repr__(self):
+        """the representation of the chunk
+
+        :return: the representation of the chunk
+        :rtype: str
+        """
+
+        # return
+        return '{0}({1!r}, {2!r}, {3}, {4})'.format(type(self).__name__,
+                                                    self.tag, self.formType, self.offset, self.size)
+
+    # COMMANDS #
+
+    def isGroup(self):
+        """check if the chunk is a group chunk holding other chunks
+
+        :return: ``True`` : the chunk is a group chunk - ``False`` : the chunk is a data chunk
+        :rtype: bool
+        """
+
+        # return
+        return self.formType is not None
+
+    # PRIVATE COMMANDS #
+
+    def _childrenRange(self):
+        """the range of the file holding the children of the group chunk
+
+        :return: the offsets of the start and the end of the children - (start, end)
+        :rtype: tuple[int, int]
+        """
+
+        # return - the children follow the form type, realigned
+        return _align(self.offset + 4, self._alignment), self.offset + self.size
+
+
+# MAYA FILE OBJECTS #
+
+
+class MaFile(_generic.File):
+    """file object that manipulates a ``.ma`` file on the file system
+
+    the scene is streamed by chunks and only the statements describing its structure are tokenized -
+    the data blocks of the other statements are skipped without being parsed
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ()
+    _extension = 'ma'
+    _signatures = (r'//Maya ASCII',)
+
+    # COMMANDS #
+
+    def dependencies(self):
+        """the external files the maya ascii file depends on - the referenced files and the file paths of its
+        string attributes such as textures and caches
+
+        relative paths are resolved from the directory of the scene, environment variables are expanded and
+        tokens such as ``<UDIM>`` or ``####`` are kept as they are
+
+        :return: the absolute paths of the external files
+        :rtype: list[str]
+        """
+
+        # init
+        scan = self.scan()
+
+        # return
+        return _externalPaths([reference['path'] for reference in scan['references']] +
+                              [value for _, _, value in scan['strings'] if _PATH_PATTERN.match(value)],
+                              os.path.dirname(self.path()))
+
+    def scan(self):
+        """scan the maya ascii file
+
+        the scan holds :
+
+        - header : {version: str, name: str, lastModified: str, codeset: str}
+        - requires : the required plugins - [(plugin, version)]
+        - references : the referenced files - [{path, namespace, referenceNode, type, deferred}]
+        - nodes : the created nodes - [(type, name, parent)]
+        - strings : the string attributes set on the nodes - [(node, attribute, value)]
+        - fileInfo : {key: value}
+
+        :return: the scan of the maya ascii file
+        :rtype: dict
+        """
+
+        # init
+        scan = {'header': {}, 'requires': [], 'references': [], 'nodes': [], 'strings': [], 'fileInfo': {}}
+        node = None
+
+        # execute
+        for chunk in _statementChunks(self._lineChunks(_CHUNK_SIZE)):
+
+            # get header - written on the first lines of the file
+            if not scan['header']:
+                scan['header'] = {'version': None, 'name': None, 'lastModified': None, 'codeset': None}
+                for match in _HEADER_PATTERN.finditer(chunk, 0, 4096):
+                    for key, value in zip(('version', 'name', 'lastModified', 'codeset'), match.groups()):
+                        if value is not None:
+                            scan['header'][key] = value
+
+            # get statements
+            for command, arguments, setAttrArguments in _STATEMENT_PATTERN.findall(chunk):
+                if not command:
+                    tokens = _tokens(setAttrArguments)
+                    strings = [token for token, isString in tokens if isString]
+                    if len(strings) > 2:
+                        scan['strings'].append((node, strings[0], ''.join(strings[2:])))
+                    continue
+
+                tokens = _tokens(arguments)
+
+                if command == 'createNode':
+                    node = _flagValue(tokens, '-n')
+                    scan['nodes'].append((tokens[0][0], node, _flagValue(tokens, '-p')))
+
+                elif command == 'select':
+                    node = _flagValue(tokens, '-ne')
+
+                elif command == 'requires':
+                    positionals = [token for index, (token, isString) in enumerate(tokens)
+                                   if (isString or not token.startswith('-')) and
+                                   not (index and tokens[index - 1] in (('-nodeType', False), ('-dataType', False)))]
+                    if len(positionals) == 2:
+                        scan['requires'].append(tuple(positionals))
+
+                elif command == 'fileInfo':
+                    if len(tokens) == 2:
+                        scan['fileInfo'][tokens[0][0]] = tokens[1][0]
+
+                elif ('-r', False) in tokens:
+                    scan['references'].append({'path': tokens[-1][0],
+                                               'namespace': _flagValue(tokens, '-ns'),
+                                               'referenceNode': _flagValue(tokens, '-rfn'),
+                                               'type': _flagValue(tokens, '-typ'),
+                                               'deferred': _flagValue(tokens, '-dr') == '1'})
+
+        # return
+        return scan
+
+
+class MbFile(_generic.File):
+    """file object that manipulates a ``.mb`` file on the file system
+
+    the IFF chunks of the scene are walked lazily - the chunks that are not needed are skipped by seeking over them
+    so the metadata of the scene is get without reading its bulk
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ()
+    _extension = 'mb'
+    _signatures = (r'FOR4.{4}Maya', r'FOR8.{12}Maya')
+
+    # COMMANDS #
+
+    def chunkData(self, chunk):
+        """the data of the chunk of the maya binary file
+
+        :param chunk: the chunk to get the data of
+        :type chunk: :class:`cgp_generic_utils.files.MbChunk`
+
+        :return: the data of the chunk
+        :rtype: bytes
+        """
+
+        # execute
+        with self._storageBackend().open(self.path(), 'rb') as toRead:
+            toRead.seek(chunk.offset)
+            data = toRead.read(chunk.size)
+
+        # return
+        return data
+
+    def chunks(self, parent=None):
+        """iterate over the chunks of the maya binary file - the data of the chunks is not read
+
+        :param parent: group chunk to get the children of - if not specified, the top level chunks are get
+        :type parent: :class:`cgp_generic_utils.files.MbChunk`
+
+        :return: the chunks
+        :rtype: generator[:class:`cgp_generic_utils.files.MbChunk`]
+        """
+
+        # errors
+        if parent is not None and not parent.isGroup():
+            raise ValueError('{0} is not a group chunk'.format(parent))
+
+        # execute
+        with self._storageBackend().open(self.path(), 'rb') as toRead:
+            layout = _iffLayout(toRead, self.path())
+            start, end = parent._childrenRange() if parent is not None else (0, None)
+
+            for chunk in _iffChunks(toRead, layout, start, end):
+                yield chunk
+
+    def dependencies(self):
+        """the external files the maya binary file depends on - only the referenced files as the attributes of
+        the nodes are not scanned
+
+        relative paths are resolved from the directory of the scene and environment variables are expanded
+
+        :return: the absolute paths of the external files
+        :rtype: list[str]
+        """
+
+        # return
+        return _externalPaths([reference['path'] for reference in self.scan()['references']],
+                              os.path.dirname(self.path()))
+
+    def scan(self):
+        """scan the maya binary file - the scan stops at the first node so only the start of the file is read
+
+        the scan holds :
+
+        - header : {version: str, lastModified: str}
+        - requires : the required plugins - [(plugin, version)]
+        - references : the referenced files - [{path}]
+        - fileInfo : {key: value}
+
+        :return: the scan of the maya binary file
+        :rtype: dict
+        """
+
+        # init
+        scan = {'header': {'version': None, 'lastModified': None}, 'requires': [], 'references': [], 'fileInfo': {}}
+
+        # execute
+        with self._storageBackend().open(self.path(), 'rb') as toRead:
+            layout = _iffLayout(toRead, self.path())
+            root = next(_iffChunks(toRead, layout, 0, None), None)
+
+            # errors
+            if root is None or root.formType != 'Maya':
+                raise ValueError('{0} is not a maya binary file'.format(self.path()))
+
+            for chunk in _iffChunks(toRead, layout, *root._childrenRange()):
+
+                # header
+                if chunk.formType == 'HEAD':
+                    for child in _iffChunks(toRead, layout, *chunk._childrenRange()):
+                        if child.tag not in ('VERS', 'CHNG', 'PLUG', 'FINF'):
+                            continue
+
+                        toRead.seek(child.offset)
+                        strings = cgp_generic_utils.python._compat.toText(toRead.read(child.size)).split('\0')
+
+                        if child.tag == 'VERS':
+                            scan['header']['version'] = strings[0]
+                        elif child.tag == 'CHNG':
+                            scan['header']['lastModified'] = strings[0]
+                        elif child.tag == 'PLUG' and len(strings) > 1:
+                            scan['requires'].append((strings[0], strings[1]))
+                        elif len(strings) > 1:
+                            scan['fileInfo'][strings[0]] = strings[1]
+
+                # references
+                elif chunk.tag == 'FREF':
+                    toRead.seek(chunk.offset)
+                    data = cgp_generic_utils.python._compat.toText(toRead.read(chunk.size))
+                    scan['references'].append({'path': data.split('\0')[0]})
+
+                # nodes - written after the header and the references
+                elif chunk.isGroup():
+                    break
+
+        # return
+        return scan
+
+
+# COMMANDS #
+
+
+def scanMaFiles(directory, recursive=False, processes=None):
+    """scan the maya ascii files of the directory - the files are scanned in parallel
+
+    :param directory: directory holding the maya ascii files to scan
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :param recursive: ``True`` : the maya ascii files of the sub directories are scanned -
+                      ``False`` : only the maya ascii files of the directory are scanned
+    :type recursive: bool
+
+    :param processes: count of processes used to scan the maya ascii files - default is the count of cpus
+    :type processes: int
+
+    :return: the scans of the maya ascii files - {path: scan}
+    :rtype: dict
+    """
+
+    # init
+    directory = str(directory)
+    toScan = []
+
+    # errors
+    if not os.path.isdir(directory):
+        raise ValueError('{0} is not an existing directory'.format(directory))
+
+    # get the maya ascii files
+    for root, _, fileNames in os.walk(directory):
+
+        for fileName in sorted(fileNames):
+            if fileName.endswith('.{0}'.format(MaFile._extension)):
+                toScan.append(os.path.abspath(os.path.join(root, fileName)))
+
+        if not recursive:
+            break
+
+    # import multiprocessing here as it is only needed to scan in parallel
+    import multiprocessing
+
+    # scan in parallel if worth it
+    processes = processes or multiprocessing.cpu_count()
+
+    if processes > 1 and len(toScan) > 1:
+        pool = multiprocessing.Pool(min(processes, len(toScan)))
+        try:
+            scans = pool.map(_scan, toScan, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        scans = [_scan(path) for path in toScan]
+
+    # return
+    return dict(zip(toScan, scans))
+
+
+# PRIVATE COMMANDS #
+
+
+def _align(value, alignment):
+    """align the value on the next multiple of the alignment
+
+    :param value: value to align
+    :type value: int
+
+    :param alignment: alignment
+    :type alignment: int
+
+    :return: the aligned value
+    :rtype: int
+    """
+
+    # return
+    return (value + alignment - 1) // alignment * alignment
+
+
+def _externalPaths(paths, directory):
+    """the absolute paths of the external files referenced by a scene - duplicates are removed
+
+    :param paths: the paths as written in the scene
+    :type paths: list[str]
+
+    :param directory: directory of the scene - relative paths are resolved from it
+    :type directory: str
+
+    :return: the absolute paths
+    :rtype: list[str]
+    """
+
+    # init
+    externalPaths = []
+    seen = set()
+
+    # execute
+    for path in paths:
+        path = os.path.expanduser(os.path.expandvars(_COPY_NUMBER_PATTERN.sub('', path.strip())))
+
+        if not path:
+            continue
+
+        path = os.path.normpath(os.path.join(directory, path))
+
+        if path not in seen:
+            seen.add(path)
+            externalPaths.append(path)
+
+    # return
+    return externalPaths
+
+
+def _flagValue(tokens, flag):
+    """the value of the flag of the statement
+
+    :param tokens: the tokens of the statement
+    :type tokens: list[tuple[str, bool]]
+
+    :param flag: the flag to get the value of
+    :type flag: str
+
+    :return: the value of the flag - ``None`` if the statement doesn't have the flag
+    :rtype: str
+    """
+
+    # execute
+    for index, (token, isString) in enumerate(tokens[:-1]):
+        if token == flag and not isString:
+            return tokens[index + 1][0]
+
+    # return
+    return None
+
+
+def _iffChunks(stream, layout, start, end):
+    """iterate over the chunks of the range of the IFF stream - the data of the chunks is skipped by seeking
+
+    :param stream: the IFF stream
+    :type stream: file
+
+    :param layout: the header structure and the alignment of the chunks
+    :type layout: tuple[:class:`struct.Struct`, int]
+
+    :param start: offset of the first chunk
+    :type start: int
+
+    :param end: offset of the end of the range - if ``None``, the chunks are iterated until the end of the stream
+    :type end: int
+
+    :return: the chunks
+    :rtype: generator[:class:`cgp_generic_utils.files.MbChunk`]
+    """
+
+    # init
+    header, alignment = layout
+    offset = start
+
+    # execute
+    while end is None or offset + header.size <= end:
+        stream.seek(offset)
+        data = stream.read(header.size)
+
+        if len(data) < header.size:
+            break
+
+        tag, size = header.unpack(data)
+        tag = cgp_generic_utils.python._compat.toText(tag)
+        formType = cgp_generic_utils.python._compat.toText(stream.read(4)) if tag in _IFF_GROUPS else None
+
+        yield MbChunk(tag, formType, offset + header.size, size, alignment)
+
+        offset = _align(offset + header.size + size, alignment)
+
+
+def _iffLayout(stream, path):
+    """the layout of the IFF stream - 32 bits or 64 bits chunks
+
+    :param stream: the IFF stream
+    :type stream: file
+
+    :param path: path of the file of the stream
+    :type path: str
+
+    :return: the header structure and the alignment of the chunks
+    :rtype: tuple[:class:`struct.Struct`, int]
+    """
+
+    # init
+    stream.seek(0)
+    layout = _IFF_LAYOUTS.get(cgp_generic_utils.python._compat.toText(stream.read(4)))
+
+    # errors
+    if layout is None:
+        raise ValueError('{0} is not a maya binary file'.format(path))
+
+    # return
+    return layout
+
+
+def _scan(path):
+    """scan the maya ascii file - module level to be picklable by the process pool
+
+    :param path: path of the maya ascii file
+    :type path: str
+
+    :return: the scan of the maya ascii file
+    :rtype: dict
+    """
+
+    # return
+    return MaFile(path).scan()
+
+
+def _statementChunks(chunks):
+    """the chunks of entire statements - maya wraps long statements on lines starting with two tabs, so the last
+    statement of each chunk is moved to the next chunk
+
+    :param chunks: chunks of entire lines starting with a line break
+    :type chunks: iterable[str]
+
+    :return: the chunks of entire statements starting with a line break
+    :rtype: generator[str]
+    """
+
+    # init
+    pending = ''
+
+    # execute
+    for chunk in chunks:
+        chunk = pending + chunk[1:] if pending else chunk
+
+        # get the start of the last statement - the line break of the last line that is not wrapped
+        position = chunk.rfind('\n', 0, len(chunk) - 1)
+
+        while position > 0 and chunk.startswith('\t\t', position + 1):
+            position = chunk.rfind('\n', 0, position)
+
+        if position > 0:
+            yield chunk[:position + 1]
+
+        pending = chunk[max(position, 0):]
+
+    if pending:
+        yield pending
+
+
+def _tokens(arguments):
+    """the tokens of the arguments of a statement - strings are unquoted and unescaped
+
+    :param arguments: the arguments of the statement
+    :type arguments: str
+
+    :return: the tokens - (token, isString)
+    :rtype: list[tuple[str, bool]]
+    """
+
+    # init
+    tokens = []
+
+    # execute
+    for match in _TOKEN_PATTERN.finditer(arguments):
+        if match.lastindex == 1:
+            token = match.group(1)
+            tokens.append((_ESCAPE_PATTERN.sub(_unescape, token) if '\\' in token else token, True))
+        else:
+            tokens.append((match.group(2), False))
+
+    # return
+    return tokens
+
+
+def _unescape(match):
+    """the character escaped in a maya string
+
+    :param match: the match of the escape sequence
+    :type match: :class:`re.MatchObject`
+
+    :return: the escaped character
+    :rtype: str
+    """
+
+    # return
+    return _ESCAPES.get(match.group(1), match.group(1))
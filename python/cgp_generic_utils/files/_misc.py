@@ -4,10 +4,17 @@ miscellaneous file object library
 
 # imports python
 import os
+import re
+import hashlib
 
 # imports local
 import cgp_generic_utils.constants
-from . import _generic, _python
+import cgp_generic_utils.python._compat
+from . import _backend, _generic, _python, _uiLoader
+
+
+_HASH_HEADER = '# cgp_generic_utils - ui hash : '
+_WIDGET_PATTERN = None
 
 
 # MISC FILE OBJECTS #
@@ -19,6 +26,7 @@ class TxtFile(_generic.File):
 
     # ATTRIBUTES #
 
+    __slots__ = ()
     _extension = 'txt'
 
 
@@ -28,7 +36,9 @@ class UiFile(_generic.File):
 
     # ATTRIBUTES #
 
+    __slots__ = ()
     _extension = 'ui'
+    _signatures = (r'\s*<\?xml[^>]*\?>\s*<ui\b',)
 
     # OBJECT COMMANDS #
 
@@ -73,7 +83,9 @@ class UiFile(_generic.File):
                       </ui>"""
 
         # execute
-        with open(path, 'w') as toWrite:
+        path = os.path.abspath(path)
+
+        with _backend.storageBackend(path).open(path, 'w') as toWrite:
             toWrite.write(str(content))
 
         # return
@@ -81,48 +93,231 @@ class UiFile(_generic.File):
 
     # COMMANDS #
 
-    def compile(self, targetDirectory=None):
-        """compile the ui file
+    def compile(self, targetDirectory=None, force=False):
+        """compile the ui file - skipped if the compiled file is up to date
 
         :param targetDirectory: directory of the compiled Ui - if not specified, command will use the UiFile directory
         :type targetDirectory: str or :class:`cgp_generic_utils.files.Directory`
 
+        :param force: ``True`` : the ui file is compiled even if up to date - ``False`` : up to date files are skipped
+        :type force: bool
+
         :return: the compiled file
         :rtype: :class:`cgp_generic_utils.files.PyFile`
         """
 
+        # init
+        compiledFile = self.compiledPath(targetDirectory=targetDirectory)
+
+        # return if up to date
+        if not force and self.isCompiled(targetDirectory=targetDirectory):
+            return _python.PyFile(compiledFile)
+
         # import qt lib here to avoid import issue in batch mode
         import pyside2uic
-        import cgp_generic_utils.qt
 
-        # set target directory if not specified
-        targetDirectory = str(targetDirectory) or self.directory().path()
+        # compile in memory
+        with self._storageBackend().open(self.path(), 'r') as srcFile:
+            source = srcFile.read()
+
+        stream = cgp_generic_utils.python._compat.StringIO()
+        pyside2uic.compileUi(cgp_generic_utils.python._compat.StringIO(source), stream)
+
+        # get compiled content
+        content = stream.getvalue().replace('from PySide2 import QtCore, QtGui, QtWidgets',
+                                            'from PySide2 import QtCore, QtGui, QtWidgets\n'
+                                            'import cgp_generic_utils.qt', 1)
+
+        content = _widgetPattern().sub(r'cgp_generic_utils.qt.\1', content)
+
+        # write compiled file
+        sourceHash = hashlib.md5(cgp_generic_utils.python._compat.toBytes(source)).hexdigest()
+
+        with _backend.storageBackend(compiledFile).open(compiledFile, 'w') as tgtFile:
+            tgtFile.write('{0}{1}\n'.format(_HASH_HEADER, sourceHash))
+            tgtFile.write(content)
+
+        # return
+        return _python.PyFile(compiledFile)
+
+    def compiledPath(self, targetDirectory=None):
+        """the path of the compiled ui file
+
+        :param targetDirectory: directory of the compiled Ui - if not specified, command will use the UiFile directory
+        :type targetDirectory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :return: the path of the compiled file
+        :rtype: str
+        """
+
+        # init
+        targetDirectory = os.path.abspath(str(targetDirectory)) if targetDirectory else os.path.dirname(self.path())
+
+        # return
+        return os.path.join(targetDirectory, '{0}.py'.format(os.path.splitext(os.path.basename(self.path()))[0]))
+
+    def isCompiled(self, targetDirectory=None):
+        """check if the compiled ui file is up to date
 
-        # get compile file
-        compiledFile = os.path.join(targetDirectory, self.baseName(withExtension=True).replace('.ui', '.py'))
+        the compiled file is up to date if it is newer than the ui file or if it was compiled from the same content
+
+        :param targetDirectory: directory of the compiled Ui - if not specified, command will use the UiFile directory
+        :type targetDirectory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :return: ``True`` : the compiled file is up to date - ``False`` : the ui file needs to be compiled
+        :rtype: bool
+        """
 
-        # generate file
-        srcFile = open(self.path(), 'r')
-        tgtFile = open(compiledFile, 'w')
+        # init
+        compiledFile = self.compiledPath(targetDirectory=targetDirectory)
+        backend = _backend.storageBackend(compiledFile)
 
-        # compile
-        pyside2uic.compileUi(srcFile, tgtFile)
-        srcFile.close()
-        tgtFile.close()
+        # return if not compiled
+        if not backend.isFile(compiledFile):
+            return False
 
-        # get file object
-        compiledFile = _python.PyFile(compiledFile)
+        # return if newer
+        if backend.stat(compiledFile)[0] >= self._storageBackend().stat(self.path())[0]:
+            return True
 
-        # get compiled file content
-        content = compiledFile.read().replace('from PySide2 import QtCore, QtGui, QtWidgets',
-                                              'from PySide2 import QtCore, QtGui, QtWidgets\n'
-                                              'import cgp_generic_utils.qt')
+        # get compiled hash
+        with backend.open(compiledFile, 'r') as toRead:
+            header = toRead.readline().strip()
 
-        for qType in cgp_generic_utils.qt.__all__:
-            content = content.replace('QtWidgets.Q{0}'.format(qType), 'cgp_generic_utils.qt.{0}'.format(qType))
+        if not header.startswith(_HASH_HEADER):
+            return False
 
-        # rewrite compiled file
-        compiledFile.write(content)
+        # get current hash
+        with self._storageBackend().open(self.path(), 'r') as toRead:
+            currentHash = hashlib.md5(cgp_generic_utils.python._compat.toBytes(toRead.read())).hexdigest()
 
         # return
-        return compiledFile
+        return header[len(_HASH_HEADER):] == currentHash
+
+    def load(self, parent=None):
+        """build the widget described by the ui file at runtime - an alternative to compile
+
+        the parsed form description is cached until the ui file changes so reopening the same ui skips the xml parsing
+
+        :param parent: widget under which the built widget will be parented
+        :type parent: :class:`PySide2.QtWidgets.QWidget`
+
+        :return: the built widget - its named children are accessible as attributes
+        :rtype: :class:`PySide2.QtWidgets.QWidget`
+        """
+
+        # return
+        return _uiLoader.loadUi(self.path(), parent=parent)
+
+
+# COMMANDS #
+
+
+def compileUiFiles(directory, targetDirectory=None, recursive=False, force=False, processes=None):
+    """compile the ui files of the directory - up to date ui files are skipped, the others are compiled in parallel
+
+    :param directory: directory holding the ui files to compile
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :param targetDirectory: directory of the compiled Uis - if not specified, each ui file directory is used
+    :type targetDirectory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :param recursive: ``True`` : the ui files of the sub directories are compiled -
+                      ``False`` : only the ui files of the directory are compiled
+    :type recursive: bool
+
+    :param force: ``True`` : the ui files are compiled even if up to date - ``False`` : up to date files are skipped
+    :type force: bool
+
+    :param processes: count of processes used to compile the ui files - default is the count of cpus
+    :type processes: int
+
+    :return: the compiled files
+    :rtype: list[:class:`cgp_generic_utils.files.PyFile`]
+    """
+
+    # errors - the ui files are compiled by a process pool so they are read and written on the local file system
+    for entity in [directory, targetDirectory]:
+        if entity and not _backend.entityBackend(entity).isLocal():
+            raise ValueError('{0} is not on the local file system - compileUiFiles is not supported by its storage '
+                             'backend'.format(entity))
+
+    # init
+    directory = str(directory)
+    targetDirectory = str(targetDirectory) if targetDirectory else None
+    toCompile = []
+
+    # errors
+    if not os.path.isdir(directory):
+        raise ValueError('{0} is not an existing directory'.format(directory))
+
+    # get the outdated ui files
+    for root, _, fileNames in os.walk(directory):
+
+        for fileName in sorted(fileNames):
+            if fileName.endswith('.{0}'.format(UiFile._extension)):
+                uiFile = UiFile(os.path.join(root, fileName))
+                if force or not uiFile.isCompiled(targetDirectory=targetDirectory):
+                    toCompile.append((uiFile.path(), targetDirectory))
+
+        if not recursive:
+            break
+
+    # import multiprocessing here as it is only needed to compile in parallel
+    import multiprocessing
+
+    # compile in parallel if worth it
+    processes = processes or multiprocessing.cpu_count()
+
+    if processes > 1 and len(toCompile) > 1:
+        pool = multiprocessing.Pool(min(processes, len(toCompile)))
+        try:
+            compiledPaths = pool.map(_compile, toCompile)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        compiledPaths = [_compile(data) for data in toCompile]
+
+    # return
+    return [_python.PyFile(path) for path in compiledPaths]
+
+
+# PRIVATE COMMANDS #
+
+
+def _compile(data):
+    """compile the ui file - module level to be picklable by the process pool
+
+    :param data: path of the ui file and directory of the compiled Ui
+    :type data: tuple[str, str]
+
+    :return: the path of the compiled file
+    :rtype: str
+    """
+
+    # return
+    return UiFile(data[0]).compile(targetDirectory=data[1], force=True).path()
+
+
+def _widgetPattern():
+    """the pattern matching the QtWidgets classes subclassed in ``cgp_generic_utils.qt``
+
+    :return: the compiled pattern
+    :rtype: :class:`re.RegexObject`
+    """
+
+    # init
+    global _WIDGET_PATTERN
+
+    # compile pattern once
+    if _WIDGET_PATTERN is None:
+
+        # import qt lib here to avoid import issue in batch mode
+        import cgp_generic_utils.qt
+
+        names = sorted(cgp_generic_utils.qt.__all__, key=len, reverse=True)
+        _WIDGET_PATTERN = re.compile(r'\bQtWidgets\.Q({0})\b'.format('|'.join(map(re.escape, names))))
+
+    # return
+    return _WIDGET_PATTERN
@@ -3,14 +3,21 @@ python file object library
 """
 
 # imports python
+import os
+import ast
 import json
-import imp
-import cPickle
+import threading
 
 # imports local
-from . import _generic
+import cgp_generic_utils.python._compat
+from . import _backend, _cache, _generic
 
 
+_ASSIGN_NODES = tuple(getattr(ast, name) for name in ('Assign', 'AugAssign', 'AnnAssign') if hasattr(ast, name))
+_FUNCTION_NODES = tuple(getattr(ast, name) for name in ('FunctionDef', 'AsyncFunctionDef') if hasattr(ast, name))
+_MODIFY_LOCKS = {}
+_MODIFY_LOCKS_LOCK = threading.Lock()
+
 # PYTHON FILE OBJECTS #
 
 
@@ -20,7 +27,9 @@ class JsonFile(_generic.File):
 
     # ATTRIBUTES #
 
+    __slots__ = ()
     _extension = 'json'
+    _signatures = (r'\s*(?:\{\s*["}]|\[\s*["\[{\]\d\-tfn])',)
 
     # OBJECT COMMANDS #
 
@@ -46,7 +55,9 @@ class JsonFile(_generic.File):
         content = content or {}
 
         # execute
-        with open(path, 'w') as toWrite:
+        path = os.path.abspath(path)
+
+        with _backend.storageBackend(path).open(path, 'w') as toWrite:
             json.dump(content, toWrite, indent=4)
 
         # return
@@ -54,6 +65,62 @@ class JsonFile(_generic.File):
 
     # COMMANDS #
 
+    def modify(self, modifier, timeout=None, useLockFile=False):
+        """read, modify and write the json file under an exclusive lock - safe with concurrent writers
+
+        :param modifier: function receiving the content of the json file - returns the new content or modifies it
+                         in place and returns None
+        :type modifier: function
+
+        :param timeout: seconds to wait for the lock - if None, waits until the lock is acquired
+        :type timeout: float
+
+        :param useLockFile: ``True`` : a lock file is used - needed on network shares not supporting fcntl -
+                            ``False`` : fcntl is used when available
+        :type useLockFile: bool
+
+        :return: the new content of the json file
+        :rtype: any
+        """
+
+        # init - the threads of the process are excluded by a lock shared per backend and path, the other processes
+        # by a file lock - file locks are only needed on the local file system as other backends live in the process
+        backend = self._storageBackend()
+        fileLock = self.lock(exclusive=True, timeout=timeout, useLockFile=useLockFile) if backend.isLocal() else None
+
+        # execute
+        with _modifyLock(backend, self.path()):
+
+            if fileLock:
+                fileLock.acquire()
+
+            try:
+
+                # get content
+                content = self.read() if backend.isFile(self.path()) else {}
+
+                # modify content
+                result = modifier(content)
+                content = content if result is None else result
+
+                # write in a temporary file first so readers never get a partial content
+                temporaryPath = '{0}.{1}.tmp'.format(self.path(), os.getpid())
+
+                with backend.open(temporaryPath, 'w') as toWrite:
+                    json.dump(content, toWrite, indent=4)
+
+                if (os.name == 'nt' or not backend.isLocal()) and backend.isFile(self.path()):
+                    backend.remove(self.path())
+
+                backend.move(temporaryPath, self.path())
+
+            finally:
+                if fileLock:
+                    fileLock.release()
+
+        # return
+        return content
+
     def read(self):
         """read the json file
 
@@ -62,7 +129,7 @@ class JsonFile(_generic.File):
         """
 
         # get state form config file
-        with open(self.path(), 'r') as toRead:
+        with self._storageBackend().open(self.path(), 'r') as toRead:
             data = json.load(toRead)
 
         # return
@@ -75,12 +142,14 @@ class PklFile(_generic.File):
 
     # ATTRIBUTES #
 
+    __slots__ = ()
     _extension = 'pkl'
+    _signatures = (r'\x80[\x02-\x05]', r'\((?:dp|lp)\d+\n')
 
     # OBJECT COMMANDS #
 
     @classmethod
-    def create(cls, path, content=None, **__):
+    def create(cls, path, content=None, protocol=None, **__):
         """create a pkl file
 
         :param path: path of the pkl file
@@ -89,6 +158,10 @@ class PklFile(_generic.File):
         :param content: content of the pkl file
         :type content: any
 
+        :param protocol: protocol of the pkl file - default is 2, the highest protocol python 2 can read -
+                         ``pickle.HIGHEST_PROTOCOL`` is smaller and faster on python 3 but can't be read by python 2
+        :type protocol: int
+
         :return: the created pkl file
         :rtype: :class:`cgp_generic_utils.files.PklFile`
         """
@@ -101,8 +174,10 @@ class PklFile(_generic.File):
         content = content or {}
 
         # execute
-        with open(path, 'wb') as toWrite:
-            cPickle.dump(content, toWrite)
+        path = os.path.abspath(path)
+
+        with _backend.storageBackend(path).open(path, 'wb') as toWrite:
+            cgp_generic_utils.python._compat.pickle.dump(content, toWrite, 2 if protocol is None else protocol)
 
         # return
         return cls(path)
@@ -117,8 +192,8 @@ class PklFile(_generic.File):
         """
 
         # get state form config file
-        with open(self.path(), 'rb') as toRead:
-            data = cPickle.load(toRead)
+        with self._storageBackend().open(self.path(), 'rb') as toRead:
+            data = cgp_generic_utils.python._compat.pickle.load(toRead)
 
         # return
         return data
@@ -130,19 +205,144 @@ class PyFile(_generic.File):
 
     # ATTRIBUTES #
 
+    __slots__ = ()
     _extension = 'py'
+    _signatures = (r'#![^\n]*python',)
 
     # COMMANDS #
 
-    def importAsModule(self):
-        """import the python file as module
+    def importAsModule(self, reload=False):
+        """import the python file as module - the module is cached until the file changes
+
+        :param reload: ``True`` : the module is executed again even if the file is unchanged -
+                       ``False`` : the cached module is returned if the file is unchanged
+        :type reload: bool
 
         :return: the module object
         :rtype: python
         """
 
         # import as module
-        module = imp.load_source(self.baseName(withExtension=False), self.path())
+        module = _cache.CODE_CACHE.module(self.path(), name=self.baseName(withExtension=False), reload=reload)
 
         # return
         return module
+
+    def symbols(self):
+        """the top-level symbols of the python file - the file is parsed but never executed
+
+        :return: the symbols of the python file - {docstring: str, all: list, classes: list, functions: list}
+        :rtype: dict
+        """
+
+        # get source - read as bytes so the encoding declared by the source is used
+        with self._storageBackend().open(self.path(), 'rb') as toRead:
+            source = toRead.read()
+
+        # return
+        return _inspectSource(source, self.path())
+
+
+# PRIVATE COMMANDS #
+
+
+def _inspectSource(source, path='<string>'):
+    """the top-level symbols of the python source
+
+    :param source: python source to inspect
+    :type source: str
+
+    :param path: path of the python source used to report syntax errors
+    :type path: str
+
+    :return: the symbols of the python source - {docstring: str, all: list, classes: list, functions: list}
+    :rtype: dict
+    """
+
+    # init
+    tree = ast.parse(source, path)
+    symbols = {'docstring': ast.get_docstring(tree),
+               'all': None,
+               'classes': [],
+               'functions': []}
+
+    # execute
+    for node in tree.body:
+
+        # classes
+        if isinstance(node, ast.ClassDef):
+            symbols['classes'].append({'name': node.name,
+                                       'docstring': ast.get_docstring(node),
+                                       'lineno': node.lineno,
+                                       'bases': [_nodeName(base) for base in node.bases],
+                                       'methods': [child.name for child in node.body
+                                                   if isinstance(child, _FUNCTION_NODES)]})
+
+        # functions
+        elif isinstance(node, _FUNCTION_NODES):
+            symbols['functions'].append({'name': node.name,
+                                         'docstring': ast.get_docstring(node),
+                                         'lineno': node.lineno,
+                                         'arguments': [_nodeName(argument) for argument in node.args.args]})
+
+        # __all__ - annotated without a value, dynamic or not a sequence of names, it is ignored
+        elif (isinstance(node, _ASSIGN_NODES) and node.value is not None
+              and any(isinstance(target, ast.Name) and target.id == '__all__'
+                      for target in getattr(node, 'targets', [getattr(node, 'target', None)]))):
+            try:
+                names = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+
+            if (not isinstance(names, (list, tuple))
+                    or not all(isinstance(name, cgp_generic_utils.python._compat.stringType) for name in names)):
+                continue
+
+            names = list(names)
+            symbols['all'] = (symbols['all'] or []) + names if isinstance(node, ast.AugAssign) else names
+
+    # return
+    return symbols
+
+
+def _modifyLock(backend, path):
+    """the lock shared by the modifications of the file in the process
+
+    :param backend: backend storing the file
+    :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+
+    :param path: path of the file
+    :type path: str
+
+    :return: the lock of the file
+    :rtype: :class:`threading.RLock`
+    """
+
+    # execute
+    with _MODIFY_LOCKS_LOCK:
+        if (backend, path) not in _MODIFY_LOCKS:
+            _MODIFY_LOCKS[(backend, path)] = threading.RLock()
+
+    # return
+    return _MODIFY_LOCKS[(backend, path)]
+
+
+def _nodeName(node):
+    """the dotted name of the ast node
+
+    :param node: node to get the name from
+    :type node: :class:`ast.AST`
+
+    :return: the name of the node - None if the node is not a name
+    :rtype: str
+    """
+
+    # return
+    if isinstance(node, ast.Name):
+        return node.id
+
+    elif isinstance(node, ast.Attribute):
+        parentName = _nodeName(node.value)
+        return '{0}.{1}'.format(parentName, node.attr) if parentName else node.attr
+
+    return getattr(node, 'arg', None)
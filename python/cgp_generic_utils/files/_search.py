@@ -0,0 +1,176 @@
+"""
+full-text search library
+"""
+
+# imports python
+import os
+import re
+import mmap
+
+# imports local
+import cgp_generic_utils.python._compat
+
+
+_BINARY_BLOCK_SIZE = 8192
+_PATTERNS = {}
+
+
+# COMMANDS #
+
+
+def search(paths, pattern, fileExtensions=None, recursive=True, ignoreCase=False, processes=None):
+    """search the pattern in the files - matches are streamed as soon as a file is scanned
+
+    files are scanned through memory mapped reads with a precompiled pattern, binary files are skipped by looking for
+    null bytes in their first block, and the files are spread over a process pool
+
+    :param paths: files and directories to search in - directories are walked
+    :type paths: list[str] or list[:class:`cgp_generic_utils.files.Path`]
+
+    :param pattern: regular expression to search
+    :type pattern: str
+
+    :param fileExtensions: extensions of the files to search in - default is all extensions
+    :type fileExtensions: list[str]
+
+    :param recursive: ``True`` : the sub directories are searched - ``False`` : only the directories are searched
+    :type recursive: bool
+
+    :param ignoreCase: ``True`` : the search ignores case - ``False`` : the search is case sensitive
+    :type ignoreCase: bool
+
+    :param processes: count of processes used to search the files - default is the count of cpus
+    :type processes: int
+
+    :return: the matches - (path, lineNumber, offset, line) with offset being the byte offset of the match in the file
+    :rtype: generator[tuple[str, int, int, str]]
+    """
+
+    # import multiprocessing here as it is only needed to search the files in parallel
+    import multiprocessing
+
+    # init
+    flags = re.MULTILINE | (re.IGNORECASE if ignoreCase else 0)
+    processes = processes or multiprocessing.cpu_count()
+    filePaths = _filePaths(paths, fileExtensions, recursive)
+
+    # errors
+    re.compile(pattern, flags)
+
+    # search in the current process if not worth a pool
+    if processes < 2:
+        for path in filePaths:
+            for match in _searchFile((path, pattern, flags)):
+                yield match
+        return
+
+    # search in parallel - files are fed lazily to the pool so matches stream while the tree is walked
+    pool = multiprocessing.Pool(processes)
+
+    try:
+        for matches in pool.imap_unordered(_searchFile, ((path, pattern, flags) for path in filePaths), chunksize=8):
+            for match in matches:
+                yield match
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+# PRIVATE COMMANDS #
+
+
+def _filePaths(paths, fileExtensions, recursive):
+    """the paths of the files to search in
+
+    :param paths: files and directories to search in - directories are walked
+    :type paths: list[str] or list[:class:`cgp_generic_utils.files.Path`]
+
+    :param fileExtensions: extensions of the files to search in - default is all extensions
+    :type fileExtensions: list[str]
+
+    :param recursive: ``True`` : the sub directories are searched - ``False`` : only the directories are searched
+    :type recursive: bool
+
+    :return: the paths of the files
+    :rtype: generator[str]
+    """
+
+    # init
+    suffixes = tuple('.{0}'.format(extension) for extension in fileExtensions) if fileExtensions else None
+
+    # execute
+    for path in paths:
+        path = os.path.abspath(str(path))
+
+        if os.path.isfile(path):
+            if not suffixes or path.endswith(suffixes):
+                yield path
+            continue
+
+        for root, directories, fileNames in os.walk(path):
+
+            directories.sort()
+
+            for fileName in sorted(fileNames):
+                if not suffixes or fileName.endswith(suffixes):
+                    yield os.path.join(root, fileName)
+
+            if not recursive:
+                break
+
+
+def _searchFile(data):
+    """search the pattern in the file - module level to be picklable by the process pool
+
+    :param data: path of the file, pattern and flags of the regular expression
+    :type data: tuple[str, str, int]
+
+    :return: the matches - [(path, lineNumber, offset, line)]
+    :rtype: list[tuple[str, int, int, str]]
+    """
+
+    # init
+    path, pattern, flags = data
+    matches = []
+
+    # get the compiled pattern - compiled once per process, as bytes as it matches the mapped bytes of the files
+    if (pattern, flags) not in _PATTERNS:
+        _PATTERNS[(pattern, flags)] = re.compile(cgp_generic_utils.python._compat.toBytes(pattern), flags)
+
+    regex = _PATTERNS[(pattern, flags)]
+
+    # execute
+    try:
+        with open(path, 'rb') as toRead:
+
+            # skip empty and binary files
+            block = toRead.read(_BINARY_BLOCK_SIZE)
+
+            if not block or b'\0' in block:
+                return matches
+
+            toRead.seek(0)
+            content = mmap.mmap(toRead.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                lineNumber = 1
+                lineStart = 0
+
+                for match in regex.finditer(content):
+
+                    # count lines from the previous match only
+                    lineNumber += content[lineStart:match.start()].count(b'\n')
+                    lineStart = content.rfind(b'\n', 0, match.start()) + 1
+                    lineEnd = content.find(b'\n', match.start())
+                    line = content[lineStart:lineEnd if lineEnd != -1 else len(content)].rstrip(b'\r')
+
+                    matches.append((path, lineNumber, match.start(), cgp_generic_utils.python._compat.toText(line)))
+
+            finally:
+                content.close()
+
+    except (IOError, OSError, ValueError):
+        pass
+
+    # return
+    return matches
@@ -0,0 +1,329 @@
+"""
+file sequence library - collapses numbered files such as ``shot.####.exr`` into sequences
+"""
+
+# imports python
+import os
+import re
+
+
+_FRAME_PATTERN = re.compile(r'^(.*\D)?(\d+)([^\d/\\]*)$')
+
+
+# SEQUENCE OBJECTS #
+
+
+class FileSequence(object):
+    """sequence of numbered files sharing the same name except for their frame number - ``shot.####.exr``
+
+    only the frame numbers are held, the paths of the files are expanded on demand
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('_head', '_tail', '_padding', '_frames')
+
+    # INIT #
+
+    def __init__(self, head, tail, padding, frames):
+        """FileSequence class initialization
+
+        :param head: the part of the paths before the frame number - ``/path/shot.``
+        :type head: str
+
+        :param tail: the part of the paths after the frame number - ``.exr``
+        :type tail: str
+
+        :param padding: count of digits of the frame numbers - frame numbers are padded with zeros
+        :type padding: int
+
+        :param frames: the frame numbers of the files of the sequence
+        :type frames: list[int]
+        """
+
+        # errors
+        if not frames:
+            raise ValueError('{0} is not a valid list of frames - Expected : at least one frame'.format(frames))
+
+        # init
+        self._head = head
+        self._tail = tail
+        self._padding = padding
+        self._frames = sorted(frames)
+
+    def __iter__(self):
+        """iterate over the paths of the files of the sequence
+
+        :return: the paths of the files of the sequence
+        :rtype: generator[str]
+        """
+
+        # return
+        return self.paths()
+
+    def __len__(self):
+        """the count of files of the sequence
+
+        :return: the count of files of the sequence
+        :rtype: int
+        """
+
+        # return
+        return len(self._frames)
+
+    def __repr__(self):
+        """the representation of the sequence
+
+        :return: the representation of the sequence
+        :rtype: str
+        """
+
+        # return
+        return '{0}({1!r}, {2!r})'.format(type(self).__name__, self.pattern(), self.frameSet())
+
+    def __str__(self):
+        """the pattern of the sequence
+
+        :return: the pattern of the sequence
+        :rtype: str
+        """
+
+        # return
+        return self.pattern()
+
+    # COMMANDS #
+
+    def directory(self):
+        """the directory of the files of the sequence
+
+        :return: the path of the directory of the files of the sequence
+        :rtype: str
+        """
+
+        # return
+        return os.path.dirname(self._head)
+
+    def frameRange(self):
+        """the first and the last frames of the sequence
+
+        :return: the first and the last frames of the sequence - (first, last)
+        :rtype: tuple[int, int]
+        """
+
+        # return
+        return self._frames[0], self._frames[-1]
+
+    def frameSet(self):
+        """the frames of the sequence collapsed into ranges - ``1001-1050,1052,1054-1060``
+
+        :return: the frames of the sequence collapsed into ranges
+        :rtype: str
+        """
+
+        # init
+        ranges = []
+        start = previous = self._frames[0]
+
+        # execute
+        for frame in self._frames[1:]:
+            if frame != previous + 1:
+                ranges.append(str(start) if start == previous else '{0}-{1}'.format(start, previous))
+                start = frame
+            previous = frame
+
+        ranges.append(str(start) if start == previous else '{0}-{1}'.format(start, previous))
+
+        # return
+        return ','.join(ranges)
+
+    def frames(self):
+        """the frames of the sequence
+
+        :return: the sorted frames of the sequence
+        :rtype: list[int]
+        """
+
+        # return
+        return list(self._frames)
+
+    def missingFrames(self):
+        """the frames missing between the first and the last frames of the sequence
+
+        :return: the missing frames
+        :rtype: list[int]
+        """
+
+        # init
+        missingFrames = []
+
+        # execute
+        for previous, frame in zip(self._frames, self._frames[1:]):
+            missingFrames.extend(range(previous + 1, frame))
+
+        # return
+        return missingFrames
+
+    def padding(self):
+        """the count of digits of the frame numbers of the sequence
+
+        :return: the count of digits of the frame numbers - frame numbers are padded with zeros
+        :rtype: int
+        """
+
+        # return
+        return self._padding
+
+    def path(self, frame):
+        """the path of the file of the frame
+
+        :param frame: frame of the file
+        :type frame: int
+
+        :return: the path of the file of the frame
+        :rtype: str
+        """
+
+        # return
+        return '{0}{1:0{2}d}{3}'.format(self._head, frame, self._padding, self._tail)
+
+    def paths(self):
+        """iterate over the paths of the files of the sequence
+
+        :return: the paths of the files of the sequence
+        :rtype: generator[str]
+        """
+
+        # execute
+        for frame in self._frames:
+            yield self.path(frame)
+
+    def pattern(self):
+        """the pattern of the sequence - the frame number is replaced by a ``#`` per digit
+
+        :return: the pattern of the sequence
+        :rtype: str
+        """
+
+        # return
+        return '{0}{1}{2}'.format(self._head, '#' * self._padding, self._tail)
+
+
+# COMMANDS #
+
+
+def collapseSequences(paths, minimumLength=2):
+    """collapse the numbered files into sequences in a single pass over the paths
+
+    frame numbers with leading zeros set the padding of their sequence, frame numbers without leading zeros
+    join the sequence padded to their count of digits if any, otherwise they form unpadded sequences - frame numbers
+    with another count of digits only join an unpadded sequence if they continue it, so a stray ``s.9.exr`` next to
+    ``s.1001.exr`` to ``s.1004.exr`` doesn't turn ``s.####.exr`` into ``s.#.exr``
+
+    :param paths: the paths to collapse
+    :type paths: list[str]
+
+    :param minimumLength: minimum count of files forming a sequence
+    :type minimumLength: int
+
+    :return: the sequences and the paths that are not part of any sequence - (sequences, paths)
+    :rtype: tuple[list[:class:`cgp_generic_utils.files.FileSequence`], list[str]]
+    """
+
+    # init
+    padded = {}
+    unpadded = {}
+    singles = []
+
+    # get frames - sorted by head and tail, with the padding when a leading zero sets it
+    for path in paths:
+
+        # the tail can't hold a separator so the frame number is the last number of the name
+        match = _FRAME_PATTERN.match(path)
+
+        if not match:
+            singles.append(path)
+            continue
+
+        head, digits, tail = match.groups()
+        key = (head or '', tail)
+
+        if digits[0] == '0' and len(digits) > 1:
+            padded.setdefault(key + (len(digits),), []).append((int(digits), path))
+        else:
+            unpadded.setdefault(key, []).append((int(digits), path, len(digits)))
+
+    # resolve padding of the unpadded frames
+    for key, frames in unpadded.items():
+        remaining = []
+
+        for frame, path, width in frames:
+            if key + (width,) in padded:
+                padded[key + (width,)].append((frame, path))
+            else:
+                remaining.append((frame, path, width))
+
+        # the smallest width of each group is used as padding as wider frame numbers overflow it - 1001 to 10000 is ####
+        for padding, members in _unpaddedGroups(remaining):
+            padded.setdefault(key + (padding,), []).extend(members)
+
+    # build sequences
+    sequences = []
+
+    for (head, tail, padding), frames in padded.items():
+        if len(frames) < minimumLength:
+            singles.extend(path for _, path in frames)
+        else:
+            sequences.append(FileSequence(head, tail, padding, [frame for frame, _ in frames]))
+
+    # return
+    return sorted(sequences, key=FileSequence.pattern), sorted(singles)
+
+
+# PRIVATE COMMANDS #
+
+
+def _unpaddedGroups(frames):
+    """group the frames without leading zeros - each group starts from the count of digits holding the most frames
+    and is extended to the neighbouring counts of digits whose frames continue it
+
+    frames continue a group if the gap between them and the group is not bigger than the biggest gap of the group -
+    1 to 100 is a single group while 9 next to 1001 to 1004 is not
+
+    :param frames: the frames without leading zeros - [(frame, path, width)]
+    :type frames: list[tuple[int, str, int]]
+
+    :return: the padding and the frames of each group - [(padding, [(frame, path)])]
+    :rtype: list[tuple[int, list[tuple[int, str]]]]
+    """
+
+    # init
+    widths = {}
+    groups = []
+
+    for frame, path, width in frames:
+        widths.setdefault(width, []).append((frame, path))
+
+    # execute
+    while widths:
+        width = max(sorted(widths), key=lambda key: len(widths[key]))
+        members = sorted(widths.pop(width))
+        maximumGap = max([frame - previous for (previous, _), (frame, _) in zip(members, members[1:])] or [1])
+
+        # extend to the narrower frames
+        padding = width
+
+        while padding - 1 in widths and members[0][0] - max(widths[padding - 1])[0] <= maximumGap:
+            padding -= 1
+            members = sorted(widths.pop(padding)) + members
+
+        # extend to the wider frames
+        wider = width + 1
+
+        while wider in widths and min(widths[wider])[0] - members[-1][0] <= maximumGap:
+            members.extend(sorted(widths.pop(wider)))
+            wider += 1
+
+        groups.append((padding, members))
+
+    # return
+    return groups
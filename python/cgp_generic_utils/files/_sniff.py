@@ -0,0 +1,261 @@
+"""
+file type sniffing library - detects the type of files from the signature of their content
+"""
+
+# imports python
+import os
+import re
+import threading
+
+# imports local
+import cgp_generic_utils.python._compat
+import cgp_generic_utils.files._api
+import cgp_generic_utils.files._backend
+
+
+_HEADER_SIZE = 512
+
+
+# CACHE OBJECTS #
+
+
+class FileTypeCache(object):
+    """cache of the file types detected from the content of files keyed on the mtime and size of each file
+
+    the signatures declared by the registered file objects are compiled into a single prefix matcher applied to
+    the first bytes of the files - the matcher is compiled again when other file types are registered
+    """
+
+    # INIT #
+
+    def __init__(self):
+        """FileTypeCache class initialization
+        """
+
+        # init
+        self._records = {}
+        self._matcher = None
+        self._lock = threading.RLock()
+
+    # COMMANDS #
+
+    def detect(self, path):
+        """detect the type of the file from its content
+
+        :param path: path of the file
+        :type path: str or :class:`cgp_generic_utils.files.File`
+
+        :return: the registered type of the file - ``None`` if no signature matches its content
+        :rtype: str
+        """
+
+        # return
+        return self._detect(os.path.abspath(str(path)), self._compiledMatcher())
+
+    def detectAll(self, paths, processes=None):
+        """detect the type of the files from their content - the files are read in parallel
+
+        :param paths: paths of the files
+        :type paths: list[str] or list[:class:`cgp_generic_utils.files.File`]
+
+        :param processes: count of threads used to read the files - default is the count of cpus
+        :type processes: int
+
+        :return: the registered type of each file - {path: fileType}
+        :rtype: dict
+        """
+
+        # import multiprocessing here as it is only needed to read the files in parallel
+        import multiprocessing
+        import multiprocessing.pool
+
+        # init
+        paths = [os.path.abspath(str(path)) for path in paths]
+        matcher = self._compiledMatcher()
+        processes = processes or multiprocessing.cpu_count()
+
+        # execute
+        if processes > 1 and len(paths) > 1:
+            pool = multiprocessing.pool.ThreadPool(min(processes, len(paths)))
+            try:
+                fileTypes = pool.map(lambda path: self._detect(path, matcher), paths)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            fileTypes = [self._detect(path, matcher) for path in paths]
+
+        # return
+        return dict(zip(paths, fileTypes))
+
+    def invalidate(self, path=None):
+        """invalidate the cached type of the file or of the files of the directory
+
+        :param path: path of the file or directory to invalidate - if None, the entire cache is invalidated
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+        """
+
+        # init
+        path = os.path.abspath(str(path)) if path else None
+        prefix = os.path.join(path, '') if path else None
+
+        # execute
+        with self._lock:
+            for cachedPath in list(self._records):
+                if path is None or cachedPath == path or cachedPath.startswith(prefix):
+                    del self._records[cachedPath]
+
+    # PRIVATE COMMANDS #
+
+    def _compiledMatcher(self):
+        """the matcher of the signatures of the registered file types - compiled again if the types changed
+
+        :return: the key of the registered types, the compiled matcher and the type of each of its groups -
+                 (key, matcher, {groupName: fileType})
+        :rtype: tuple
+        """
+
+        # init
+        fileTypes = cgp_generic_utils.files._api.registeredFileTypes()
+        key = tuple(sorted((fileType, id(fileObject)) for fileType, fileObject in fileTypes.items()))
+
+        # return if up to date
+        matcher = self._matcher
+
+        if matcher and matcher[0] == key:
+            return matcher
+
+        # get signatures - one named group per signature, the type of the group is get from its name
+        patterns = []
+        groupTypes = {}
+
+        for fileType in sorted(fileTypes):
+            for signature in getattr(fileTypes[fileType], '_signatures', ()):
+                groupName = '_{0}'.format(len(patterns))
+                patterns.append('(?P<{0}>{1})'.format(groupName, signature))
+                groupTypes[groupName] = fileType
+
+        # update matcher - compiled as bytes as it matches the first bytes of the files
+        pattern = cgp_generic_utils.python._compat.toBytes('|'.join(patterns), 'latin-1')
+        matcher = (key, re.compile(pattern, re.S) if patterns else None, groupTypes)
+
+        with self._lock:
+            self._matcher = matcher
+
+        # return
+        return matcher
+
+    def _detect(self, path, matcher):
+        """detect the type of the file from its first bytes - the detected type is cached until the file changes
+
+        :param path: absolute path of the file
+        :type path: str
+
+        :param matcher: the key of the registered types, the compiled matcher and the type of each of its groups
+        :type matcher: tuple
+
+        :return: the registered type of the file - ``None`` if no signature matches its content
+        :rtype: str
+        """
+
+        # init
+        backend = cgp_generic_utils.files._backend.storageBackend(path)
+
+        try:
+            fileKey = backend.stat(path) + (matcher[0],)
+        except OSError:
+            return None
+
+        # return if up to date
+        with self._lock:
+            cached = self._records.get(path)
+
+        if cached and cached[0] == fileKey:
+            return cached[1]
+
+        # get file type
+        fileType = None
+
+        if matcher[1]:
+            try:
+                with backend.open(path, 'rb') as toRead:
+                    header = toRead.read(_HEADER_SIZE)
+            except IOError:
+                return None
+
+            match = matcher[1].match(header)
+            fileType = matcher[2][match.lastgroup] if match else None
+
+        # update cache
+        with self._lock:
+            self._records[path] = (fileKey, fileType)
+
+        # return
+        return fileType
+
+
+FILE_TYPE_CACHE = FileTypeCache()
+
+
+# COMMANDS #
+
+
+def detectFileType(path):
+    """detect the type of the file from its content - the detected type is cached until the file changes
+
+    :param path: path of the file
+    :type path: str or :class:`cgp_generic_utils.files.File`
+
+    :return: the registered type of the file - ``None`` if no signature matches its content
+    :rtype: str
+    """
+
+    # return
+    return FILE_TYPE_CACHE.detect(path)
+
+
+def detectFileTypes(directory, recursive=False, processes=None):
+    """detect the type of the files of the directory from their content - the files are read in parallel
+
+    :param directory: directory holding the files
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :param recursive: ``True`` : the files of the sub directories are detected -
+                      ``False`` : only the files of the directory are detected
+    :type recursive: bool
+
+    :param processes: count of threads used to read the files - default is the count of cpus
+    :type processes: int
+
+    :return: the registered type of each file - {path: fileType}
+    :rtype: dict
+    """
+
+    # init
+    backend = cgp_generic_utils.files._backend.entityBackend(directory)
+    directory = os.path.abspath(str(directory))
+    paths = []
+
+    # errors
+    if not backend.isDirectory(directory):
+        raise ValueError('{0} is not an existing directory'.format(directory))
+
+    # get files
+    for root, _, fileNames in cgp_generic_utils.files._backend.walkDirectory(directory,
+                                                                            recursive=recursive,
+                                                                            backend=backend):
+        paths.extend(os.path.join(root, fileName) for fileName in fileNames)
+
+    # return
+    return FILE_TYPE_CACHE.detectAll(paths, processes=processes)
+
+
+def invalidateFileTypeCache(path=None):
+    """invalidate the cached type of the file or of the files of the directory
+
+    :param path: path of the file or directory to invalidate - if None, the entire cache is invalidated
+    :type path: str or :class:`cgp_generic_utils.files.Path`
+    """
+
+    # execute
+    FILE_TYPE_CACHE.invalidate(path=path)
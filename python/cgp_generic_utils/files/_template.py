@@ -0,0 +1,307 @@
+"""
+path template library - parses and formats pipeline paths such as ``{root}/{show}/{shot}/v{version:03d}``
+"""
+
+# imports python
+import os
+import re
+
+# imports local
+from . import _backend
+
+
+_FIELD_PATTERN = re.compile(r'\{(\w+)(?::([^{}]*))?\}')
+_INTEGER_SPEC_PATTERN = re.compile(r'^(?:0(\d+))?d$')
+
+
+# TEMPLATE OBJECTS #
+
+
+class PathTemplate(object):
+    """template of paths compiled once into regexes - fields are written ``{name}`` or ``{name:spec}``
+
+    integer fields such as ``{version:03d}`` are parsed as int, the other fields as str and match a single
+    path component unless a pattern is specified for them
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('_template', '_integerFields', '_pattern', '_bulkPattern', '_components')
+
+    # INIT #
+
+    def __init__(self, template, patterns=None):
+        """PathTemplate class initialization
+
+        :param template: the template - ``{root}/{show}/{shot}/v{version:03d}``
+        :type template: str
+
+        :param patterns: regex matched by the fields - default is a single path component or digits for integers
+        :type patterns: dict
+        """
+
+        # init
+        self._template = template.replace(os.sep, '/')
+        self._integerFields = set()
+        self._components = []
+        patterns = dict(patterns or {})
+
+        # get fields
+        for name, spec in _FIELD_PATTERN.findall(self._template):
+            integerSpec = _INTEGER_SPEC_PATTERN.match(spec)
+
+            if integerSpec:
+                self._integerFields.add(name)
+
+            if name not in patterns:
+                patterns[name] = r'-?\d{{{0},}}'.format(integerSpec.group(1) or 1) if integerSpec else r'[^/\n]+'
+
+        # compile the template and each of its components
+        self._pattern = re.compile(r'^{0}$'.format(_compile(self._template, patterns)))
+        self._bulkPattern = re.compile(r'(?m)^({0})$'.format(_compile(self._template, patterns)))
+
+        for component in self._template.split('/'):
+            self._components.append((component,
+                                     set(name for name, _ in _FIELD_PATTERN.findall(component)),
+                                     re.compile(r'^{0}$'.format(_compile(component, patterns)))))
+
+    def __repr__(self):
+        """the representation of the template
+
+        :return: the representation of the template
+        :rtype: str
+        """
+
+        # return
+        return '{0}({1!r})'.format(type(self).__name__, self._template)
+
+    def __str__(self):
+        """the template
+
+        :return: the template
+        :rtype: str
+        """
+
+        # return
+        return self._template
+
+    # COMMANDS #
+
+    def fields(self):
+        """the names of the fields of the template
+
+        :return: the names of the fields of the template - sorted in their order of appearance
+        :rtype: list[str]
+        """
+
+        # init
+        names = []
+
+        # execute
+        for name, _ in _FIELD_PATTERN.findall(self._template):
+            if name not in names:
+                names.append(name)
+
+        # return
+        return names
+
+    def format(self, **fields):
+        """the path formatted from the fields
+
+        :param fields: the values of the fields of the template
+        :type fields: any
+
+        :return: the formatted path
+        :rtype: str
+        """
+
+        # errors
+        missingFields = [name for name in self.fields() if name not in fields]
+
+        if missingFields:
+            raise ValueError('{0} are missing fields to format {1}'.format(missingFields, self._template))
+
+        # return
+        return _nativePath(self._template.format(**fields))
+
+    def parse(self, path):
+        """the fields parsed from the path
+
+        :param path: path to parse
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: the values of the fields - ``None`` if the path doesn't match the template
+        :rtype: dict
+        """
+
+        # init
+        path = str(path)
+        match = self._pattern.match(path if os.sep == '/' else path.replace(os.sep, '/'))
+
+        # return if no match
+        if not match:
+            return None
+
+        # get fields
+        fields = match.groupdict()
+
+        for name in self._integerFields:
+            fields[name] = int(fields[name])
+
+        # return
+        return fields
+
+    def parseAll(self, paths):
+        """the fields parsed from the paths in bulk - the paths are matched at once and the fields are get by columns
+
+        :param paths: paths to parse
+        :type paths: list[str]
+
+        :return: the matching paths and the values of the fields of each of them - ([path], {field: [value]})
+        :rtype: tuple[list[str], dict]
+        """
+
+        # init
+        names = self.fields()
+        text = '\n'.join(paths)
+        text = text if os.sep == '/' else text.replace(os.sep, '/')
+
+        # errors
+        if text.count('\n') != max(len(paths) - 1, 0):
+            raise ValueError('{0} are not valid paths - Expected : paths without line breaks'.format(paths))
+
+        # return if no field
+        if not names:
+            return self._bulkPattern.findall(text), {}
+
+        # get fields
+        columns = list(zip(*self._bulkPattern.findall(text))) or [()] * (len(names) + 1)
+        fields = {}
+
+        for name, column in zip(names, columns[1:]):
+            fields[name] = list(map(int, column)) if name in self._integerFields else list(column)
+
+        # return
+        return list(columns[0]), fields
+
+    def paths(self, **fields):
+        """iterate over the existing paths matching the template - only the directories that can match are listed
+
+        the components of the template whose fields are all known are checked without listing their directory
+
+        :param fields: the values of the fields that are known - the paths are restricted to these values
+        :type fields: any
+
+        :return: the matching paths
+        :rtype: generator[str]
+        """
+
+        # init
+        pending = [([], fields)]
+
+        # walk component by component - a path is a list of components, [''] being the root of an absolute path
+        for index, (component, names, pattern) in enumerate(self._components):
+            isLast = index == len(self._components) - 1
+            matches = []
+
+            for parts, values in pending:
+
+                # get known component - checked without listing its directory
+                if names.issubset(values):
+                    name = component.format(**values)
+                    path = '/'.join(parts + [name])
+                    backend = _backend.storageBackend(path)
+
+                    if not path or (backend.exists(path) if isLast else backend.isDirectory(path)):
+                        matches.append((parts + [name], values))
+
+                    continue
+
+                # get matching children - a child that is not a directory fails to be listed at the next component
+                directory = '/'.join(parts) or ('/' if parts else '.')
+
+                try:
+                    children = sorted(_backend.storageBackend(directory).listDirectory(directory))
+                except OSError:
+                    continue
+
+                for child in children:
+                    match = pattern.match(child)
+
+                    if not match:
+                        continue
+
+                    childValues = dict(values)
+
+                    for name, value in match.groupdict().items():
+                        value = int(value) if name in self._integerFields else value
+
+                        if childValues.setdefault(name, value) != value:
+                            break
+                    else:
+                        matches.append((parts + [child], childValues))
+
+            pending = matches
+
+        # execute
+        for parts, _ in pending:
+            yield _nativePath('/'.join(parts))
+
+    def template(self):
+        """the template
+
+        :return: the template
+        :rtype: str
+        """
+
+        # return
+        return self._template
+
+
+# PRIVATE COMMANDS #
+
+
+def _compile(template, fieldPatterns):
+    """the regex of the template - a field repeated in the template must have the same value
+
+    :param template: the template to compile
+    :type template: str
+
+    :param fieldPatterns: the regex matched by each field
+    :type fieldPatterns: dict
+
+    :return: the regex of the template
+    :rtype: str
+    """
+
+    # init
+    regex = []
+    seen = set()
+    position = 0
+
+    # execute
+    for match in _FIELD_PATTERN.finditer(template):
+        name = match.group(1)
+        regex.append(re.escape(template[position:match.start()]))
+        regex.append('(?P={0})'.format(name) if name in seen else '(?P<{0}>{1})'.format(name, fieldPatterns[name]))
+        seen.add(name)
+        position = match.end()
+
+    regex.append(re.escape(template[position:]))
+
+    # return
+    return ''.join(regex)
+
+
+def _nativePath(path):
+    """the path with the separators of the platform - templates are written with ``/``
+
+    :param path: the path written with ``/``
+    :type path: str
+
+    :return: the path with the separators of the platform
+    :rtype: str
+    """
+
+    # return
+    return path if os.sep == '/' else path.replace('/', os.sep)
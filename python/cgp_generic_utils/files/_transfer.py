@@ -0,0 +1,124 @@
+"""
+file and directory transfer library
+"""
+
+# imports python
+import os
+import errno
+import shutil
+
+# imports local
+import cgp_generic_utils.files._api
+import cgp_generic_utils.files._backend
+
+
+# COMMANDS #
+
+
+def moveEntities(moves):
+    """move files/directories as a transaction - if a move fails, the already completed moves are rolled back
+
+    the paths are moved on their storage backends - only files can be moved across storage backends
+
+    :param moves: sources and destination paths of the moves - [(sourcePath, destinationPath)]
+    :type moves: list[tuple[str, str]]
+
+    :return: the moved files/directories
+    :rtype: list[:class:`cgp_generic_utils.files.Directory`, :class:`cgp_generic_utils.files.File`]
+    """
+
+    # init
+    moves = [(os.path.abspath(str(source)), os.path.abspath(str(destination))) for source, destination in moves]
+    destinations = set()
+    completed = []
+
+    # errors - checked upfront so a rollback never has to restore an overwritten entity
+    for source, destination in moves:
+        destinationBackend = cgp_generic_utils.files._backend.storageBackend(destination)
+
+        if not cgp_generic_utils.files._backend.storageBackend(source).exists(source):
+            raise ValueError('{0} is not an existing file / directory path'.format(source))
+
+        if destinationBackend.exists(destination) or destination in destinations:
+            raise ValueError('{0} already exists'.format(destination))
+
+        if not destinationBackend.isDirectory(os.path.dirname(destination)):
+            raise ValueError('{0} is not a valid directory'.format(os.path.dirname(destination)))
+
+        destinations.add(destination)
+
+    # execute
+    try:
+        for source, destination in moves:
+            cgp_generic_utils.files._backend.movePath(source, destination)
+            completed.append((source, destination))
+
+    # rollback - the original error is raised even if the rollback fails
+    except BaseException:
+        _rollback(completed)
+        raise
+
+    # return
+    return [cgp_generic_utils.files._api.entity(destination) for _, destination in moves]
+
+
+def movePath(source, destination):
+    """move the file/directory on the local file system - renamed when possible, copied then deleted across devices
+
+    used by :class:`cgp_generic_utils.files.LocalBackend` - the other backends move their paths themselves
+
+    :param source: path of the file/directory to move
+    :type source: str
+
+    :param destination: path the file/directory is moved to
+    :type destination: str
+    """
+
+    # rename - O(1) on the same device
+    try:
+        os.rename(source, destination)
+        return
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+
+    # copy then delete across devices - the partial copy is removed if the copy fails
+    isDirectory = os.path.isdir(source)
+
+    try:
+        if isDirectory:
+            shutil.copytree(source, destination, symlinks=True)
+        else:
+            shutil.copy2(source, destination)
+
+    except BaseException:
+        if os.path.isdir(destination) and isDirectory:
+            shutil.rmtree(destination, ignore_errors=True)
+        elif os.path.isfile(destination):
+            os.remove(destination)
+
+        raise
+
+    # delete source
+    if isDirectory:
+        shutil.rmtree(source)
+    else:
+        os.remove(source)
+
+
+# PRIVATE COMMANDS #
+
+
+def _rollback(moves):
+    """move back the completed moves in reverse order - a move failing to be rolled back doesn't stop the rollback
+
+    :param moves: sources and destination paths of the completed moves - [(sourcePath, destinationPath)]
+    :type moves: list[tuple[str, str]]
+    """
+
+    # execute - the errors are handled in this function so the error being handled by the caller is kept on python 2
+    for source, destination in reversed(moves):
+        try:
+            cgp_generic_utils.files._backend.movePath(destination, source)
+        except Exception:
+            continue
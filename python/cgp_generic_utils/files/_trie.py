@@ -0,0 +1,514 @@
+"""
+prefix-sharing path container library
+"""
+
+# imports python
+import os
+import bisect
+
+# imports local
+import cgp_generic_utils.python._compat
+import cgp_generic_utils.files._api
+import cgp_generic_utils.files._backend
+
+
+# CONTAINER OBJECTS #
+
+
+class PathTrie(object):
+    """container storing paths by component so the prefixes shared by many paths are stored once
+
+    directories holding other stored paths are nodes, the last components are kept as interned strings in sorted
+    lists so a stored file costs a pointer and its shared name instead of a full path string
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('_root', '_count')
+
+    # INIT #
+
+    def __init__(self, paths=None):
+        """PathTrie class initialization
+
+        :param paths: paths to store in the trie
+        :type paths: list[str] or list[:class:`cgp_generic_utils.files.Path`]
+        """
+
+        # init
+        self._root = _Node()
+        self._count = 0
+
+        # execute
+        if paths:
+            self.update(paths)
+
+    def __contains__(self, path):
+        """check if the path is stored in the trie
+
+        :param path: path to check
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: ``True`` : the path is stored - ``False`` : the path is not stored
+        :rtype: bool
+        """
+
+        # init
+        segments = _segments(path)
+        parent = self._node(segments[:-1])
+
+        # return
+        if parent is None:
+            return False
+
+        child = parent.children.get(segments[-1]) if parent.children else None
+
+        return child.isPath if child else parent.hasLeaf(segments[-1])
+
+    def __iter__(self):
+        """iterate over the stored paths in sorted order
+
+        :return: the stored paths
+        :rtype: generator[str]
+        """
+
+        # return
+        return self.iterate()
+
+    def __len__(self):
+        """the count of stored paths
+
+        :return: the count of stored paths
+        :rtype: int
+        """
+
+        # return
+        return self._count
+
+    def __repr__(self):
+        """the representation of the trie
+
+        :return: the representation of the trie
+        :rtype: str
+        """
+
+        # return
+        return '{0}({1} paths)'.format(self.__class__.__name__, self._count)
+
+    # OBJECT COMMANDS #
+
+    @classmethod
+    def fromDirectory(cls, directory, recursive=True):
+        """create a trie storing the files and directories of the directory
+
+        :param directory: directory to store the content of
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param recursive: ``True`` : the content of the sub directories is stored -
+                          ``False`` : only the content of the directory is stored
+        :type recursive: bool
+
+        :return: the created trie
+        :rtype: :class:`cgp_generic_utils.files.PathTrie`
+        """
+
+        # init
+        trie = cls()
+        backend = cgp_generic_utils.files._backend.entityBackend(directory)
+        directory = os.path.abspath(str(directory))
+
+        # execute - the directory is walked on its storage backend
+        for root, directories, fileNames in cgp_generic_utils.files._backend.walkDirectory(directory,
+                                                                                            recursive=recursive,
+                                                                                            backend=backend):
+            for name in directories + fileNames:
+                trie.add(os.path.join(root, name))
+
+        # return
+        return trie
+
+    # COMMANDS #
+
+    def add(self, path):
+        """add the path to the trie
+
+        :param path: path to add
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: ``True`` : the path has been added - ``False`` : the path was already stored
+        :rtype: bool
+        """
+
+        # init
+        segments = _segments(path)
+        node = self._root
+
+        # get the parent node - creating the missing nodes and turning leaves into nodes
+        for segment in segments[:-1]:
+            node = node.child(segment, create=True)
+
+        # add the last segment
+        last = segments[-1]
+        child = node.children.get(last) if node.children else None
+
+        if child:
+            if child.isPath:
+                return False
+            child.isPath = True
+
+        elif not node.addLeaf(last):
+            return False
+
+        # return
+        self._count += 1
+        return True
+
+    def entities(self, prefix=None):
+        """the file/directory objects of the stored paths - created on demand
+
+        :param prefix: prefix the paths have to be under - default is all the stored paths
+        :type prefix: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: the file/directory objects of the stored paths
+        :rtype: generator[:class:`cgp_generic_utils.files.Directory`, :class:`cgp_generic_utils.files.File`]
+        """
+
+        # return
+        return (cgp_generic_utils.files._api.entity(path) for path in self.iterate(prefix=prefix))
+
+    def hasPrefix(self, prefix):
+        """check if at least one stored path is under the prefix
+
+        :param prefix: prefix to check
+        :type prefix: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: ``True`` : a path is stored under the prefix - ``False`` : no path is stored under the prefix
+        :rtype: bool
+        """
+
+        # init
+        segments = _segments(prefix)
+        parent = self._node(segments[:-1])
+
+        # return
+        return parent is not None and (segments[-1] in (parent.children or ()) or parent.hasLeaf(segments[-1]))
+
+    def iterate(self, prefix=None):
+        """iterate over the stored paths in sorted order
+
+        :param prefix: prefix the paths have to be under - default is all the stored paths
+        :type prefix: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: the stored paths
+        :rtype: generator[str]
+        """
+
+        # init
+        if prefix is None:
+            stack = [(None, self._root)]
+
+        else:
+            segments = _segments(prefix)
+            parent = self._node(segments[:-1])
+
+            if parent is None:
+                return
+
+            child = parent.children.get(segments[-1]) if parent.children else None
+
+            if child:
+                stack = [(_join(segments), child)]
+            elif parent.hasLeaf(segments[-1]):
+                stack = [(_join(segments), None)]
+            else:
+                return
+
+        # execute - depth first with an explicit stack to avoid the recursion of nested generators
+        while stack:
+            path, node = stack.pop()
+
+            if node is None or node.isPath:
+                yield path
+
+            if node is None:
+                continue
+
+            entries = [(segment, None) for segment in node.leaves or ()]
+            entries.extend((node.children or {}).items())
+
+            for segment, child in sorted(entries, reverse=True):
+                stack.append((_join([segment]) if path is None else _child(path, segment), child))
+
+    def paths(self, prefix=None):
+        """the path objects of the stored paths - created on demand
+
+        :param prefix: prefix the paths have to be under - default is all the stored paths
+        :type prefix: str or :class:`cgp_generic_utils.files.Path`
+
+        :return: the path objects of the stored paths
+        :rtype: generator[:class:`cgp_generic_utils.files.Path`]
+        """
+
+        # init
+        pathObject = cgp_generic_utils.files._api.registeredFileTypes()['path']
+
+        # return
+        return (pathObject(path) for path in self.iterate(prefix=prefix))
+
+    def remove(self, path):
+        """remove the path from the trie - the branches left empty are pruned
+
+        :param path: path to remove
+        :type path: str or :class:`cgp_generic_utils.files.Path`
+        """
+
+        # init
+        segments = _segments(path)
+        nodes = [self._root]
+
+        # get the nodes of the branch
+        for segment in segments[:-1]:
+            child = nodes[-1].child(segment)
+            if child is None:
+                raise ValueError('{0} is not stored in the trie'.format(path))
+            nodes.append(child)
+
+        # remove the last segment
+        last = segments[-1]
+        child = nodes[-1].children.get(last) if nodes[-1].children else None
+
+        if child and child.isPath:
+            child.isPath = False
+            nodes.append(child)
+            segments.append(None)
+        elif child or not nodes[-1].removeLeaf(last):
+            raise ValueError('{0} is not stored in the trie'.format(path))
+
+        self._count -= 1
+
+        # prune the empty nodes and turn the nodes left without content back into leaves
+        for index in range(len(nodes) - 1, 0, -1):
+
+            node = nodes[index]
+
+            if node.children or node.leaves:
+                break
+
+            del nodes[index - 1].children[segments[index - 1]]
+
+            if not nodes[index - 1].children:
+                nodes[index - 1].children = None
+
+            if node.isPath:
+                nodes[index - 1].addLeaf(segments[index - 1])
+                break
+
+    def update(self, paths):
+        """add the paths to the trie
+
+        :param paths: paths to add
+        :type paths: list[str] or list[:class:`cgp_generic_utils.files.Path`]
+        """
+
+        # execute
+        for path in paths:
+            self.add(path)
+
+    # PRIVATE COMMANDS #
+
+    def _node(self, segments):
+        """the node of the segments
+
+        :param segments: segments of the path of the node
+        :type segments: list[str]
+
+        :return: the node - None if the segments are not stored as a node
+        :rtype: :class:`_Node`
+        """
+
+        # init
+        node = self._root
+
+        # execute
+        for segment in segments:
+            node = node.child(segment)
+            if node is None:
+                return None
+
+        # return
+        return node
+
+
+# PRIVATE OBJECTS #
+
+
+class _Node(object):
+    """node of a path trie - a directory holding stored paths
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ('children', 'leaves', 'isPath')
+
+    # INIT #
+
+    def __init__(self, isPath=False):
+        """_Node class initialization
+
+        :param isPath: ``True`` : the node is a stored path - ``False`` : the node is only a prefix
+        :type isPath: bool
+        """
+
+        # init
+        self.children = None
+        self.leaves = None
+        self.isPath = isPath
+
+    # COMMANDS #
+
+    def addLeaf(self, segment):
+        """add the leaf to the node
+
+        :param segment: segment of the leaf
+        :type segment: str
+
+        :return: ``True`` : the leaf has been added - ``False`` : the leaf already exists
+        :rtype: bool
+        """
+
+        # init
+        if self.leaves is None:
+            self.leaves = []
+
+        index = bisect.bisect_left(self.leaves, segment)
+
+        # return if existing
+        if index < len(self.leaves) and self.leaves[index] == segment:
+            return False
+
+        # execute
+        self.leaves.insert(index, cgp_generic_utils.python._compat.intern(segment))
+
+        # return
+        return True
+
+    def child(self, segment, create=False):
+        """the child node of the segment
+
+        :param segment: segment of the child
+        :type segment: str
+
+        :param create: ``True`` : the child is created if missing and a leaf is turned into a node -
+                       ``False`` : None is returned if the child node is missing
+        :type create: bool
+
+        :return: the child node
+        :rtype: :class:`_Node`
+        """
+
+        # return if existing
+        child = self.children.get(segment) if self.children else None
+
+        if child or not create:
+            return child
+
+        # execute
+        if self.children is None:
+            self.children = {}
+
+        child = self.children[cgp_generic_utils.python._compat.intern(segment)] = _Node(isPath=self.removeLeaf(segment))
+
+        # return
+        return child
+
+    def hasLeaf(self, segment):
+        """check if the leaf exists
+
+        :param segment: segment of the leaf
+        :type segment: str
+
+        :return: ``True`` : the leaf exists - ``False`` : the leaf doesn't exist
+        :rtype: bool
+        """
+
+        # return
+        if not self.leaves:
+            return False
+
+        index = bisect.bisect_left(self.leaves, segment)
+
+        return index < len(self.leaves) and self.leaves[index] == segment
+
+    def removeLeaf(self, segment):
+        """remove the leaf from the node
+
+        :param segment: segment of the leaf
+        :type segment: str
+
+        :return: ``True`` : the leaf has been removed - ``False`` : the leaf doesn't exist
+        :rtype: bool
+        """
+
+        # return if missing
+        if not self.hasLeaf(segment):
+            return False
+
+        # execute
+        del self.leaves[bisect.bisect_left(self.leaves, segment)]
+
+        if not self.leaves:
+            self.leaves = None
+
+        # return
+        return True
+
+
+# PRIVATE COMMANDS #
+
+
+def _child(path, segment):
+    """the path of the child segment
+
+    :param path: path of the parent
+    :type path: str
+
+    :param segment: segment of the child
+    :type segment: str
+
+    :return: the path of the child
+    :rtype: str
+    """
+
+    # return
+    return path + segment if path.endswith(os.sep) else path + os.sep + segment
+
+
+def _join(segments):
+    """join the segments into a path
+
+    :param segments: segments of the path
+    :type segments: list[str]
+
+    :return: the path
+    :rtype: str
+    """
+
+    # return - a single segment is the file system root
+    return os.sep.join(segments) if len(segments) > 1 else segments[0] + os.sep
+
+
+def _segments(path):
+    """the segments of the absolute path
+
+    :param path: path to split
+    :type path: str or :class:`cgp_generic_utils.files.Path`
+
+    :return: the segments of the path
+    :rtype: list[str]
+    """
+
+    # init
+    segments = os.path.abspath(str(path)).split(os.sep)
+
+    # return - the file system root splits into two empty segments
+    return segments[:-1] if len(segments) > 1 and not segments[-1] else segments
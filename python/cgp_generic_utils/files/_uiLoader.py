@@ -0,0 +1,802 @@
+"""
+runtime ui loader library - builds widgets from ``.ui`` files without compiling them
+"""
+
+# imports python
+import os
+import hashlib
+import functools
+import threading
+
+# imports local
+import cgp_generic_utils.python._compat
+import cgp_generic_utils.files._backend
+
+
+# CACHE OBJECTS #
+
+
+class UiFormCache(object):
+    """cache of the digested form descriptions of ``.ui`` files
+
+    the xml of a ``.ui`` file is parsed once into a plain description keyed on the (path, mtime, size) of the file -
+    descriptions can also be persisted on disk to skip the xml parsing between sessions
+    """
+
+    # INIT #
+
+    def __init__(self, directory=None):
+        """UiFormCache class initialization
+
+        :param directory: directory where the descriptions are persisted - if None, nothing is persisted
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        self._directory = None
+        self._descriptions = {}
+        self._lock = threading.RLock()
+
+        # execute
+        self.setDirectory(directory)
+
+    # COMMANDS #
+
+    def description(self, path):
+        """the digested form description of the ui file
+
+        :param path: path of the ui file
+        :type path: str
+
+        :return: the form description - {widget: dict, connections: list, customWidgets: dict}
+        :rtype: dict
+        """
+
+        # init - the ui file is read on its storage backend
+        path = os.path.abspath(str(path))
+        backend = cgp_generic_utils.files._backend.storageBackend(path)
+        mtime, size = backend.stat(path)
+        key = (path, mtime, size)
+
+        # return cached description if the ui file is unchanged
+        with self._lock:
+            cached = self._descriptions.get(path)
+
+        if cached and cached[0] == key:
+            return cached[1]
+
+        # get description from disk or parse the ui file
+        description = self._load(key)
+
+        if description is None:
+            with backend.open(path, 'rb') as toRead:
+                description = _digest(toRead, path)
+            self._save(key, description)
+
+        # update cache
+        with self._lock:
+            self._descriptions[path] = (key, description)
+
+        # return
+        return description
+
+    def invalidate(self, path=None):
+        """invalidate the cached description of the ui file
+
+        :param path: path of the ui file to invalidate - if None, the entire cache is invalidated
+        :type path: str or :class:`cgp_generic_utils.files.UiFile`
+        """
+
+        # init
+        path = os.path.abspath(str(path)) if path else None
+
+        # execute
+        with self._lock:
+            if path is None:
+                self._descriptions.clear()
+            else:
+                self._descriptions.pop(path, None)
+
+        # remove persisted description
+        if self._directory and path and os.path.isfile(self._persistedPath(path)):
+            os.remove(self._persistedPath(path))
+
+    def setDirectory(self, directory):
+        """set the directory where the descriptions are persisted
+
+        :param directory: directory of the persisted descriptions - if None, nothing is persisted
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        directory = os.path.abspath(str(directory)) if directory else None
+
+        # execute
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._directory = directory
+
+    # PRIVATE COMMANDS #
+
+    def _load(self, key):
+        """load the persisted description of the ui file
+
+        :param key: key of the current state of the ui file - (path, mtime, size)
+        :type key: tuple[str, float, int]
+
+        :return: the persisted description - None if missing or outdated
+        :rtype: dict
+        """
+
+        # return if nothing is persisted
+        if not self._directory:
+            return None
+
+        # execute
+        try:
+            with open(self._persistedPath(key[0]), 'rb') as toRead:
+                persistedKey, description = cgp_generic_utils.python._compat.pickle.load(toRead)
+        except (IOError, OSError, EOFError, ValueError, cgp_generic_utils.python._compat.pickle.UnpicklingError):
+            return None
+
+        # return
+        return description if tuple(persistedKey) == key else None
+
+    def _persistedPath(self, path):
+        """the path of the persisted description of the ui file
+
+        :param path: path of the ui file
+        :type path: str
+
+        :return: the path of the persisted description
+        :rtype: str
+        """
+
+        # init
+        digest = hashlib.md5(cgp_generic_utils.python._compat.toBytes(path)).hexdigest()
+
+        # return
+        return os.path.join(self._directory, '{0}.ui.pkl'.format(digest))
+
+    def _save(self, key, description):
+        """persist the description of the ui file
+
+        :param key: key of the current state of the ui file - (path, mtime, size)
+        :type key: tuple[str, float, int]
+
+        :param description: description to persist
+        :type description: dict
+        """
+
+        # return if nothing is persisted
+        if not self._directory:
+            return
+
+        # init
+        persistedPath = self._persistedPath(key[0])
+        temporaryPath = '{0}.{1}.tmp'.format(persistedPath, os.getpid())
+
+        # execute - write in a temporary file first so concurrent readers never get a partial description
+        try:
+            with open(temporaryPath, 'wb') as toWrite:
+                cgp_generic_utils.python._compat.pickle.dump((key, description),
+                                                             toWrite,
+                                                             cgp_generic_utils.python._compat.pickle.HIGHEST_PROTOCOL)
+
+            if os.path.isfile(persistedPath):
+                os.remove(persistedPath)
+
+            os.rename(temporaryPath, persistedPath)
+
+        except (IOError, OSError):
+            if os.path.isfile(temporaryPath):
+                os.remove(temporaryPath)
+
+
+UI_FORM_CACHE = UiFormCache()
+
+
+# COMMANDS #
+
+
+def invalidateUiFormCache(path=None):
+    """invalidate the cached form description of the ui file
+
+    :param path: path of the ui file to invalidate - if None, the entire cache is invalidated
+    :type path: str or :class:`cgp_generic_utils.files.UiFile`
+    """
+
+    # execute
+    UI_FORM_CACHE.invalidate(path=path)
+
+
+def loadUi(path, parent=None):
+    """build the widget described by the ui file - classes are remapped to their ``cgp_generic_utils.qt`` equivalent
+
+    :param path: path of the ui file
+    :type path: str or :class:`cgp_generic_utils.files.UiFile`
+
+    :param parent: widget under which the built widget will be parented
+    :type parent: :class:`PySide2.QtWidgets.QWidget`
+
+    :return: the built widget - its named children are accessible as attributes
+    :rtype: :class:`PySide2.QtWidgets.QWidget`
+    """
+
+    # return
+    return _Builder(UI_FORM_CACHE.description(path)).build(parent=parent)
+
+
+def setUiFormCacheDirectory(directory):
+    """set the directory where the digested ui form descriptions are persisted between sessions
+
+    :param directory: directory of the persisted descriptions - if None, nothing is persisted
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+    """
+
+    # execute
+    UI_FORM_CACHE.setDirectory(directory)
+
+
+# PRIVATE OBJECTS #
+
+
+class _Builder(object):
+    """builder of the widgets of a ui form description
+    """
+
+    # INIT #
+
+    def __init__(self, description):
+        """_Builder class initialization
+
+        :param description: form description to build
+        :type description: dict
+        """
+
+        # import qt lib here to avoid import issue in batch mode
+        import PySide2.QtCore
+        import PySide2.QtGui
+        import PySide2.QtWidgets
+        import cgp_generic_utils.qt
+
+        # init
+        self._description = description
+        self._objects = {}
+        self._qtCore = PySide2.QtCore
+        self._qtGui = PySide2.QtGui
+        self._qtWidgets = PySide2.QtWidgets
+        self._qt = cgp_generic_utils.qt
+
+    # COMMANDS #
+
+    def build(self, parent=None):
+        """build the form
+
+        :param parent: widget under which the built widget will be parented
+        :type parent: :class:`PySide2.QtWidgets.QWidget`
+
+        :return: the built widget
+        :rtype: :class:`PySide2.QtWidgets.QWidget`
+        """
+
+        # build widgets
+        root = self._widget(self._description['widget'], parent)
+
+        # expose named objects
+        for name, qObject in self._objects.items():
+            if qObject is not root:
+                setattr(root, name, qObject)
+
+        # connect signals
+        for sender, signal, receiver, slot in self._description['connections']:
+            if sender in self._objects and receiver in self._objects:
+                self._qtCore.QObject.connect(self._objects[sender], self._qtCore.SIGNAL(signal),
+                                             self._objects[receiver], self._qtCore.SLOT(slot))
+
+        self._qtCore.QMetaObject.connectSlotsByName(root)
+
+        # return
+        return root
+
+    # PRIVATE COMMANDS #
+
+    def _class(self, className):
+        """the class to instantiate for the ui class name
+
+        :param className: class name used in the ui file
+        :type className: str
+
+        :return: the class to instantiate
+        :rtype: type
+        """
+
+        # get cgp_generic_utils.qt equivalent
+        if className.startswith('Q') and className[1:] in self._qt.__all__:
+            return getattr(self._qt, className[1:])
+
+        # get custom widget base class
+        if className in self._description['customWidgets'] and not hasattr(self._qtWidgets, className):
+            return self._class(self._description['customWidgets'][className])
+
+        # errors
+        for module in [self._qtWidgets, self._qtGui, self._qtCore]:
+            if hasattr(module, className):
+                return getattr(module, className)
+
+        raise ValueError('{0} is not a supported ui class'.format(className))
+
+    def _enum(self, text, scope=None):
+        """the qt value of the ui enum
+
+        :param text: text of the enum - ``Qt::AlignLeft`` - ``QFrame::StyledPanel`` ...
+        :type text: str
+
+        :param scope: class holding the enum if not specified in the text
+        :type scope: type
+
+        :return: the enum value
+        :rtype: int
+        """
+
+        # init
+        names = text.split('::')
+
+        # get scope
+        if len(names) > 1:
+            for module in [self._qtCore, self._qtWidgets, self._qtGui]:
+                if hasattr(module, names[0]):
+                    scope = getattr(module, names[0])
+                    break
+
+        # return
+        return getattr(scope or self._qtCore.Qt, names[-1])
+
+    def _item(self, layout, item):
+        """add the item to the layout
+
+        :param layout: layout to add the item to
+        :type layout: :class:`PySide2.QtWidgets.QLayout`
+
+        :param item: description of the layout item
+        :type item: dict
+        """
+
+        # get item
+        if item['type'] == 'widget':
+            content = self._widget(item['content'], None)
+        elif item['type'] == 'layout':
+            content = self._layout(item['content'], None)
+        else:
+            content = self._spacer(item['content'])
+
+        # grid layouts
+        if isinstance(layout, self._qtWidgets.QGridLayout):
+            arguments = [content, item['row'], item['column'], item['rowSpan'], item['columnSpan']]
+            if item['type'] == 'widget':
+                layout.addWidget(*arguments)
+            elif item['type'] == 'layout':
+                layout.addLayout(*arguments)
+            else:
+                layout.addItem(*arguments)
+
+        # form layouts
+        elif isinstance(layout, self._qtWidgets.QFormLayout):
+            role = (self._qtWidgets.QFormLayout.SpanningRole if item['columnSpan'] > 1
+                    else self._qtWidgets.QFormLayout.FieldRole if item['column']
+                    else self._qtWidgets.QFormLayout.LabelRole)
+            {'widget': layout.setWidget, 'layout': layout.setLayout, 'spacer': layout.setItem}[item['type']](
+                item['row'], role, content)
+
+        # box layouts
+        else:
+            {'widget': layout.addWidget, 'layout': layout.addLayout, 'spacer': layout.addItem}[item['type']](content)
+
+        # set alignment
+        if item['alignment'] and item['type'] == 'widget':
+            layout.setAlignment(content, self._value(('set', item['alignment'])))
+
+    def _layout(self, description, parent):
+        """build the layout
+
+        :param description: description of the layout
+        :type description: dict
+
+        :param parent: widget the layout is set on - None for nested layouts
+        :type parent: :class:`PySide2.QtWidgets.QWidget`
+
+        :return: the built layout
+        :rtype: :class:`PySide2.QtWidgets.QLayout`
+        """
+
+        # init
+        layout = self._class(description['class'])(parent) if parent else self._class(description['class'])()
+        margins = list(layout.getContentsMargins())
+
+        if description['name']:
+            layout.setObjectName(description['name'])
+            self._objects[description['name']] = layout
+
+        # set properties
+        for name, value in description['properties']:
+            if name in ['leftMargin', 'topMargin', 'rightMargin', 'bottomMargin']:
+                margins[['leftMargin', 'topMargin', 'rightMargin', 'bottomMargin'].index(name)] = value[1]
+            elif name == 'margin':
+                margins = [value[1]] * 4
+            else:
+                self._setProperty(layout, name, value)
+
+        layout.setContentsMargins(*margins)
+
+        # add items
+        for item in description['items']:
+            self._item(layout, item)
+
+        # return
+        return layout
+
+    def _setProperty(self, qObject, name, value):
+        """set the property on the object
+
+        :param qObject: object to set the property on
+        :type qObject: :class:`PySide2.QtCore.QObject`
+
+        :param name: name of the property
+        :type name: str
+
+        :param value: description of the value of the property - (type, data)
+        :type value: tuple
+        """
+
+        # init
+        value = self._value(value, scope=type(qObject))
+        setter = getattr(qObject, 'set{0}{1}'.format(name[0].upper(), name[1:]), None)
+
+        # execute
+        if setter:
+            setter(value)
+        else:
+            qObject.setProperty(name, value)
+
+    def _spacer(self, description):
+        """build the spacer
+
+        :param description: description of the spacer
+        :type description: dict
+
+        :return: the built spacer
+        :rtype: :class:`PySide2.QtWidgets.QSpacerItem`
+        """
+
+        # init
+        properties = dict(description['properties'])
+        isHorizontal = properties.get('orientation', ('enum', 'Qt::Vertical'))[1].endswith('Horizontal')
+        sizeType = self._value(properties.get('sizeType', ('enum', 'QSizePolicy::Expanding')),
+                               scope=self._qtWidgets.QSizePolicy)
+        width, height = properties.get('sizeHint', ('size', (0, 0)))[1]
+        minimum = self._qtWidgets.QSizePolicy.Minimum
+
+        # return
+        return (self._qtWidgets.QSpacerItem(width, height, sizeType, minimum) if isHorizontal
+                else self._qtWidgets.QSpacerItem(width, height, minimum, sizeType))
+
+    def _value(self, value, scope=None):
+        """the qt value of the property value description
+
+        :param value: description of the value - (type, data)
+        :type value: tuple
+
+        :param scope: class holding the enums without scope
+        :type scope: type
+
+        :return: the qt value
+        :rtype: any
+        """
+
+        # init
+        valueType, data = value
+
+        # return
+        if valueType == 'enum':
+            return self._enum(data, scope=scope)
+
+        elif valueType == 'set':
+            flags = [self._enum(text, scope=scope) for text in data.split('|')]
+            return functools.reduce(lambda first, second: first | second, flags)
+
+        elif valueType == 'rect':
+            return self._qtCore.QRect(*data)
+
+        elif valueType == 'size':
+            return self._qtCore.QSize(*data)
+
+        elif valueType == 'color':
+            return self._qtGui.QColor(*data)
+
+        elif valueType == 'font':
+            font = self._qtGui.QFont()
+            for name, fontValue in data:
+                getattr(font, 'set{0}{1}'.format(name[0].upper(), name[1:]))(fontValue)
+            return font
+
+        elif valueType == 'sizepolicy':
+            sizePolicy = self._qtWidgets.QSizePolicy(self._enum(data[0], scope=self._qtWidgets.QSizePolicy),
+                                                     self._enum(data[1], scope=self._qtWidgets.QSizePolicy))
+            sizePolicy.setHorizontalStretch(data[2])
+            sizePolicy.setVerticalStretch(data[3])
+            return sizePolicy
+
+        elif valueType == 'iconset':
+            return self._qtGui.QIcon(data)
+
+        elif valueType == 'pixmap':
+            return self._qtGui.QPixmap(data)
+
+        return data
+
+    def _widget(self, description, parent):
+        """build the widget and its children
+
+        :param description: description of the widget
+        :type description: dict
+
+        :param parent: widget under which the built widget will be parented
+        :type parent: :class:`PySide2.QtWidgets.QWidget`
+
+        :return: the built widget
+        :rtype: :class:`PySide2.QtWidgets.QWidget`
+        """
+
+        # init
+        widget = self._class(description['class'])(parent)
+        widget.setObjectName(description['name'])
+        self._objects[description['name']] = widget
+
+        # set properties
+        for name, value in description['properties']:
+            self._setProperty(widget, name, value)
+
+        # add items of item views
+        if isinstance(widget, (self._qtWidgets.QComboBox, self._qtWidgets.QListWidget)):
+            for text in description['items']:
+                widget.addItem(text)
+
+        if description['columns'] and hasattr(widget, 'setHeaderLabels'):
+            widget.setHeaderLabels(description['columns'])
+
+        # set layout
+        if description['layout']:
+            self._layout(description['layout'], widget)
+
+        # add children
+        for child in description['children']:
+            self._child(widget, child)
+
+        # return
+        return widget
+
+    def _child(self, widget, description):
+        """build the child widget and add it to its container widget
+
+        :param widget: container widget
+        :type widget: :class:`PySide2.QtWidgets.QWidget`
+
+        :param description: description of the child widget
+        :type description: dict
+        """
+
+        # init
+        child = self._widget(description, widget)
+        attributes = dict(description['attributes'])
+
+        # execute
+        if isinstance(widget, self._qtWidgets.QTabWidget):
+            widget.addTab(child, attributes.get('title', ''))
+
+        elif isinstance(widget, self._qtWidgets.QToolBox):
+            widget.addItem(child, attributes.get('label', ''))
+
+        elif isinstance(widget, (self._qtWidgets.QStackedWidget, self._qtWidgets.QSplitter)):
+            widget.addWidget(child)
+
+        elif isinstance(widget, self._qtWidgets.QScrollArea):
+            widget.setWidget(child)
+
+        elif isinstance(widget, self._qtWidgets.QMainWindow):
+            if isinstance(child, self._qtWidgets.QMenuBar):
+                widget.setMenuBar(child)
+            elif isinstance(child, self._qtWidgets.QStatusBar):
+                widget.setStatusBar(child)
+            elif isinstance(child, self._qtWidgets.QToolBar):
+                widget.addToolBar(child)
+            else:
+                widget.setCentralWidget(child)
+
+
+# PRIVATE COMMANDS #
+
+
+def _digest(fileObject, path):
+    """parse the ui file into a plain form description
+
+    :param fileObject: file object of the ui file
+    :type fileObject: file
+
+    :param path: path of the ui file
+    :type path: str
+
+    :return: the form description - {widget: dict, connections: list, customWidgets: dict}
+    :rtype: dict
+    """
+
+    # import the xml lib here as it is only needed to parse the ui files not cached yet
+    import xml.etree.cElementTree
+
+    # init
+    root = xml.etree.cElementTree.parse(fileObject).getroot()
+
+    # errors
+    if root.find('widget') is None:
+        raise ValueError('{0} has no widget to load'.format(path))
+
+    # get custom widgets
+    customWidgets = {}
+
+    for node in root.iterfind('customwidgets/customwidget'):
+        customWidgets[node.findtext('class')] = node.findtext('extends') or 'QWidget'
+
+    # get connections
+    connections = [(node.findtext('sender'), node.findtext('signal'),
+                    node.findtext('receiver'), node.findtext('slot'))
+                   for node in root.iterfind('connections/connection')]
+
+    # return
+    return {'widget': _digestWidget(root.find('widget')),
+            'connections': connections,
+            'customWidgets': customWidgets}
+
+
+def _digestLayout(node):
+    """the description of the layout node
+
+    :param node: layout node
+    :type node: :class:`xml.etree.ElementTree.Element`
+
+    :return: the description of the layout
+    :rtype: dict
+    """
+
+    # init
+    items = []
+
+    # get items
+    for itemNode in node.iterfind('item'):
+
+        contentNode = itemNode[0] if len(itemNode) else None
+
+        if contentNode is None or contentNode.tag not in ['widget', 'layout', 'spacer']:
+            continue
+
+        content = (_digestWidget(contentNode) if contentNode.tag == 'widget'
+                   else _digestLayout(contentNode) if contentNode.tag == 'layout'
+                   else {'name': contentNode.get('name'), 'properties': _digestProperties(contentNode, 'property')})
+
+        items.append({'type': contentNode.tag,
+                      'content': content,
+                      'row': int(itemNode.get('row', 0)),
+                      'column': int(itemNode.get('column', 0)),
+                      'rowSpan': int(itemNode.get('rowspan', 1)),
+                      'columnSpan': int(itemNode.get('colspan', 1)),
+                      'alignment': itemNode.get('alignment')})
+
+    # return
+    return {'class': node.get('class'),
+            'name': node.get('name'),
+            'properties': _digestProperties(node, 'property'),
+            'items': items}
+
+
+def _digestProperties(node, tag):
+    """the descriptions of the property nodes
+
+    :param node: node holding the properties
+    :type node: :class:`xml.etree.ElementTree.Element`
+
+    :param tag: tag of the property nodes - ``property`` - ``attribute``
+    :type tag: str
+
+    :return: the descriptions of the properties - [(name, (type, data))]
+    :rtype: list[tuple]
+    """
+
+    # init
+    properties = []
+
+    # execute
+    for propertyNode in node.iterfind(tag):
+        if len(propertyNode):
+            value = _digestValue(propertyNode[0])
+            if value is not None:
+                properties.append((propertyNode.get('name'), value))
+
+    # return
+    return properties
+
+
+def _digestValue(node):
+    """the description of the value node
+
+    :param node: value node
+    :type node: :class:`xml.etree.ElementTree.Element`
+
+    :return: the description of the value - (type, data) - None if the type is not supported
+    :rtype: tuple
+    """
+
+    # init
+    text = node.text or ''
+
+    # return
+    if node.tag in ['string', 'cstring', 'enum', 'set', 'url']:
+        return node.tag if node.tag in ['enum', 'set'] else 'string', text
+
+    elif node.tag == 'bool':
+        return 'bool', text == 'true'
+
+    elif node.tag in ['number', 'uint', 'longlong', 'ulonglong']:
+        return 'number', int(text)
+
+    elif node.tag in ['double', 'float']:
+        return 'double', float(text)
+
+    elif node.tag == 'rect':
+        return 'rect', tuple(int(node.findtext(key)) for key in ['x', 'y', 'width', 'height'])
+
+    elif node.tag == 'size':
+        return 'size', (int(node.findtext('width')), int(node.findtext('height')))
+
+    elif node.tag == 'color':
+        return 'color', tuple(int(node.findtext(key, 255 if key == 'alpha' else 0))
+                              for key in ['red', 'green', 'blue', 'alpha'])
+
+    elif node.tag == 'font':
+        fontKeys = {'family': str, 'pointsize': int, 'weight': int,
+                    'italic': 'true'.__eq__, 'bold': 'true'.__eq__, 'underline': 'true'.__eq__}
+        fontNames = {'pointsize': 'pointSize'}
+        return 'font', [(fontNames.get(child.tag, child.tag), fontKeys[child.tag](child.text))
+                        for child in node if child.tag in fontKeys]
+
+    elif node.tag == 'sizepolicy':
+        return 'sizepolicy', (node.get('hsizetype'), node.get('vsizetype'),
+                              int(node.findtext('horstretch', 0)), int(node.findtext('verstretch', 0)))
+
+    elif node.tag in ['iconset', 'pixmap']:
+        path = node.findtext('normaloff') or text
+        return node.tag, path.strip()
+
+    return None
+
+
+def _digestWidget(node):
+    """the description of the widget node
+
+    :param node: widget node
+    :type node: :class:`xml.etree.ElementTree.Element`
+
+    :return: the description of the widget
+    :rtype: dict
+    """
+
+    # init
+    layoutNode = node.find('layout')
+
+    # return
+    return {'class': node.get('class'),
+            'name': node.get('name'),
+            'properties': _digestProperties(node, 'property'),
+            'attributes': [(name, value[1]) for name, value in _digestProperties(node, 'attribute')],
+            'items': [itemNode.findtext('property/string') or '' for itemNode in node.iterfind('item')],
+            'columns': [columnNode.findtext('property/string') or '' for columnNode in node.iterfind('column')],
+            'layout': _digestLayout(layoutNode) if layoutNode is not None else None,
+            'children': [_digestWidget(childNode) for childNode in node.iterfind('widget')]}
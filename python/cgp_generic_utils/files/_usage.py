@@ -0,0 +1,308 @@
+"""
+disk usage library
+"""
+
+# imports python
+import os
+import stat
+import threading
+
+# imports local
+import cgp_generic_utils.python._compat
+
+
+# CACHE OBJECTS #
+
+
+class DiskUsageCache(object):
+    """cache of the scanned content of directories keyed on the mtime of each directory
+
+    a directory is only listed again when its mtime changes so repeated queries only rescan the modified directories -
+    the mtime of a directory doesn't change when a file content is modified in place, invalidate it in that case
+    """
+
+    # INIT #
+
+    def __init__(self):
+        """DiskUsageCache class initialization
+        """
+
+        # init
+        self._records = {}
+        self._lock = threading.RLock()
+
+    # COMMANDS #
+
+    def invalidate(self, path=None):
+        """invalidate the cached content of the directory and its sub directories
+
+        :param path: path of the directory to invalidate - if None, the entire cache is invalidated
+        :type path: str or :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        path = os.path.abspath(str(path)) if path else None
+        prefix = os.path.join(path, '') if path else None
+
+        # execute
+        with self._lock:
+            for cachedPath in list(self._records):
+                if path is None or cachedPath == path or cachedPath.startswith(prefix):
+                    del self._records[cachedPath]
+
+    def sizes(self, directory, processes=None, useCache=True):
+        """the total size of the directory and of each of its sub directories - hardlinks are counted once
+
+        :param directory: directory to get the sizes of
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param processes: count of threads used to scan the directories - default is the count of cpus
+        :type processes: int
+
+        :param useCache: ``True`` : only the directories with a modified mtime are scanned -
+                         ``False`` : every directory is scanned so files modified in place are measured again
+        :type useCache: bool
+
+        :return: the total size in bytes of each directory - {directoryPath: size}
+        :rtype: dict
+        """
+
+        # import multiprocessing here as it is only needed to scan the directories in parallel
+        import multiprocessing
+
+        # init
+        directory = os.path.abspath(str(directory))
+        records = self._scan(directory, processes or multiprocessing.cpu_count(), useCache)
+        seenLinks = set()
+        ownSizes = {}
+        totals = {}
+        order = []
+        stack = [directory]
+
+        # errors
+        if directory not in records:
+            raise ValueError('{0} is not an existing directory'.format(directory))
+
+        # get own sizes in depth first order - a hardlinked file is only counted in the first directory holding it
+        while stack:
+            path = stack.pop()
+            order.append(path)
+
+            _, size, links, subDirectories = records[path]
+
+            for device, inode, linkSize in links:
+                if (device, inode) not in seenLinks:
+                    seenLinks.add((device, inode))
+                    size += linkSize
+
+            ownSizes[path] = size
+            stack.extend(sorted(subDirectories, reverse=True))
+
+        # get totals - children are always processed before their parent in reversed depth first order
+        for path in reversed(order):
+            totals[path] = ownSizes[path] + sum(totals[subDirectory] for subDirectory in records[path][3])
+
+        # return
+        return totals
+
+    # PRIVATE COMMANDS #
+
+    def _scan(self, directory, processes, useCache):
+        """scan the directory tree - only the directories with a modified mtime are listed if the cache is used
+
+        :param directory: directory to scan
+        :type directory: str
+
+        :param processes: count of threads used to scan the directories
+        :type processes: int
+
+        :param useCache: ``True`` : the cached directories with an unchanged mtime are not listed again -
+                         ``False`` : every directory is listed
+        :type useCache: bool
+
+        :return: the records of the scanned directories - {path: (mtime, size, hardlinks, subDirectories)}
+        :rtype: dict
+        """
+
+        # import multiprocessing here as it is only needed to scan the directories in parallel
+        import multiprocessing.pool
+
+        # init
+        records = {}
+        pending = [directory] if os.path.isdir(directory) else []
+        pool = multiprocessing.pool.ThreadPool(processes) if processes > 1 else None
+
+        # scan level by level
+        try:
+            while pending:
+
+                # get outdated directories
+                toScan = []
+
+                for path in pending:
+                    # a directory that can't be stat gets an empty record as its parent still lists it
+                    try:
+                        mtime = os.stat(path).st_mtime
+                    except OSError:
+                        records[path] = (None, 0, [], [])
+                        continue
+
+                    with self._lock:
+                        cached = self._records.get(path) if useCache else None
+
+                    if cached and cached[0] == mtime:
+                        records[path] = cached
+                    else:
+                        toScan.append(path)
+
+                # scan outdated directories
+                if pool and len(toScan) > 1:
+                    results = pool.map(_scanDirectory, toScan)
+                else:
+                    results = [_scanDirectory(path) for path in toScan]
+
+                with self._lock:
+                    for path, record in results:
+                        self._records[path] = record
+                        records[path] = record
+
+                # get next level
+                pending = [subDirectory
+                           for path in pending if path in records
+                           for subDirectory in records[path][3]]
+
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+        # return
+        return records
+
+
+DISK_USAGE_CACHE = DiskUsageCache()
+
+
+# COMMANDS #
+
+
+def diskUsage(directory, depth=1, processes=None, useCache=True):
+    """the disk usage report of the directory - the total size of the directory and its sub directories
+
+    :param directory: directory to get the disk usage of
+    :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+    :param depth: depth of the sub directories to report - if None, all the sub directories are reported
+    :type depth: int
+
+    :param processes: count of threads used to scan the directories - default is the count of cpus
+    :type processes: int
+
+    :param useCache: ``True`` : only the directories with a modified mtime are scanned -
+                     ``False`` : every directory is scanned so files modified in place are measured again
+    :type useCache: bool
+
+    :return: the total size in bytes of the reported directories sorted from the biggest - [(directoryPath, size)]
+    :rtype: list[tuple[str, int]]
+    """
+
+    # init
+    directory = os.path.abspath(str(directory))
+    rootDepth = directory.rstrip(os.sep).count(os.sep)
+    sizes = DISK_USAGE_CACHE.sizes(directory, processes=processes, useCache=useCache)
+
+    # return
+    return sorted([(path, size) for path, size in sizes.items()
+                   if depth is None or path.count(os.sep) - rootDepth <= depth],
+                  key=lambda item: (-item[1], item[0]))
+
+
+def invalidateDiskUsageCache(path=None):
+    """invalidate the cached content of the directory and its sub directories
+
+    :param path: path of the directory to invalidate - if None, the entire cache is invalidated
+    :type path: str or :class:`cgp_generic_utils.files.Directory`
+    """
+
+    # execute
+    DISK_USAGE_CACHE.invalidate(path=path)
+
+
+# PRIVATE COMMANDS #
+
+
+def _scanDirectory(path):
+    """list the content of the directory
+
+    :param path: path of the directory to scan
+    :type path: str
+
+    :return: the path and the record of the directory - (path, (mtime, size, hardlinks, subDirectories))
+    :rtype: tuple
+    """
+
+    # init - mtime is get before listing so a modification during the scan invalidates the record
+    size = 0
+    links = []
+    subDirectories = []
+
+    try:
+        mtime = os.stat(path).st_mtime
+        children = _childStats(path)
+    except OSError:
+        return path, (None, 0, [], [])
+
+    # execute
+    for childPath, childStat in children:
+        if childStat is None or stat.S_ISDIR(childStat.st_mode):
+            subDirectories.append(childPath)
+        elif not stat.S_ISREG(childStat.st_mode):
+            continue
+        elif childStat.st_nlink > 1:
+            links.append((childStat.st_dev, childStat.st_ino, childStat.st_size))
+        else:
+            size += childStat.st_size
+
+    # return
+    return path, (mtime, size, links, subDirectories)
+
+
+def _childStats(path):
+    """the lstat of the children of the directory - the children that can't be stat are skipped
+
+    with ``os.scandir`` the sub directories are known from the directory entries so they are not stat, and the stat of
+    the files is get from the directory entries on windows
+
+    :param path: path of the directory
+    :type path: str
+
+    :return: the path and the lstat of each child - (childPath, lstat) - lstat is None for the sub directories known
+             from the directory entries
+    :rtype: list[tuple[str, :class:`os.stat_result`]]
+    """
+
+    # init
+    scandir = cgp_generic_utils.python._compat.scandir
+    childStats = []
+
+    # list with the directory entries
+    if scandir is not None:
+        for entry in scandir(path):
+            try:
+                childStats.append((entry.path,
+                                   None if entry.is_dir(follow_symlinks=False) else entry.stat(follow_symlinks=False)))
+            except OSError:
+                continue
+
+    # list then stat each child
+    else:
+        for name in os.listdir(path):
+            childPath = os.path.join(path, name)
+
+            try:
+                childStats.append((childPath, os.lstat(childPath)))
+            except OSError:
+                continue
+
+    # return
+    return childStats
@@ -0,0 +1,209 @@
+"""
+versioned file library - resolves the versions of files such as ``asset_v001.ma``
+"""
+
+# imports python
+import os
+import re
+import threading
+
+# imports local
+from . import _backend
+
+
+_VERSION_PATTERN = re.compile(r'^(.*?)(?<![a-zA-Z])([vV])(\d+)(\.[^.]+)?$')
+
+
+# CACHE OBJECTS #
+
+
+class VersionIndexCache(object):
+    """cache of the versioned children of directories keyed on the mtime of each directory
+
+    a directory is only listed again when its mtime changes, which happens when a child is added, removed or renamed -
+    so publishing a new version refreshes the index while the other queries never list the directory again
+    """
+
+    # INIT #
+
+    def __init__(self):
+        """VersionIndexCache class initialization
+        """
+
+        # init
+        self._records = {}
+        self._lock = threading.RLock()
+
+    # COMMANDS #
+
+    def invalidate(self, path=None):
+        """invalidate the cached index of the directory and its sub directories
+
+        :param path: path of the directory to invalidate - if None, the entire cache is invalidated
+        :type path: str or :class:`cgp_generic_utils.files.Directory`
+        """
+
+        # init
+        path = os.path.abspath(str(path)) if path else None
+        prefix = os.path.join(path, '') if path else None
+
+        # execute
+        with self._lock:
+            for cachedPath in list(self._records):
+                if path is None or cachedPath == path or cachedPath.startswith(prefix):
+                    del self._records[cachedPath]
+
+    def latest(self, directory, name, extension=None, backend=None):
+        """the latest version of the versioned children of the directory
+
+        :param directory: directory holding the versioned children
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param name: name of the versioned children without the version - ``asset`` for ``asset_v001.ma``
+        :type name: str
+
+        :param extension: extension of the versioned children - default is all extensions
+        :type extension: str
+
+        :param backend: storage backend of the directory - default is the backend the path is mounted on
+        :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+
+        :return: the latest version and the name of its child - (version, childName) - ``None`` if no version
+        :rtype: tuple[int, str]
+        """
+
+        # execute - the versions are sorted so the latest is the first matching one from the end
+        index = self._index(os.path.abspath(str(directory)), backend)
+
+        for version, childName, childExtension in reversed(index.get(name, ())):
+            if extension is None or childExtension == extension:
+                return version, childName
+
+        # return
+        return None
+
+    def versions(self, directory, name, extension=None, backend=None):
+        """the versions of the versioned children of the directory
+
+        :param directory: directory holding the versioned children
+        :type directory: str or :class:`cgp_generic_utils.files.Directory`
+
+        :param name: name of the versioned children without the version - ``asset`` for ``asset_v001.ma``
+        :type name: str
+
+        :param extension: extension of the versioned children - default is all extensions
+        :type extension: str
+
+        :param backend: storage backend of the directory - default is the backend the path is mounted on
+        :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+
+        :return: the sorted versions and the names of their children - [(version, childName)]
+        :rtype: list[tuple[int, str]]
+        """
+
+        # init
+        versions = []
+
+        # execute - a version held by several children is returned once, with the first child name
+        for version, childName, childExtension in self._index(os.path.abspath(str(directory)), backend).get(name, ()):
+            if (extension is None or childExtension == extension) and (not versions or versions[-1][0] != version):
+                versions.append((version, childName))
+
+        # return
+        return versions
+
+    # PRIVATE COMMANDS #
+
+    def _index(self, directory, backend=None):
+        """the index of the versioned children of the directory - indexed again if the directory or its backend changed
+
+        :param directory: path of the directory
+        :type directory: str
+
+        :param backend: storage backend of the directory - default is the backend the path is mounted on
+        :type backend: :class:`cgp_generic_utils.files.StorageBackend`
+
+        :return: the index - {name: [(version, childName, extension)]} - sorted by version and child name
+        :rtype: dict
+        """
+
+        # init
+        backend = backend or _backend.storageBackend(directory)
+
+        # errors
+        if not backend.isDirectory(directory):
+            raise ValueError('{0} is not an existing directory'.format(directory))
+
+        # return if up to date
+        mtime = backend.stat(directory)[0]
+
+        with self._lock:
+            cached = self._records.get(directory)
+
+        if cached and cached[0] is backend and cached[1] == mtime:
+            return cached[2]
+
+        # get index
+        index = {}
+
+        for childName in backend.listDirectory(directory):
+            match = _VERSION_PATTERN.match(childName)
+
+            if match:
+                index.setdefault(match.group(1).rstrip('._- '), []).append((int(match.group(3)),
+                                                                            childName,
+                                                                            (match.group(4) or '.')[1:] or None))
+
+        for versions in index.values():
+            versions.sort()
+
+        # update index
+        with self._lock:
+            self._records[directory] = (backend, mtime, index)
+
+        # return
+        return index
+
+
+VERSION_INDEX_CACHE = VersionIndexCache()
+
+
+# COMMANDS #
+
+
+def invalidateVersionIndexCache(path=None):
+    """invalidate the cached index of the versioned children of the directory and its sub directories
+
+    :param path: path of the directory to invalidate - if None, the entire cache is invalidated
+    :type path: str or :class:`cgp_generic_utils.files.Directory`
+    """
+
+    # execute
+    VERSION_INDEX_CACHE.invalidate(path=path)
+
+
+def versionName(childName, version):
+    """the name of the child at the other version - the naming and the padding of the version are kept
+
+    :param childName: name of a versioned child - ``asset_v001.ma``
+    :type childName: str
+
+    :param version: the other version
+    :type version: int
+
+    :return: the name of the child at the other version - ``asset_v002.ma``
+    :rtype: str
+    """
+
+    # init
+    match = _VERSION_PATTERN.match(childName)
+
+    # errors
+    if not match:
+        raise ValueError('{0} is not a versioned name'.format(childName))
+
+    # init
+    head, token, digits, extension = match.groups()
+
+    # return
+    return '{0}{1}{2:0{3}d}{4}'.format(head, token, version, len(digits), extension or '')
@@ -0,0 +1,372 @@
+"""
+zip archive directory library - reads the members of a zip archive without extracting it
+"""
+
+# imports python
+import os
+import errno
+import zipfile
+import threading
+
+# imports local
+import cgp_generic_utils.python._compat
+from . import _backend, _generic
+
+
+_ZIP_BACKENDS = {}
+_ZIP_BACKENDS_LOCK = threading.Lock()
+
+
+# BACKEND OBJECTS #
+
+
+class ZipBackend(_backend.StorageBackend):
+    """read only storage backend serving the members of a zip archive as files and directories
+
+    the central directory of the archive is indexed once and indexed again only when the mtime or size of the
+    archive changes - members are decompressed on the fly when read, nothing is extracted
+    """
+
+    # INIT #
+
+    def __init__(self, path):
+        """ZipBackend class initialization
+
+        :param path: path of the zip archive
+        :type path: str
+        """
+
+        # init
+        self._path = os.path.abspath(str(path))
+        self._key = None
+        self._archive = None
+        self._files = {}
+        self._directories = {}
+        self._lock = threading.RLock()
+
+    # COMMANDS #
+
+    def copyFile(self, source, destination):
+        """copy the file - the archive is read only
+
+        :param source: path of the file to copy
+        :type source: str
+
+        :param destination: path of the copied file
+        :type destination: str
+        """
+
+        # errors
+        raise OSError(errno.EROFS, os.strerror(errno.EROFS), destination)
+
+    def isDirectory(self, path):
+        """check if the path is a directory of the archive - the archive itself is its root directory
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a directory - ``False`` : the path is not a directory
+        :rtype: bool
+        """
+
+        # return
+        return path in self._index()[1]
+
+    def isFile(self, path):
+        """check if the path is a file of the archive
+
+        :param path: path to check
+        :type path: str
+
+        :return: ``True`` : the path is a file - ``False`` : the path is not a file
+        :rtype: bool
+        """
+
+        # return
+        return path in self._index()[0]
+
+    def isWritable(self, path):
+        """check if the file can be written - the archive is read only
+
+        :param path: path of the file
+        :type path: str
+
+        :return: ``False`` : the archive is read only
+        :rtype: bool
+        """
+
+        # return
+        return False
+
+    def listDirectory(self, path):
+        """the names of the children of the directory of the archive
+
+        :param path: path of the directory
+        :type path: str
+
+        :return: the names of the children of the directory - unsorted
+        :rtype: list[str]
+        """
+
+        # init
+        files, directories = self._index()
+
+        # errors
+        if path in files:
+            raise OSError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), path)
+
+        if path not in directories:
+            raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+        # return
+        return list(directories[path])
+
+    def makeDirectories(self, path):
+        """create the directory - the archive is read only
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # errors
+        raise OSError(errno.EROFS, os.strerror(errno.EROFS), path)
+
+    def move(self, source, destination):
+        """move the file/directory - the archive is read only
+
+        :param source: path of the file/directory to move
+        :type source: str
+
+        :param destination: path the file/directory is moved to
+        :type destination: str
+        """
+
+        # errors
+        raise OSError(errno.EROFS, os.strerror(errno.EROFS), source)
+
+    def open(self, path, mode='r'):
+        """open the file of the archive - the member is decompressed while it is read
+
+        :param path: path of the file
+        :type path: str
+
+        :param mode: mode used to open the file - only read modes are supported
+        :type mode: str
+
+        :return: the file object - usable as a context
+        :rtype: :class:`zipfile.ZipExtFile`
+        """
+
+        # errors
+        if set(mode) & set('wa+'):
+            raise IOError(errno.EROFS, os.strerror(errno.EROFS), path)
+
+        # init
+        with self._lock:
+            files, directories = self._index()
+            archive = self._archive
+
+        # errors
+        if path in directories:
+            raise IOError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+
+        if path not in files:
+            raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+        # get file - each member is read through its own file handle so members can be read concurrently
+        fileObject = archive.open(files[path], 'rU' if 'U' in mode and cgp_generic_utils.python._compat.PY2 else 'r')
+
+        # return
+        return cgp_generic_utils.python._compat.textFile(fileObject, mode)
+
+    def path(self):
+        """the path of the zip archive
+
+        :return: the path of the zip archive
+        :rtype: str
+        """
+
+        # return
+        return self._path
+
+    def remove(self, path):
+        """remove the file - the archive is read only
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        # errors
+        raise OSError(errno.EROFS, os.strerror(errno.EROFS), path)
+
+    def removeDirectory(self, path):
+        """remove the directory - the archive is read only
+
+        :param path: path of the directory
+        :type path: str
+        """
+
+        # errors
+        raise OSError(errno.EROFS, os.strerror(errno.EROFS), path)
+
+    def stat(self, path):
+        """the modification time and size of the file/directory - the mtime is the one of the archive
+
+        :param path: path of the file/directory
+        :type path: str
+
+        :return: the modification time and the uncompressed size in bytes - (mtime, size)
+        :rtype: tuple[float, int]
+        """
+
+        # init
+        with self._lock:
+            files, directories = self._index()
+            mtime = self._key[0] if self._key else 0.0
+
+        # return
+        if path in files:
+            return mtime, files[path].file_size
+
+        if path in directories:
+            return mtime, 0
+
+        # errors
+        raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    # PRIVATE COMMANDS #
+
+    def _index(self):
+        """the index of the central directory of the archive - indexed again if the archive changed
+
+        :return: the files and directories of the archive - ({path: zipInfo}, {path: childrenNames})
+        :rtype: tuple[dict, dict]
+        """
+
+        # init
+        try:
+            archiveStat = os.stat(self._path)
+            key = (archiveStat.st_mtime, archiveStat.st_size)
+        except OSError:
+            key = None
+
+        # return if up to date
+        with self._lock:
+            if key == self._key:
+                return self._files, self._directories
+
+            # get index
+            files = {}
+            directories = {}
+
+            if self._archive:
+                self._archive.close()
+
+            self._archive = zipfile.ZipFile(self._path, 'r', allowZip64=True) if key else None
+
+            if self._archive:
+                directories[self._path] = set()
+
+                for info in self._archive.infolist():
+
+                    # skip members escaping the archive
+                    name = os.path.normpath(info.filename.replace('/', os.sep))
+
+                    if os.path.isabs(name) or name == os.pardir or name.startswith(os.pardir + os.sep):
+                        continue
+
+                    # add member and its parent directories
+                    path = os.path.join(self._path, name)
+
+                    if not info.filename.endswith('/'):
+                        files[path] = info
+                    elif path not in directories:
+                        directories[path] = set()
+
+                    while path != self._path:
+                        parent = os.path.dirname(path)
+                        directories.setdefault(parent, set()).add(os.path.basename(path))
+                        path = parent
+
+            # update index - replaced at once so concurrent readers never see a partial index
+            self._files = files
+            self._directories = directories
+            self._key = key
+
+        # return
+        return files, directories
+
+
+# ZIP OBJECTS #
+
+
+class ZipDirectory(_generic.Directory):
+    """directory object exposing the members of a ``.zip`` archive as file and directory objects
+
+    the archive is mounted as a read only storage backend so the members are regular file objects -
+    ``content``, ``read`` and ``stream`` read directly from the archive without extraction
+    """
+
+    # ATTRIBUTES #
+
+    __slots__ = ()
+
+    # INIT #
+
+    def __init__(self, path):
+        """ZipDirectory class initialization
+
+        :param path: path of the zip archive
+        :type path: str
+        """
+
+        # init
+        super(ZipDirectory, self).__init__(path)
+
+        # errors
+        if not os.path.isfile(self.path()) or not zipfile.is_zipfile(self.path()):
+            raise ValueError('{0} is not an existing zip archive'.format(self.path()))
+
+        # execute
+        _zipBackend(self.path())
+
+    # PRIVATE COMMANDS #
+
+    def _storageBackend(self):
+        """the storage backend of the archive - the archive itself is its root directory
+
+        :return: the storage backend of the archive
+        :rtype: :class:`cgp_generic_utils.files.ZipBackend`
+        """
+
+        # return
+        return _zipBackend(self.path())
+
+
+# PRIVATE COMMANDS #
+
+
+def _zipBackend(path):
+    """the backend of the zip archive - created and mounted on the archive path on first use
+
+    :param path: path of the zip archive
+    :type path: str
+
+    :return: the backend of the zip archive
+    :rtype: :class:`cgp_generic_utils.files.ZipBackend`
+    """
+
+    # return if already mounted
+    backend = _ZIP_BACKENDS.get(path)
+
+    if backend:
+        return backend
+
+    # execute
+    with _ZIP_BACKENDS_LOCK:
+        if path not in _ZIP_BACKENDS:
+            _ZIP_BACKENDS[path] = ZipBackend(path)
+            _backend.mountStorageBackend(path, _ZIP_BACKENDS[path])
+
+    # return
+    return _ZIP_BACKENDS[path]
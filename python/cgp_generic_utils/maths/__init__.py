@@ -3,7 +3,11 @@ mathematical functions
 """
 
 # imports local
-from ._numeric import clamp, roundValue
+import cgp_generic_utils.python
 
 
 __all__ = ['clamp', 'roundValue']
+
+
+# register submodules - imported on first access
+cgp_generic_utils.python.lazyModule(__name__, {'_numeric': ['clamp', 'roundValue']})
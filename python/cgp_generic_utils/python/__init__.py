@@ -3,7 +3,7 @@ python management functions
 """
 
 # imports local
-from ._module import deleteModules, import_
+from ._module import LazyModule, checkImportBudgets, deleteModules, importTime, import_, lazyModule
 
 
-__all__ = ['deleteModules', 'import_']
+__all__ = ['LazyModule', 'checkImportBudgets', 'deleteModules', 'importTime', 'import_', 'lazyModule']
@@ -0,0 +1,88 @@
+"""
+python 2 / python 3 compatibility library - the faster implementations of the standard library are used when available
+"""
+
+# imports python
+import io
+import os
+import sys
+import time
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+try:
+    from importlib.util import MAGIC_NUMBER
+except ImportError:
+    import imp
+    MAGIC_NUMBER = imp.get_magic()
+
+
+PY2 = sys.version_info[0] == 2
+
+intern = intern if PY2 else sys.intern
+perfCounter = getattr(time, 'perf_counter', time.time)
+scandir = getattr(os, 'scandir', None)
+stringType = basestring if PY2 else str
+
+
+# COMMANDS #
+
+
+def toBytes(text, encoding='utf-8'):
+    """the bytes of the text - the bytes are returned as is
+
+    :param text: the text to get the bytes from
+    :type text: str or unicode or bytes
+
+    :param encoding: encoding of the text
+    :type encoding: str
+
+    :return: the bytes of the text
+    :rtype: bytes
+    """
+
+    # return
+    return text if isinstance(text, bytes) else text.encode(encoding)
+
+
+def toText(data, encoding='utf-8'):
+    """the native str of the data - bytes on python 2, unicode on python 3 - undecodable bytes are kept as surrogates
+
+    :param data: the data to get the native str from
+    :type data: bytes or str
+
+    :param encoding: encoding of the data
+    :type encoding: str
+
+    :return: the native str of the data
+    :rtype: str
+    """
+
+    # return
+    return data if PY2 or isinstance(data, str) else data.decode(encoding, 'surrogateescape')
+
+
+def textFile(fileObject, mode):
+    """the file object decoded like the builtin open in text mode - the file object is returned as is on python 2 or
+    in binary mode
+
+    :param fileObject: the binary file object
+    :type fileObject: file
+
+    :param mode: mode used to open the file
+    :type mode: str
+
+    :return: the file object
+    :rtype: file
+    """
+
+    # return
+    return fileObject if PY2 or 'b' in mode else io.TextIOWrapper(fileObject, encoding='utf-8')
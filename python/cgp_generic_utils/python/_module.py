@@ -4,7 +4,141 @@ library of functions for python module management
 
 
 # imports python
+import os
 import sys
+import types
+
+
+# MODULE OBJECTS #
+
+
+class LazyModule(types.ModuleType):
+    """module whose attributes are imported from its submodules on first access
+
+    the submodules of a package are only imported when one of their attributes is accessed, so importing the package
+    doesn't import its dependencies - the imported attributes are set on the module and accessed directly afterwards
+    """
+
+    # INIT #
+
+    def __init__(self, module, submodules):
+        """LazyModule class initialization
+
+        :param module: the module to replace - its content is kept by the lazy module
+        :type module: module
+
+        :param submodules: the attributes of each submodule - {submodule: [attribute]} - an attribute named like its
+                           submodule is the submodule itself
+        :type submodules: dict
+        """
+
+        # init
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__['_lazyModule'] = module
+        self.__dict__['_lazyAttributes'] = {}
+
+        # execute
+        self._registerSubmodules(submodules)
+
+    def __dir__(self):
+        """the attributes of the module, including the ones not imported yet
+
+        :return: the attributes of the module
+        :rtype: list[str]
+        """
+
+        # return
+        return sorted(set(self.__dict__) | set(self._lazyAttributes))
+
+    def __getattr__(self, name):
+        """the attribute of the module - its submodule is imported on first access
+
+        :param name: name of the attribute
+        :type name: str
+
+        :return: the attribute
+        :rtype: any
+        """
+
+        # errors
+        if name not in self._lazyAttributes:
+            raise AttributeError('{0} is not an attribute of {1}'.format(name, self.__name__))
+
+        # get attribute
+        submoduleName = self._lazyAttributes[name]
+        submodule = import_('{0}.{1}'.format(self.__name__, submoduleName))
+        value = submodule if name == submoduleName else getattr(submodule, name)
+
+        # update module - the attribute is accessed directly afterwards
+        setattr(self, name, value)
+
+        # return
+        return value
+
+    # PRIVATE COMMANDS #
+
+    def _registerSubmodules(self, submodules):
+        """register the attributes of the submodules - they are imported on first access
+
+        :param submodules: the attributes of each submodule - {submodule: [attribute]}
+        :type submodules: dict
+        """
+
+        # execute
+        for submoduleName, attributes in submodules.items():
+            for attribute in attributes:
+                self._lazyAttributes[attribute] = submoduleName
+
+
+# COMMANDS #
+
+
+def checkImportBudgets(modules=None, repeat=3):
+    """check the import budgets of the modules - the import of each module and the first access of each of its public
+    attributes are measured in fresh interpreters
+
+    :param modules: names of the modules to check - default is the modules of
+                    ``cgp_generic_utils.constants.ImportBudget``
+    :type modules: list[str]
+
+    :param repeat: count of interpreters measuring each import - the best time is kept
+    :type repeat: int
+
+    :return: the time spent to import each module and to access each attribute in seconds -
+             {module: time, module.attribute: time}
+    :rtype: dict
+    """
+
+    # import constants here as the module is imported by the packages themselves
+    import cgp_generic_utils.constants
+
+    # init
+    modules = modules or sorted(cgp_generic_utils.constants.ImportBudget.ALL)
+    times = {}
+    failures = []
+
+    # execute
+    for module in modules:
+        try:
+            times[module] = importTime(module, repeat=repeat)
+            attributes = getattr(import_(module), '__all__', [])
+        except RuntimeError as error:
+            failures.append(str(error))
+            continue
+
+        for attribute in attributes:
+            try:
+                times['{0}.{1}'.format(module, attribute)] = importTime(module, repeat=repeat, attribute=attribute)
+            except RuntimeError as error:
+                failures.append(str(error))
+
+    # errors
+    if failures:
+        raise RuntimeError('import budgets are not met :\n{0}'.format('\n'.join(failures)))
+
+    # return
+    return times
 
 
 def deleteModules(*args):
@@ -35,3 +169,98 @@ def import_(module, command=None):
 
     # return
     return getattr(mod, command) if command else mod
+
+
+def importTime(module, repeat=5, budget=None, attribute=None):
+    """the time spent to import the module - measured in fresh interpreters, so nothing is imported yet
+
+    :param module: name of the module to import - ``cgp_generic_utils.files``
+    :type module: str
+
+    :param repeat: count of interpreters measuring the import - the best time is returned
+    :type repeat: int
+
+    :param budget: maximum time in seconds allowed to import the module - default is the budget of the module in
+                   ``cgp_generic_utils.constants.ImportBudget`` if any, or ``ImportBudget.ATTRIBUTE`` for an attribute
+    :type budget: float
+
+    :param attribute: attribute of the module to access - if specified, the first access of the attribute is measured
+                      instead of the import of the module
+    :type attribute: str
+
+    :return: the time spent to import the module or to access the attribute in seconds
+    :rtype: float
+    """
+
+    # import subprocess here as it is only needed to measure
+    import subprocess
+    import cgp_generic_utils.constants
+
+    # init
+    label = '{0}.{1}'.format(module, attribute) if attribute else module
+    budgets = cgp_generic_utils.constants.ImportBudget
+    budget = budget if budget is not None else budgets.ATTRIBUTE if attribute else budgets.ALL.get(module)
+    setup = 'import {0}\n'.format(module) if attribute else ''
+    statement = ('getattr(sys.modules[{0!r}], {1!r})'.format(module, attribute) if attribute
+                 else 'import {0}'.format(module))
+    script = ('import sys, time\n'
+              '{0}'
+              'initialTime = time.time()\n'
+              '{1}\n'
+              'sys.stdout.write(repr(time.time() - initialTime))').format(setup, statement)
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    times = []
+
+    # execute
+    for _ in range(repeat):
+        process = subprocess.Popen([sys.executable, '-c', script],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE,
+                                   env=environment,
+                                   universal_newlines=True)
+        output, error = process.communicate()
+
+        if process.returncode:
+            raise RuntimeError('{0} failed to be imported : {1}'
+                               .format(label, error.strip().splitlines()[-1]))
+
+        times.append(float(output))
+
+    # errors
+    if budget is not None and min(times) > budget:
+        raise RuntimeError('{0} is imported in {1:.4f} seconds - Expected : {2:.4f} seconds at most'
+                           .format(label, min(times), budget))
+
+    # return
+    return min(times)
+
+
+def lazyModule(name, submodules):
+    """replace the module by a lazy module - its attributes are imported from its submodules on first access
+
+    called at the end of the ``__init__`` of a package as ``lazyModule(__name__, {submodule: [attribute]})``
+
+    :param name: name of the module to replace
+    :type name: str
+
+    :param submodules: the attributes of each submodule - {submodule: [attribute]} - an attribute named like its
+                       submodule is the submodule itself
+    :type submodules: dict
+
+    :return: the lazy module
+    :rtype: :class:`cgp_generic_utils.python.LazyModule`
+    """
+
+    # init
+    module = sys.modules[name]
+
+    # return if already lazy - the package is reloaded
+    if isinstance(module, LazyModule):
+        module._registerSubmodules(submodules)
+        return module
+
+    # execute
+    module = sys.modules[name] = LazyModule(module, submodules)
+
+    # return
+    return module
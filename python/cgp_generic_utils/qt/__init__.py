@@ -3,11 +3,7 @@ subclassed QtWidgets, custom dialogs and widgets for UI development
 """
 
 # imports local
-from ._qtGui import Font, Icon
-from ._dialog import (BaseDialog, CheckBoxDialog, ComboBoxDialog,
-                      ComboBoxLineEditDialog, LineEditDialog, StatusDialog,TextEditDialog)
-from ._custom import CollapsibleWidget, Tool
-from ._qtWidgets import ComboBox, LineEdit, ListWidget, PushButton, TreeWidget, TreeWidgetItem
+import cgp_generic_utils.python
 
 
 __all__ = ['Font', 'Icon',
@@ -15,3 +11,13 @@ __all__ = ['Font', 'Icon',
            'ComboBoxLineEditDialog', 'LineEditDialog', 'StatusDialog', 'TextEditDialog',
            'CollapsibleWidget', 'Tool',
            'ComboBox', 'LineEdit', 'ListWidget', 'PushButton', 'TreeWidget', 'TreeWidgetItem']
+
+
+# register submodules - imported on first access
+cgp_generic_utils.python.lazyModule(__name__, {'_qtGui': ['Font', 'Icon'],
+                                               '_dialog': ['BaseDialog', 'CheckBoxDialog', 'ComboBoxDialog',
+                                                           'ComboBoxLineEditDialog', 'LineEditDialog', 'StatusDialog',
+                                                           'TextEditDialog'],
+                                               '_custom': ['CollapsibleWidget', 'Tool'],
+                                               '_qtWidgets': ['ComboBox', 'LineEdit', 'ListWidget', 'PushButton',
+                                                              'TreeWidget', 'TreeWidgetItem']})
@@ -0,0 +1,49 @@
+"""
+package : cgp_generic_utils
+file : benchmarkImports.py
+
+description: check the import budgets of cgp_generic_utils - the import of each package and the first access of each
+             of its public attributes are measured in fresh interpreters
+
+usage: python scripts/benchmarkImports.py [module ...]
+"""
+
+# imports python
+import os
+import sys
+
+
+# COMMANDS #
+
+
+def main(modules):
+    """check the import budgets of the modules and print the measured times
+
+    :param modules: names of the modules to check - default is the modules of
+                    ``cgp_generic_utils.constants.ImportBudget``
+    :type modules: list[str]
+
+    :return: ``0`` : the budgets are met - ``1`` : a budget is not met
+    :rtype: int
+    """
+
+    # import cgp_generic_utils here so the python directory of the package is used
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'python'))
+    import cgp_generic_utils.python
+
+    # execute
+    try:
+        times = cgp_generic_utils.python.checkImportBudgets(modules=modules or None)
+    except RuntimeError as error:
+        sys.stderr.write('{0}\n'.format(error))
+        return 1
+
+    for name in sorted(times):
+        sys.stdout.write('{0:<60} {1:.4f} s\n'.format(name, times[name]))
+
+    # return
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
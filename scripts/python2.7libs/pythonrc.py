@@ -5,4 +5,4 @@ file : pythonrc.py
 description : cgp_generic_utils startup
 """
 
-print 'cgp_generic_utils - pythonrc.py : loaded '
+print('cgp_generic_utils - pythonrc.py : loaded ')
@@ -5,4 +5,4 @@ file : userSetup.py
 description: cgp_generic_utils userSetup
 """
 
-print 'cgp_generic_utils - userSetup.py : loaded '
+print('cgp_generic_utils - userSetup.py : loaded ')